@@ -0,0 +1,252 @@
+import itertools
+import random
+from datetime import date, timedelta
+from typing import Callable, Dict
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from medical_system.domain.auth.service import AuthService
+from medical_system.domain.auth.token_cache import VerifiedTokenCache
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DEFAULT_SCHEDULE
+from medical_system.domain.value_objects.time_slots import iter_bits, slot_time
+from medical_system.interfaces.api.serialization import FastJSONResponse
+from medical_system.usecases.appointment.create_appointment import CreateAppointmentUseCase
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.appointment.get_availability_calendar import GetAvailabilityCalendarUseCase
+from medical_system.usecases.appointment.get_availability_grid import GetAvailabilityGridUseCase
+from medical_system.usecases.appointment.list_all_appointments import ListAllAppointmentsUseCase
+from medical_system.usecases.dtos.appointment_dto import (
+    AvailabilityCalendarRequestDTO,
+    AvailabilityGridRequestDTO,
+    AppointmentPageDTO,
+    AvailableSlotsRequestDTO,
+    CreateAppointmentDTO
+)
+
+from benchmarks.dataset import Dataset, first_weekday_after
+
+# Cada caso recibe el dataset ya poblado y devuelve la función a cronometrar.
+CASES: Dict[str, Callable[[Dataset], Callable[[], object]]] = {}
+
+SAMPLE_SIZE = 1024
+
+def case(name: str):
+    def register(factory):
+        CASES[name] = factory
+        return factory
+    return register
+
+def _sampler(dataset: Dataset, population):
+    # Recorre una muestra fija de objetivos para no medir siempre la misma
+    # entrada (y con ella la misma línea de caché).
+    rng = random.Random(dataset.seed)
+    return itertools.cycle([rng.choice(population) for _ in range(SAMPLE_SIZE)])
+
+def _doctor_days(dataset: Dataset):
+    rng = random.Random(dataset.seed)
+    return itertools.cycle([
+        (rng.choice(dataset.doctor_ids), dataset.first_day + timedelta(days=rng.randrange(dataset.days)))
+        for _ in range(SAMPLE_SIZE)
+    ])
+
+@case("repo.find_by_doctor_and_date")
+def find_by_doctor_and_date(dataset: Dataset):
+    targets = _doctor_days(dataset)
+    repo = dataset.appointment_repo
+    return lambda: repo.find_by_doctor_and_date(*next(targets))
+
+@case("repo.find_by_patient")
+def find_by_patient(dataset: Dataset):
+    targets = _sampler(dataset, dataset.patient_ids)
+    repo = dataset.appointment_repo
+    return lambda: repo.find_by_patient(next(targets))
+
+@case("repo.get_occupancy_mask")
+def get_occupancy_mask(dataset: Dataset):
+    targets = _doctor_days(dataset)
+    repo = dataset.appointment_repo
+    return lambda: repo.get_occupancy_mask(*next(targets))
+
+@case("repo.find_all.scheduled_next_7_days")
+def find_all_scheduled_week(dataset: Dataset):
+    repo = dataset.appointment_repo
+    start = dataset.first_day
+    end = start + timedelta(days=6)
+    return lambda: repo.find_all(
+        status=AppointmentStatus.SCHEDULED, start_date=start, end_date=end
+    )
+
+@case("repo.find_page.deep")
+def find_page_deep(dataset: Dataset):
+    repo = dataset.appointment_repo
+    middle = dataset.first_day + timedelta(days=dataset.days // 2)
+    after_key = (middle, slot_time(0), 0)
+    return lambda: repo.find_page(after_key, 100)
+
+@case("repo.find_page.by_patient")
+def find_page_by_patient(dataset: Dataset):
+    # Página filtrada (GET /appointments?patient_id=...): no debería
+    # depender del número total de citas.
+    targets = _sampler(dataset, dataset.patient_ids)
+    repo = dataset.appointment_repo
+    return lambda: repo.find_page(None, 20, patient_id=next(targets))
+
+@case("repo.find_page.by_doctor_deep")
+def find_page_by_doctor_deep(dataset: Dataset):
+    targets = _sampler(dataset, dataset.doctor_ids)
+    repo = dataset.appointment_repo
+    middle = dataset.first_day + timedelta(days=dataset.days // 2)
+    after_key = (middle, slot_time(0), 0)
+    return lambda: repo.find_page(after_key, 20, doctor_id=next(targets))
+
+@case("repo.update.patient_history_10k")
+def update_long_history(dataset: Dataset):
+    # Un paciente nuevo con 10.000 citas pasadas (una por día, doctores en
+    # rotación): cada cambio de estado de una cita suya no debería depender
+    # de la longitud de su historial.
+    patient = Patient.restore(
+        None, name="Paciente Historial", email=Email("historial@example.com"), birth_date=date(1970, 1, 1)
+    )
+    dataset.patient_repo.bulk_load([patient])
+    patient = dataset.patient_repo.find_by_email("historial@example.com")
+    doctors = [dataset.doctor_repo.find_by_id(doctor_id) for doctor_id in dataset.doctor_ids]
+    history = [
+        Appointment.restore(
+            None,
+            date=dataset.first_day - timedelta(days=day),
+            time=slot_time(0),
+            status=AppointmentStatus.COMPLETED,
+            patient=patient,
+            doctor=doctors[day % len(doctors)]
+        )
+        for day in range(1, 10_001)
+    ]
+    repo = dataset.appointment_repo
+    repo.bulk_load(history)
+    targets = itertools.cycle([repo.find_by_id(apt.id) for apt in history[::1000]])
+    statuses = itertools.cycle((AppointmentStatus.CANCELLED, AppointmentStatus.COMPLETED))
+
+    def update():
+        appointment = next(targets)
+        appointment.status = next(statuses)
+        return repo.update(appointment)
+    return update
+
+@case("usecase.create_appointment")
+def create_appointment(dataset: Dataset):
+    # Reserva sobre días vacíos posteriores al dataset; cada llamada usa un
+    # hueco y un paciente distintos para que siempre sea una reserva válida.
+    use_case = CreateAppointmentUseCase(
+        dataset.appointment_repo, dataset.patient_repo, dataset.doctor_repo
+    )
+
+    def requests():
+        day = dataset.first_day + timedelta(days=dataset.days)
+        while True:
+            day = first_weekday_after(day)
+            patients = iter(dataset.patient_ids)
+            # Los doctores sintéticos no tienen plantilla: solo se reservan
+            # bloques del horario por defecto.
+            for index in iter_bits(DEFAULT_SCHEDULE.day_mask(day)):
+                for doctor_id in dataset.doctor_ids:
+                    yield CreateAppointmentDTO(
+                        patient_id=next(patients),
+                        doctor_id=doctor_id,
+                        date=day,
+                        time=slot_time(index)
+                    )
+
+    pending = requests()
+    return lambda: use_case.execute(next(pending))
+
+@case("usecase.get_available_slots")
+def get_available_slots(dataset: Dataset):
+    use_case = GetAvailableSlotsUseCase(dataset.appointment_repo, dataset.doctor_repo)
+    weekday = first_weekday_after(dataset.first_day)
+    rng = random.Random(dataset.seed)
+    requests = itertools.cycle([
+        AvailableSlotsRequestDTO(doctor_id=rng.choice(dataset.doctor_ids), date=weekday, duration_minutes=60)
+        for _ in range(SAMPLE_SIZE)
+    ])
+    return lambda: use_case.execute(next(requests))
+
+@case("usecase.get_availability_calendar.4_weeks")
+def get_availability_calendar(dataset: Dataset):
+    use_case = GetAvailabilityCalendarUseCase(dataset.appointment_repo, dataset.doctor_repo)
+    requests = itertools.cycle([
+        AvailabilityCalendarRequestDTO(doctor_id=doctor_id, start_date=dataset.first_day, weeks=4)
+        for doctor_id in itertools.islice(_sampler(dataset, dataset.doctor_ids), SAMPLE_SIZE)
+    ])
+    return lambda: use_case.execute(next(requests))
+
+@case("usecase.get_availability_grid.50_doctors_14_days")
+def get_availability_grid(dataset: Dataset):
+    use_case = GetAvailabilityGridUseCase(dataset.appointment_repo, dataset.doctor_repo)
+    sampler = _sampler(dataset, dataset.doctor_ids)
+    requests = itertools.cycle([
+        AvailabilityGridRequestDTO(
+            doctor_ids=[next(sampler) for _ in range(50)],
+            start_date=dataset.first_day,
+            end_date=dataset.first_day + timedelta(days=13)
+        )
+        for _ in range(16)
+    ])
+    return lambda: use_case.execute(next(requests))
+
+@case("usecase.list_all.scheduled_next_7_days")
+def list_all_scheduled_week(dataset: Dataset):
+    use_case = ListAllAppointmentsUseCase(dataset.appointment_repo)
+    start = dataset.first_day
+    end = start + timedelta(days=6)
+    return lambda: use_case.execute(status="scheduled", start_date=start, end_date=end)
+
+def _appointment_page(dataset: Dataset) -> AppointmentPageDTO:
+    page = dataset.appointment_repo.find_page(None, 100)
+    return AppointmentPageDTO(items=[CreateAppointmentUseCase._to_dto(a) for a in page.items])
+
+def _run_sync(coroutine):
+    # serialize_response no llega a suspenderse con is_coroutine=True: se
+    # ejecuta sin event loop para no medir también su arranque.
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("serialize_response se ha suspendido")
+
+@case("api.serialize.appointment_page_100.response_model")
+def serialize_page_response_model(dataset: Dataset):
+    # Camino por defecto de FastAPI: validar contra el response_model y
+    # codificar con jsonable_encoder antes de generar el JSON.
+    page = _appointment_page(dataset)
+    field = create_model_field(name="response", type_=AppointmentPageDTO, mode="serialization")
+    return lambda: JSONResponse(_run_sync(serialize_response(field=field, response_content=page))).body
+
+@case("api.serialize.appointment_page_100.fast")
+def serialize_page_fast(dataset: Dataset):
+    page = _appointment_page(dataset)
+    return lambda: FastJSONResponse(page).body
+
+def _token(service: AuthService) -> str:
+    return service.create_access_token(
+        {"sub": "bench@example.com", "user_id": 1, "roles": ["patient"], "type": "access"},
+        expires_delta=timedelta(hours=1)
+    )
+
+@case("auth.verify_token.cached")
+def verify_token_cached(dataset: Dataset):
+    service = AuthService(dataset.user_repo, token_cache=VerifiedTokenCache())
+    token = _token(service)
+    service.verify_token(token)
+    return lambda: service.verify_token(token, token_type="access")
+
+@case("auth.verify_token.uncached")
+def verify_token_uncached(dataset: Dataset):
+    service = AuthService(dataset.user_repo, token_cache=VerifiedTokenCache(max_size=0))
+    token = _token(service)
+    return lambda: service.verify_token(token, token_type="access")
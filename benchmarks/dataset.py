@@ -0,0 +1,125 @@
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List, Optional
+
+from medical_system.domain.value_objects.time_slots import SLOTS_PER_DAY
+from medical_system.tools.seed import generate
+
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+SPECIALTY_COUNT = 5
+
+# Bloques ocupados por doctor y día (en media): deja huecos libres para que la
+# búsqueda de horarios y la creación de citas trabajen sobre agendas realistas.
+SLOTS_PER_DOCTOR_DAY = 16
+
+@dataclass
+class Dataset:
+    appointment_repo: object
+    patient_repo: object
+    doctor_repo: object
+    user_repo: object
+    first_day: date
+    days: int
+    doctor_ids: List[int] = field(default_factory=list)
+    patient_ids: List[int] = field(default_factory=list)
+    seed: int = 42
+    backend: str = "memory"
+    size: int = 0
+    database: Optional[object] = None
+    workdir: Optional[str] = None
+
+    def close(self) -> None:
+        if self.database is not None:
+            self.database.close()
+        if self.workdir is not None:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+def _repositories(backend: str):
+    if backend == "memory":
+        from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+        from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+        from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+        from medical_system.infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+
+        return (
+            None,
+            None,
+            InMemoryAppointmentRepository(),
+            InMemoryPatientRepository(),
+            InMemoryDoctorRepository(),
+            InMemoryUserRepository(),
+        )
+
+    if backend == "sqlite":
+        from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+        from medical_system.infrastructure.persistence.sqlite.sqlite_appointment_repository import SqliteAppointmentRepository
+        from medical_system.infrastructure.persistence.sqlite.sqlite_patient_repository import SqlitePatientRepository
+        from medical_system.infrastructure.persistence.sqlite.sqlite_doctor_repository import SqliteDoctorRepository
+        from medical_system.infrastructure.persistence.sqlite.sqlite_user_repository import SqliteUserRepository
+
+        workdir = tempfile.mkdtemp(prefix="medical-bench-")
+        database = SqliteDatabase(f"{workdir}/bench.db")
+        return (
+            workdir,
+            database,
+            SqliteAppointmentRepository(database),
+            SqlitePatientRepository(database),
+            SqliteDoctorRepository(database),
+            SqliteUserRepository(database),
+        )
+
+    raise ValueError(f"Backend no soportado: {backend}")
+
+def first_weekday_after(day: date) -> date:
+    day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+def generate_snapshot(size: int, seed: int = 42):
+    # `size` citas futuras del generador de semillas. La semilla fija hace
+    # que dos ejecuciones midan exactamente los mismos datos.
+    doctor_count = max(10, size // 1000)
+    return generate(
+        doctors=doctor_count,
+        specialties=SPECIALTY_COUNT,
+        patients=max(doctor_count * SLOTS_PER_DAY, size // 10),
+        appointments=size,
+        seed=seed,
+        start=first_weekday_after(date.today()),
+        occupancy=SLOTS_PER_DOCTOR_DAY / SLOTS_PER_DAY
+    )
+
+def build_dataset(size: int, seed: int = 42, backend: str = "memory") -> Dataset:
+    # Carga el snapshot sintético por la vía masiva del backend elegido.
+    workdir, database, appointment_repo, patient_repo, doctor_repo, user_repo = _repositories(backend)
+
+    snapshot = generate_snapshot(size, seed)
+    doctor_repo.bulk_load(snapshot.doctors)
+    patient_repo.bulk_load(snapshot.patients)
+    appointment_repo.bulk_load(snapshot.appointments)
+
+    first_day = snapshot.appointments[0].date
+    last_day = snapshot.appointments[-1].date
+    return Dataset(
+        appointment_repo=appointment_repo,
+        patient_repo=patient_repo,
+        doctor_repo=doctor_repo,
+        user_repo=user_repo,
+        first_day=first_day,
+        days=(last_day - first_day).days + 1,
+        doctor_ids=[doctor.id for doctor in snapshot.doctors],
+        patient_ids=[patient.id for patient in snapshot.patients],
+        seed=seed,
+        backend=backend,
+        size=size,
+        database=database,
+        workdir=workdir,
+    )
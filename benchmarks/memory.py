@@ -0,0 +1,85 @@
+import tracemalloc
+from datetime import date, time
+from typing import Callable, Dict
+
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.infrastructure.persistence.in_memory.array_appointment_store import ArrayAppointmentStore
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+
+from benchmarks.dataset import generate_snapshot
+
+# Memoria por entidad medida con tracemalloc. Los valores de los campos se
+# comparten entre todas las instancias, así que el resultado es lo que ocupa
+# la propia entidad (cabecera del objeto y referencias a sus campos).
+
+ENTITY_COUNT = 20000
+
+def bytes_per_object(factory: Callable[[int], object], count: int = ENTITY_COUNT) -> float:
+    objects = [None] * count
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for index in range(count):
+            objects[index] = factory(index)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+def _entity_factories() -> Dict[str, Callable[[int], object]]:
+    email = Email("juan@example.com")
+    birth_date = date(1990, 1, 1)
+    patient = Patient.restore(1, name="Juan Pérez", email=email, birth_date=birth_date)
+    doctor = Doctor.restore(1, name="Dr. Carlos García", email=email, specialty="Cardiología")
+    day = date(2030, 1, 7)
+    at = time(10, 0)
+    scheduled = AppointmentStatus.SCHEDULED
+    return {
+        "memory.entity.appointment": lambda index: Appointment.restore(
+            index, date=day, time=at, status=scheduled, patient=patient, doctor=doctor
+        ),
+        "memory.entity.patient": lambda index: Patient.restore(
+            index, name="Juan Pérez", email=email, birth_date=birth_date
+        ),
+        "memory.entity.doctor": lambda index: Doctor.restore(
+            index, name="Dr. Carlos García", email=email, specialty="Cardiología"
+        ),
+    }
+
+def repository_bytes_per_appointment(size: int, seed: int = 42) -> float:
+    # Índices del repositorio en memoria tras la carga masiva; las entidades
+    # se crean antes de empezar a medir.
+    snapshot = generate_snapshot(size, seed)
+    repo = InMemoryAppointmentRepository()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        repo.bulk_load(snapshot.appointments)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / size
+
+def array_store_bytes_per_appointment(size: int, seed: int = 42) -> float:
+    # Arrays del almacén columnar tras la carga masiva: aquí no se conserva
+    # ninguna entidad, la medida incluye todo lo que ocupa cada cita.
+    snapshot = generate_snapshot(size, seed)
+    store = ArrayAppointmentStore(None, None)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        store.bulk_load(snapshot.appointments)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / size
+
+def measure_memory(size: int, seed: int = 42) -> Dict[str, float]:
+    results = {name: bytes_per_object(factory) for name, factory in _entity_factories().items()}
+    results["memory.appointment_repo.indexes"] = repository_bytes_per_appointment(size, seed)
+    results["memory.appointment_store.array"] = array_store_bytes_per_appointment(size, seed)
+    return results
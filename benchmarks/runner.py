@@ -0,0 +1,137 @@
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.cases import CASES
+from benchmarks.dataset import SCALES, build_dataset
+from benchmarks.memory import measure_memory
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+def _time(fn: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - start
+
+def measure(fn: Callable[[], object], repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> Dict[str, float]:
+    # Igual que timeit.autorange: duplica las iteraciones hasta que una
+    # ronda dure al menos `min_time` y luego repite esa ronda `repeat` veces.
+    number = 1
+    while True:
+        elapsed = _time(fn, number)
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    samples.extend(_time(fn, number) / number for _ in range(repeat - 1))
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+def run(scale: str, backend: str, seed: int, patterns: List[str], repeat: int, min_time: float) -> dict:
+    started = time.perf_counter()
+    dataset = build_dataset(SCALES[scale], seed=seed, backend=backend)
+    load_seconds = time.perf_counter() - started
+
+    results = {}
+    try:
+        for name, factory in CASES.items():
+            if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                continue
+            results[name] = measure(factory(dataset), repeat=repeat, min_time=min_time)
+            print(f"{name:45s} {_format(results[name]['min'])}", file=sys.stderr)
+    finally:
+        dataset.close()
+
+    return {
+        "meta": {
+            "scale": scale,
+            "size": SCALES[scale],
+            "backend": backend,
+            "seed": seed,
+            "load_seconds": load_seconds,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    # Compara el mejor tiempo de cada caso (el menos sensible al ruido del
+    # sistema); es regresión si empeora más que `threshold`.
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            print(f"{name:45s} {_format(result['min'])}  (sin referencia)")
+            continue
+        ratio = result["min"] / reference["min"] if reference["min"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESIÓN"
+            regressions.append(name)
+        print(
+            f"{name:45s} {_format(reference['min'])} -> {_format(result['min'])}"
+            f"  x{ratio:.2f}{flag}"
+        )
+    return regressions
+
+def _format(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e3), ("µs", 1e6)):
+        if seconds * factor >= 1:
+            return f"{seconds * factor:9.2f} {unit}"
+    return f"{seconds * 1e9:9.2f} ns"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Micro-benchmarks de repositorios, casos de uso y autenticación."
+    )
+    parser.add_argument("--scale", choices=sorted(SCALES), default="10k", help="Número de citas sintéticas")
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="Duración mínima de cada ronda (s)")
+    parser.add_argument("-k", "--filter", action="append", default=[], help="Patrón glob de casos a ejecutar")
+    parser.add_argument("-o", "--output", default="benchmark-results.json", help="Fichero JSON de resultados")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON de referencia con el que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Empeoramiento tolerado (0.10 = 10%%)")
+    parser.add_argument("--memory", action="store_true", help="Mide también los bytes por entidad e índice")
+    parser.add_argument("--list", action="store_true", help="Lista los casos disponibles y termina")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    report = run(args.scale, args.backend, args.seed, args.filter, args.repeat, args.min_time)
+    if args.memory:
+        report["memory"] = measure_memory(SCALES[args.scale], args.seed)
+        for name, value in report["memory"].items():
+            print(f"{name:45s} {value:9.1f} bytes", file=sys.stderr)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if baseline.get("meta", {}).get("scale") != args.scale or baseline.get("meta", {}).get("backend") != args.backend:
+            print("Aviso: la referencia usa otra escala o backend", file=sys.stderr)
+        if compare(report, baseline, args.threshold):
+            return 1
+    return 0
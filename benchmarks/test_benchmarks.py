@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.cases import CASES
+from benchmarks.dataset import SCALES, build_dataset
+
+# Ejecución con pytest-benchmark:
+#   BENCHMARK_SCALE=100k pytest benchmarks --no-cov --benchmark-json=resultados.json
+
+@pytest.fixture(scope="module", params=["memory", "sqlite"])
+def dataset(request):
+    dataset = build_dataset(SCALES[os.getenv("BENCHMARK_SCALE", "10k")], backend=request.param)
+    yield dataset
+    dataset.close()
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_benchmark(benchmark, dataset, name):
+    benchmark(CASES[name](dataset))
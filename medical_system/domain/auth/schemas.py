@@ -13,6 +13,8 @@ class TokenData(BaseModel):
     email: Optional[str] = None
     user_id: Optional[int] = None
     roles: List[str] = []
+    token_type: Optional[str] = None
+    expires_at: Optional[float] = None
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -76,6 +78,10 @@ class UserResponse(UserInDB):
         
         return cls(**user_dict)
 
+class UserPage(BaseModel):
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 from jose import JWTError, jwt
 
@@ -6,53 +6,76 @@ from medical_system.domain.entities.user import User
 from medical_system.domain.ports.repositories.user_repository import UserRepository
 from medical_system.domain.auth.config import (
     verify_password,
+    verify_password_async,
     get_password_hash,
+    get_password_hash_async,
     get_token_expires_delta,
     get_refresh_token_expires_delta,
     UserRole,
     SECRET_KEY,
-    ALGORITHM
+    ALGORITHM,
+    TOKEN_CACHE_SIZE
 )
 from medical_system.domain.auth.schemas import Token, TokenData, UserCreate
+from medical_system.domain.auth.token_cache import VerifiedTokenCache
 from medical_system.domain.exceptions import (
     UnauthorizedError,
     BadRequestError,
     NotFoundError
 )
 
+_token_cache = VerifiedTokenCache(TOKEN_CACHE_SIZE)
+
 class AuthService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, token_cache: Optional[VerifiedTokenCache] = None):
         self.user_repository = user_repository
+        self.token_cache = token_cache if token_cache is not None else _token_cache
 
     def authenticate_user(self, email: str, password: str) -> User:
         try:
-            user = self.user_repository.find_by_email(email.lower())
-            if not user:
-                raise UnauthorizedError("Credenciales inválidas")
-            if not hasattr(user, 'password_hash') or not user.password_hash:
-                raise UnauthorizedError("Credenciales inválidas")
-                
+            user = self._find_login_candidate(email)
             password_valid = verify_password(password, user.password_hash)
- 
-            if not password_valid:
-                raise UnauthorizedError("Credenciales inválidas")
-                
-            if not getattr(user, 'is_active', True):
-                raise UnauthorizedError("Usuario inactivo")
-            return user
+            return self._check_login(user, password_valid)
             
         except UnauthorizedError:
             raise
         except Exception as e:
             raise UnauthorizedError("Error durante la autenticación")
 
+    async def authenticate_user_async(self, email: str, password: str) -> User:
+        try:
+            user = self._find_login_candidate(email)
+            password_valid = await verify_password_async(password, user.password_hash)
+            return self._check_login(user, password_valid)
+
+        except UnauthorizedError:
+            raise
+        except Exception as e:
+            raise UnauthorizedError("Error durante la autenticación")
+
+    def _find_login_candidate(self, email: str) -> User:
+        user = self.user_repository.find_by_email(email.lower())
+        if not user:
+            raise UnauthorizedError("Credenciales inválidas")
+        if not hasattr(user, 'password_hash') or not user.password_hash:
+            raise UnauthorizedError("Credenciales inválidas")
+        return user
+
+    def _check_login(self, user: User, password_valid: bool) -> User:
+        if not password_valid:
+            raise UnauthorizedError("Credenciales inválidas")
+            
+        if not getattr(user, 'is_active', True):
+            raise UnauthorizedError("Usuario inactivo")
+        return user
+
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         try:
             to_encode = data.copy()
             
             delta = expires_delta if expires_delta is not None else get_token_expires_delta()
             
-            expire = datetime.now(datetime.timezone.utc) + delta
+            expire = datetime.now(timezone.utc) + delta
         
             to_encode.update({"exp": expire})
 
@@ -128,13 +151,22 @@ class AuthService:
             raise UnauthorizedError("Error al generar los tokens") from e
     
     def verify_token(self, token: str, token_type: Optional[str] = None) -> TokenData:
+        token_data = self.token_cache.get(token)
+        if token_data is None:
+            token_data = self._decode_token(token)
+            self.token_cache.put(token, token_data)
+
+        if token_type is not None:
+            if token_data.token_type != token_type:
+                raise UnauthorizedError(f"Tipo de token inválido. Se esperaba: {token_type}")
+
+        return token_data
+
+    def _decode_token(self, token: str) -> TokenData:
         credentials_exception = UnauthorizedError("Token inválido o expirado")
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-
-            if token_type is not None:
-                if payload.get("type") != token_type:
-                    raise UnauthorizedError(f"Tipo de token inválido. Se esperaba: {token_type}")
+            # Sin `exp` el token no caducaría nunca (ni en la caché).
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"require_exp": True})
 
             email: str = payload.get("sub")
             if not email:
@@ -146,7 +178,13 @@ class AuthService:
                 
             roles: List[str] = payload.get("roles", [])
             
-            return TokenData(email=email, user_id=user_id, roles=roles)
+            return TokenData(
+                email=email,
+                user_id=user_id,
+                roles=roles,
+                token_type=payload.get("type"),
+                expires_at=payload.get("exp")
+            )
             
         except JWTError as e:
             raise UnauthorizedError(f"Error de autenticación: {str(e)}")
@@ -170,8 +208,17 @@ class AuthService:
         if self.user_repository.find_by_email(user_data.email):
             raise BadRequestError("El correo electrónico ya está registrado")
         
+        return self._save_new_user(user_data, get_password_hash(user_data.password))
+
+    async def create_user_async(self, user_data: UserCreate) -> User:
+        if self.user_repository.find_by_email(user_data.email):
+            raise BadRequestError("El correo electrónico ya está registrado")
+
+        return self._save_new_user(user_data, await get_password_hash_async(user_data.password))
+
+    def _save_new_user(self, user_data: UserCreate, password_hash: str) -> User:
         user_dict = user_data.dict(exclude={"password", "password_confirm"})
-        user_dict["password_hash"] = get_password_hash(user_data.password)
+        user_dict["password_hash"] = password_hash
 
         if "metadata" not in user_dict:
             user_dict["metadata"] = {}
@@ -0,0 +1,51 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from medical_system.domain.auth.schemas import TokenData
+
+class VerifiedTokenCache:
+    # LRU acotado de tokens ya verificados. La clave es el SHA-256 del token
+    # (nunca el token en claro) y cada entrada caduca con el `exp` del JWT,
+    # así que un acierto evita la verificación HMAC y el parseo JSON.
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, TokenData]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[TokenData]:
+        key = self._key(token)
+        with self._lock:
+            token_data = self._entries.get(key)
+            if token_data is None:
+                return None
+            if token_data.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return token_data
+
+    def put(self, token: str, token_data: TokenData) -> None:
+        # Solo tokens con caducidad: una entrada sin `exp` no saldría nunca
+        # de la caché salvo por desalojo.
+        if self.max_size <= 0 or token_data.expires_at is None:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = token_data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,29 +4,35 @@ from medical_system.domain.entities.base_entity import BaseEntity
 from medical_system.domain.entities.doctor import Doctor
 from medical_system.domain.entities.patient import Patient
 from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import SLOT_MINUTES, span_mask
 
-@dataclass
+@dataclass(slots=True)
 class Appointment(BaseEntity):
     date: date
     time: time
     status: AppointmentStatus
     patient: Patient
     doctor: Doctor
+    duration_minutes: int = SLOT_MINUTES
+    # Lo incrementa el repositorio en cada cambio de fecha u hora (move).
+    version: int = 1
 
     def __post_init__(self):
-        super().__post_init__()
+        BaseEntity.__post_init__(self)
         self._validate()
 
     def _validate(self):
         appointment_datetime = datetime.combine(self.date, self.time)
         if appointment_datetime <= datetime.now():
             raise ValueError("La cita debe ser en el futuro")
-        
-        if not (time(8, 0) <= self.time < time(20, 0)):
-            raise ValueError("La cita debe estar entre las 8:00 y las 20:00 horas")
-        
-        if self.time.minute % 30 != 0:
-            raise ValueError("La hora de la cita debe ser en intervalos de 30 minutos")
+
+        if self.duration_minutes <= 0 or self.duration_minutes % SLOT_MINUTES:
+            raise ValueError(f"La duración de la cita debe ser un múltiplo de {SLOT_MINUTES} minutos")
+        span_mask(self.time, self.duration_minutes)
+
+    @property
+    def slot_mask(self) -> int:
+        return span_mask(self.time, self.duration_minutes)
 
     def cancel(self):
         if self.status == AppointmentStatus.CANCELLED:
@@ -1,19 +1,50 @@
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Dict, Optional, Tuple
 
-@dataclass
+# Las entidades usan __slots__: sin __dict__ por instancia ocupan bastante
+# menos memoria, que con millones de citas cargadas es lo que domina. Como
+# dataclass(slots=True) crea una clase nueva, el super() sin argumentos no
+# funciona en sus métodos y las subclases llaman a BaseEntity explícitamente.
+
+@dataclass(slots=True)
 class BaseEntity:
 
     def __post_init__(self):
         if not hasattr(self, 'id'):
             self.id = None
-    
+
     id: Optional[int] = field(default=None, init=False)
-    
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
             return False
         return self.id is not None and self.id == other.id
-    
+
     def __hash__(self) -> int:
         return hash((self.__class__, self.id))
+
+    @classmethod
+    def restore(cls, id: Optional[int], **fields: Any):
+        # Rehidrata una entidad ya persistida sin volver a ejecutar _validate
+        # (p. ej. citas pasadas que ya no cumplen "debe ser en el futuro").
+        # Los campos que no llegan toman su valor por defecto.
+        entity = cls.__new__(cls)
+        for name, value in _defaults(cls):
+            if name not in fields:
+                setattr(entity, name, value)
+        for name, value in fields.items():
+            setattr(entity, name, value)
+        entity.id = id
+        return entity
+
+
+_restore_defaults: Dict[type, Tuple[Tuple[str, Any], ...]] = {}
+
+def _defaults(cls) -> Tuple[Tuple[str, Any], ...]:
+    defaults = _restore_defaults.get(cls)
+    if defaults is None:
+        defaults = _restore_defaults[cls] = tuple(
+            (f.name, f.default) for f in fields(cls)
+            if f.init and f.default is not MISSING
+        )
+    return defaults
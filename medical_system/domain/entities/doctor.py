@@ -1,15 +1,20 @@
 from dataclasses import dataclass
+from datetime import date, time
+from typing import Optional
 from medical_system.domain.entities.base_entity import BaseEntity
 from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.schedule_template import DEFAULT_SCHEDULE, ScheduleTemplate
+from medical_system.domain.value_objects.time_slots import SLOT_MINUTES, span_mask
 
-@dataclass
+@dataclass(slots=True)
 class Doctor(BaseEntity):
     name: str
     email: Email
     specialty: str
+    schedule: Optional[ScheduleTemplate] = None
 
     def __post_init__(self):
-        super().__post_init__()
+        BaseEntity.__post_init__(self)
         self._validate()
 
     def _validate(self):
@@ -18,3 +23,14 @@ class Doctor(BaseEntity):
         
         if not self.specialty or len(self.specialty.strip()) < 2:
             raise ValueError("Specialty must be at least 2 characters long")
+
+    @property
+    def schedule_template(self) -> ScheduleTemplate:
+        return self.schedule or DEFAULT_SCHEDULE
+
+    def accepts(self, day: date, at: time, duration_minutes: int = SLOT_MINUTES) -> bool:
+        # La cita entera debe caer en bloques en los que el doctor atiende ese
+        # día. Se usa la misma plantilla que la búsqueda de huecos (la propia o
+        # DEFAULT_SCHEDULE), así no se reserva nada que la API no ofrezca.
+        span = span_mask(at, duration_minutes)
+        return self.schedule_template.day_mask(day) & span == span
@@ -3,14 +3,14 @@ from datetime import date
 from medical_system.domain.entities.base_entity import BaseEntity
 from medical_system.domain.value_objects.email import Email
 
-@dataclass
+@dataclass(slots=True)
 class Patient(BaseEntity):
     name: str
     email: Email
     birth_date: date
 
     def __post_init__(self):
-        super().__post_init__()
+        BaseEntity.__post_init__(self)
         self._validate()
 
     def _validate(self):
@@ -1,5 +1,7 @@
 from .user_repository import UserRepository
+from .async_user_repository import AsyncUserRepository
 
 __all__ = [
     'UserRepository',
+    'AsyncUserRepository',
 ]
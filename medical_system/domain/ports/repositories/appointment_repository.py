@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime, time
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.page import Page
 
 class AppointmentRepository(ABC):
     @abstractmethod
@@ -13,6 +14,30 @@ class AppointmentRepository(ABC):
     def save(self, appointment: Appointment) -> Appointment:
         raise NotImplementedError
 
+    @abstractmethod
+    def reserve_slot(self, appointment: Appointment) -> Appointment:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        # Varias reservas con una sola toma de cerrojos (o una transacción):
+        # cada cita se comprueba como en reserve_slot, contando las anteriores
+        # del lote. Por cada una devuelve la cita guardada o el motivo del
+        # rechazo.
+        raise NotImplementedError
+
+    @abstractmethod
+    def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        # Cambia fecha y hora de una cita existente de forma atómica: comprueba
+        # el nuevo hueco (sin contar los bloques de la propia cita), la mueve en
+        # los índices e incrementa su versión. ValueError si no existe o el
+        # hueco no está libre.
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_doctor_and_date(
         self, doctor_id: int, date: date
@@ -35,6 +60,22 @@ class AppointmentRepository(ABC):
     ) -> List[datetime]:
         raise NotImplementedError
         
+    @abstractmethod
+    def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_occupancy_masks(
+        self, doctor_id: int, start_date: date, end_date: date
+    ) -> Dict[date, int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_doctor_patient_datetime(
         self, doctor_id: int, patient_id: int, date: date, time: time
@@ -51,6 +92,16 @@ class AppointmentRepository(ABC):
     def find_all(self) -> List[Appointment]:
         raise NotImplementedError
         
+    @abstractmethod
+    def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        raise NotImplementedError
+        
+    @abstractmethod
+    def iter_all(self) -> Iterator[Appointment]:
+        raise NotImplementedError
+        
     @abstractmethod
     def delete(self, appointment_id: int) -> None:
         raise NotImplementedError
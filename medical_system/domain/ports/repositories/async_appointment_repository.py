@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.page import Page
+
+class AsyncAppointmentRepository(ABC):
+    # Variante asíncrona de AppointmentRepository para los manejadores
+    # `async def`: mientras una consulta espera E/S el event loop atiende otras.
+    @abstractmethod
+    async def find_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, appointment: Appointment) -> Appointment:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reserve_slot(self, appointment: Appointment) -> Appointment:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_doctor_and_date(
+        self, doctor_id: int, date: date
+    ) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_patient(self, patient_id: int) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_patient_and_date(
+        self, patient_id: int, date: date
+    ) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_available_slots(
+        self, doctor_id: int, date: date
+    ) -> List[datetime]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_occupancy_masks(
+        self, doctor_id: int, start_date: date, end_date: date
+    ) -> Dict[date, int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_doctor_patient_datetime(
+        self, doctor_id: int, patient_id: int, date: date, time: time
+    ) -> Optional[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_patient_appointments_at_same_time(
+        self, patient_id: int, date: date, time: time
+    ) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_all(self, **filters) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, appointment_id: int) -> None:
+        raise NotImplementedError
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.page import Page
+
+class AsyncDoctorRepository(ABC):
+    @abstractmethod
+    async def find_by_id(self, doctor_id: int) -> Optional[Doctor]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_specialty(self, specialty: str) -> List[Doctor]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Doctor]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, doctor: Doctor) -> Doctor:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, doctor: Doctor) -> Doctor:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_all(self) -> List[Doctor]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(
+        self, after_key: Optional[int], limit: int, specialty: Optional[str] = None
+    ) -> Page[Doctor]:
+        raise NotImplementedError
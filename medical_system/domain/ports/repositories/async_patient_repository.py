@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.page import Page
+
+class AsyncPatientRepository(ABC):
+    @abstractmethod
+    async def find_by_id(self, patient_id: int) -> Optional[Patient]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, patient: Patient) -> Patient:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, patient: Patient) -> Patient:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Patient]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_all(self) -> List[Patient]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(self, after_key: Optional[int], limit: int) -> Page[Patient]:
+        raise NotImplementedError
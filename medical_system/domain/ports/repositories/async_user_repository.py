@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from datetime import datetime
+from medical_system.domain.entities.user import User
+from medical_system.domain.value_objects.page import Page
+
+class AsyncUserRepository(ABC):
+
+    @abstractmethod
+    async def find_by_id(self, user_id: int) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def save(self, user: User) -> User:
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    async def list_all(
+        self,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        **filters
+    ) -> List[User]:
+        pass
+
+    @abstractmethod
+    async def update_last_login(self, user_id: int, login_time: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    async def exists_with_email(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
+        pass
+
+    @abstractmethod
+    async def find_page(self, after_key: Optional[int], limit: int, **filters) -> Page[User]:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.page import Page
 
 class DoctorRepository(ABC):
     @abstractmethod
@@ -26,3 +27,9 @@ class DoctorRepository(ABC):
     @abstractmethod
     def find_all(self) -> List[Doctor]:
         raise NotImplementedError
+
+    @abstractmethod
+    def find_page(
+        self, after_key: Optional[int], limit: int, specialty: Optional[str] = None
+    ) -> Page[Doctor]:
+        raise NotImplementedError
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.page import Page
 
 class PatientRepository(ABC):
     @abstractmethod
@@ -22,3 +23,7 @@ class PatientRepository(ABC):
     @abstractmethod
     def find_all(self) -> List[Patient]:
         raise NotImplementedError
+
+    @abstractmethod
+    def find_page(self, after_key: Optional[int], limit: int) -> Page[Patient]:
+        raise NotImplementedError
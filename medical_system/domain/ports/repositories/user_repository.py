@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from datetime import datetime
 from medical_system.domain.entities.user import User
+from medical_system.domain.value_objects.page import Page
 
 class UserRepository(ABC):
 
@@ -37,3 +38,7 @@ class UserRepository(ABC):
     @abstractmethod
     def exists_with_email(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
         pass
+    
+    @abstractmethod
+    def find_page(self, after_key: Optional[int], limit: int, **filters) -> Page[User]:
+        pass
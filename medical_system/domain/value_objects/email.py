@@ -16,5 +16,13 @@ class Email:
         if not re.match(pattern, self.value):
             raise ValueError("Invalid email format")
 
+    @classmethod
+    def restore(cls, value: str) -> 'Email':
+        # Email ya validado al guardarse (snapshots): sin volver a pasar la
+        # expresión regular, como BaseEntity.restore con las entidades.
+        email = object.__new__(cls)
+        object.__setattr__(email, 'value', value)
+        return email
+
     def __str__(self) -> str:
         return self.value
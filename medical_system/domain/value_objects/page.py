@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: List[T]
+    # Clave del último elemento devuelto, o None si no hay más páginas.
+    next_key: Optional[Any] = None
+
+    @classmethod
+    def from_overfetch(cls, items: List[T], limit: int, key) -> "Page[T]":
+        # Los repositorios piden limit + 1 filas: si llega la fila extra hay
+        # una página siguiente y su clave es la del último elemento devuelto.
+        if len(items) > limit:
+            items = items[:limit]
+            return cls(items=items, next_key=key(items[-1]))
+        return cls(items=items)
@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from datetime import date, time
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from medical_system.domain.value_objects.time_slots import range_mask, slot_bit
+
+# Plantilla horaria de un doctor: jornada por día de la semana con sus
+# pausas, excepciones para fechas concretas y festivos. Es inmutable: se
+# compila una vez en una máscara de bloques por día y cambiar el horario
+# significa sustituir la plantilla, lo que descarta también lo compilado.
+
+@dataclass(frozen=True)
+class DaySchedule:
+    start: time
+    end: time
+    breaks: Tuple[Tuple[time, time], ...] = ()
+
+    def __post_init__(self):
+        if self.start >= self.end:
+            raise ValueError("La hora de inicio debe ser anterior a la de fin")
+        for break_start, break_end in self.breaks:
+            if break_start >= break_end:
+                raise ValueError("Cada pausa debe empezar antes de terminar")
+
+    @cached_property
+    def mask(self) -> int:
+        busy = 0
+        for break_start, break_end in self.breaks:
+            busy |= range_mask(break_start, break_end)
+        return range_mask(self.start, self.end) & ~busy
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "breaks": [[s.isoformat(), e.isoformat()] for s, e in self.breaks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DaySchedule":
+        return cls(
+            start=_parse_time(data["start"]),
+            end=_parse_time(data["end"]),
+            breaks=tuple((_parse_time(s), _parse_time(e)) for s, e in data.get("breaks", ())),
+        )
+
+
+@dataclass(frozen=True)
+class ScheduleTemplate:
+    # `weekly` tiene un elemento por día (lunes = 0); None es día libre. En
+    # `exceptions` una fecha con None tampoco tiene consulta.
+    weekly: Tuple[Optional[DaySchedule], ...]
+    exceptions: Tuple[Tuple[date, Optional[DaySchedule]], ...] = ()
+    holidays: FrozenSet[date] = field(default_factory=frozenset)
+
+    def __post_init__(self):
+        if len(self.weekly) != 7:
+            raise ValueError("La plantilla semanal debe tener 7 días")
+
+    @cached_property
+    def _weekly_masks(self) -> Tuple[int, ...]:
+        return tuple(day.mask if day else 0 for day in self.weekly)
+
+    @cached_property
+    def _exception_masks(self) -> Dict[date, int]:
+        masks = {day: (schedule.mask if schedule else 0) for day, schedule in self.exceptions}
+        masks.update((day, 0) for day in self.holidays)
+        return masks
+
+    def day_mask(self, day: date) -> int:
+        # Bloques en los que el doctor atiende ese día.
+        mask = self._exception_masks.get(day)
+        if mask is None:
+            mask = self._weekly_masks[day.weekday()]
+        return mask
+
+    def is_open(self, day: date, at: time) -> bool:
+        return bool(self.day_mask(day) & slot_bit(at))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "weekly": [day.to_dict() if day else None for day in self.weekly],
+            "exceptions": {
+                day.isoformat(): (schedule.to_dict() if schedule else None)
+                for day, schedule in sorted(self.exceptions)
+            },
+            "holidays": sorted(day.isoformat() for day in self.holidays),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScheduleTemplate":
+        return cls(
+            weekly=tuple(DaySchedule.from_dict(day) if day else None for day in data["weekly"]),
+            exceptions=tuple(
+                (date.fromisoformat(day), DaySchedule.from_dict(schedule) if schedule else None)
+                for day, schedule in (data.get("exceptions") or {}).items()
+            ),
+            holidays=frozenset(date.fromisoformat(day) for day in data.get("holidays", ())),
+        )
+
+
+def _parse_time(value) -> time:
+    return value if isinstance(value, time) else time.fromisoformat(value)
+
+
+# Horario de consulta de los doctores sin plantilla propia: de lunes a jueves
+# de 9:00 a 18:00 con pausa de 13:00 a 14:00 y los viernes de 9:00 a 14:00 con
+# pausa de 12:30 a 13:30.
+DEFAULT_SCHEDULE = ScheduleTemplate(
+    weekly=(
+        DaySchedule(time(9, 0), time(18, 0), ((time(13, 0), time(14, 0)),)),
+    ) * 4 + (
+        DaySchedule(time(9, 0), time(14, 0), ((time(12, 30), time(13, 30)),)),
+        None,
+        None,
+    )
+)
@@ -0,0 +1,70 @@
+from datetime import time
+from functools import lru_cache
+from typing import Iterator
+
+# Jornada reservable: de 8:00 a 20:00 en bloques de 30 minutos. Cada bloque
+# es un bit de un entero, así que un día completo cabe en 24 bits.
+DAY_START = time(8, 0)
+DAY_END = time(20, 0)
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 24
+FULL_DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+
+
+def slot_index(value: time) -> int:
+    if not (DAY_START <= value < DAY_END):
+        raise ValueError("La cita debe estar entre las 8:00 y las 20:00 horas")
+    if value.minute % SLOT_MINUTES != 0:
+        raise ValueError("La hora de la cita debe ser en intervalos de 30 minutos")
+    return ((value.hour - DAY_START.hour) * 60 + value.minute) // SLOT_MINUTES
+
+
+def slot_time(index: int) -> time:
+    minutes = DAY_START.hour * 60 + index * SLOT_MINUTES
+    return time(minutes // 60, minutes % 60)
+
+
+def slot_bit(value: time) -> int:
+    return 1 << slot_index(value)
+
+
+@lru_cache(maxsize=1024)
+def range_mask(start: time, end: time) -> int:
+    # Bloques cuyo inicio cae en [start, end); los límites se ajustan a la jornada.
+    start_minutes = max(start.hour * 60 + start.minute, DAY_START.hour * 60)
+    end_minutes = min(end.hour * 60 + end.minute, DAY_END.hour * 60)
+    if end_minutes <= start_minutes:
+        return 0
+    first = -(-(start_minutes - DAY_START.hour * 60) // SLOT_MINUTES)
+    last = -(-(end_minutes - DAY_START.hour * 60) // SLOT_MINUTES)
+    return ((1 << last) - 1) & ~((1 << first) - 1)
+
+
+def slots_needed(duration_minutes: int) -> int:
+    return max(1, -(-duration_minutes // SLOT_MINUTES))
+
+
+@lru_cache(maxsize=1024)
+def span_mask(start: time, duration_minutes: int) -> int:
+    # Bloques que ocupa una cita de `duration_minutes` que empieza en `start`.
+    # Dos citas se solapan si y solo si sus máscaras comparten algún bit.
+    index = slot_index(start)
+    length = slots_needed(duration_minutes)
+    if index + length > SLOTS_PER_DAY:
+        raise ValueError("La cita debe terminar como muy tarde a las 20:00 horas")
+    return ((1 << length) - 1) << index
+
+
+def run_starts(free_mask: int, length: int) -> int:
+    # Bits donde empieza una racha de `length` bloques libres consecutivos.
+    runs = free_mask
+    for offset in range(1, length):
+        runs &= free_mask >> offset
+    return runs
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -1,12 +1,83 @@
-from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
-from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
-from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
-from medical_system.infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+import os
+from dotenv import load_dotenv
 
-appointment_repo = InMemoryAppointmentRepository()
-patient_repo = InMemoryPatientRepository()
-doctor_repo = InMemoryDoctorRepository()
-user_repo = InMemoryUserRepository()
+load_dotenv()
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "memory").lower()
+SQLITE_DATABASE = os.getenv("SQLITE_DATABASE", "medical_system.db")
+SEED_SNAPSHOT = os.getenv("SEED_SNAPSHOT")
+JOURNAL_DIR = os.getenv("JOURNAL_DIR")
+JOURNAL_FSYNC_INTERVAL = float(os.getenv("JOURNAL_FSYNC_INTERVAL", "0.01"))
+JOURNAL_SNAPSHOT_EVERY = int(os.getenv("JOURNAL_SNAPSHOT_EVERY", "100000"))
+STORE_SOCKET = os.getenv("STORE_SOCKET", "medical_system.sock")
+STORE_AUTHKEY = os.getenv("STORE_AUTHKEY")
+
+def _build_repositories():
+    if STORAGE_BACKEND == "sqlite":
+        from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+        from medical_system.infrastructure.persistence.sqlite.sqlite_appointment_repository import SqliteAppointmentRepository
+        from medical_system.infrastructure.persistence.sqlite.sqlite_patient_repository import SqlitePatientRepository
+        from medical_system.infrastructure.persistence.sqlite.sqlite_doctor_repository import SqliteDoctorRepository
+        from medical_system.infrastructure.persistence.sqlite.sqlite_user_repository import SqliteUserRepository
+
+        database = SqliteDatabase(SQLITE_DATABASE)
+        return (
+            SqliteAppointmentRepository(database),
+            SqlitePatientRepository(database),
+            SqliteDoctorRepository(database),
+            SqliteUserRepository(database),
+        )
+
+    if STORAGE_BACKEND == "shared":
+        # Todos los workers usan los repositorios del proceso del almacén
+        # (python -m medical_system.tools.store), que es quien aplica el
+        # journal y la semilla.
+        from medical_system.infrastructure.persistence.shared.store import connect_store, store_authkey
+        return connect_store(STORE_SOCKET, store_authkey(STORE_SOCKET, STORE_AUTHKEY))
+
+    if STORAGE_BACKEND != "memory":
+        raise ValueError(f"STORAGE_BACKEND no soportado: {STORAGE_BACKEND}")
+
+    from medical_system.infrastructure.persistence.in_memory.bootstrap import build_in_memory_repositories
+    return build_in_memory_repositories(
+        seed_snapshot=SEED_SNAPSHOT,
+        journal_dir=JOURNAL_DIR,
+        fsync_interval=JOURNAL_FSYNC_INTERVAL,
+        snapshot_every=JOURNAL_SNAPSHOT_EVERY
+    )
+
+appointment_repo, patient_repo, doctor_repo, user_repo = _build_repositories()
+
+def _build_async_repositories():
+    from medical_system.infrastructure.persistence.executor.executor_repositories import (
+        ExecutorAppointmentRepository,
+        ExecutorDoctorRepository,
+        ExecutorPatientRepository,
+        ExecutorUserRepository
+    )
+
+    # En memoria no hay E/S que esperar y las llamadas se hacen en línea; con
+    # SQLite o el almacén compartido se llevan a un hilo del executor.
+    offload = STORAGE_BACKEND != "memory"
+    async_appointment_repo = ExecutorAppointmentRepository(appointment_repo, offload=offload)
+    if STORAGE_BACKEND == "sqlite" and SQLITE_DATABASE != ":memory:":
+        try:
+            import aiosqlite  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            from medical_system.infrastructure.persistence.sqlite.aiosqlite_database import AiosqliteDatabase
+            from medical_system.infrastructure.persistence.sqlite.aiosqlite_appointment_repository import AiosqliteAppointmentRepository
+            async_appointment_repo = AiosqliteAppointmentRepository(AiosqliteDatabase(SQLITE_DATABASE))
+
+    return (
+        async_appointment_repo,
+        ExecutorPatientRepository(patient_repo, offload=offload),
+        ExecutorDoctorRepository(doctor_repo, offload=offload),
+        ExecutorUserRepository(user_repo, offload=offload),
+    )
+
+async_appointment_repo, async_patient_repo, async_doctor_repo, async_user_repo = _build_async_repositories()
 
 def get_appointment_repository():
     return appointment_repo
@@ -19,3 +90,15 @@ def get_doctor_repository():
 
 def get_user_repository():
     return user_repo
+
+def get_async_appointment_repository():
+    return async_appointment_repo
+
+def get_async_patient_repository():
+    return async_patient_repo
+
+def get_async_doctor_repository():
+    return async_doctor_repo
+
+def get_async_user_repository():
+    return async_user_repo
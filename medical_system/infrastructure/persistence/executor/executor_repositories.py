@@ -0,0 +1,95 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import AsyncIterator, Optional
+
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.ports.repositories.async_doctor_repository import AsyncDoctorRepository
+from medical_system.domain.ports.repositories.async_patient_repository import AsyncPatientRepository
+from medical_system.domain.ports.repositories.async_user_repository import AsyncUserRepository
+
+# Adaptan un repositorio síncrono a los puertos asíncronos. Con `offload` cada
+# llamada va a un hilo del executor (run_in_executor) y el event loop sigue
+# atendiendo otras peticiones mientras espera a la base o al socket. Sin él la
+# llamada se hace en línea: para los repositorios en memoria, que no esperan
+# E/S, el salto de hilo costaría más que la propia consulta.
+
+def _delegate(name: str):
+    async def method(self, *args, **kwargs):
+        return await self._call(getattr(self._repository, name), *args, **kwargs)
+    method.__name__ = name
+    return method
+
+class _ExecutorRepository:
+    ITER_PAGE_SIZE = 500
+
+    def __init__(self, repository, offload: bool = True, executor: Optional[Executor] = None):
+        self._repository = repository
+        self._offload = offload
+        self._executor = executor
+
+    async def _call(self, function, *args, **kwargs):
+        if not self._offload:
+            return function(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+class ExecutorAppointmentRepository(_ExecutorRepository, AsyncAppointmentRepository):
+    find_by_id = _delegate("find_by_id")
+    save = _delegate("save")
+    reserve_slot = _delegate("reserve_slot")
+    reserve_many = _delegate("reserve_many")
+    move = _delegate("move")
+    save_many = _delegate("save_many")
+    find_by_doctor_and_date = _delegate("find_by_doctor_and_date")
+    find_by_patient = _delegate("find_by_patient")
+    find_by_patient_and_date = _delegate("find_by_patient_and_date")
+    find_available_slots = _delegate("find_available_slots")
+    get_occupancy_mask = _delegate("get_occupancy_mask")
+    get_occupancy_masks = _delegate("get_occupancy_masks")
+    get_occupancy_grid = _delegate("get_occupancy_grid")
+    find_by_doctor_patient_datetime = _delegate("find_by_doctor_patient_datetime")
+    find_patient_appointments_at_same_time = _delegate("find_patient_appointments_at_same_time")
+    find_all = _delegate("find_all")
+    find_page = _delegate("find_page")
+    delete = _delegate("delete")
+
+    async def iter_all(self) -> AsyncIterator[Appointment]:
+        # Por páginas: cada una es una llamada corta al executor en lugar de
+        # un generador síncrono que retendría un hilo todo el recorrido.
+        after_key = None
+        while True:
+            page = await self.find_page(after_key, self.ITER_PAGE_SIZE)
+            for appointment in page.items:
+                yield appointment
+            if page.next_key is None:
+                return
+            after_key = page.next_key
+
+class ExecutorPatientRepository(_ExecutorRepository, AsyncPatientRepository):
+    find_by_id = _delegate("find_by_id")
+    save = _delegate("save")
+    update = _delegate("update")
+    find_by_email = _delegate("find_by_email")
+    find_all = _delegate("find_all")
+    find_page = _delegate("find_page")
+
+class ExecutorDoctorRepository(_ExecutorRepository, AsyncDoctorRepository):
+    find_by_id = _delegate("find_by_id")
+    find_by_specialty = _delegate("find_by_specialty")
+    find_by_email = _delegate("find_by_email")
+    save = _delegate("save")
+    update = _delegate("update")
+    find_all = _delegate("find_all")
+    find_page = _delegate("find_page")
+
+class ExecutorUserRepository(_ExecutorRepository, AsyncUserRepository):
+    find_by_id = _delegate("find_by_id")
+    find_by_email = _delegate("find_by_email")
+    save = _delegate("save")
+    delete = _delegate("delete")
+    list_all = _delegate("list_all")
+    update_last_login = _delegate("update_last_login")
+    exists_with_email = _delegate("exists_with_email")
+    find_page = _delegate("find_page")
@@ -0,0 +1,401 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.ports.repositories.patient_repository import PatientRepository
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.page import Page
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import (
+    FULL_DAY_MASK,
+    SLOT_MINUTES,
+    iter_bits,
+    slot_index,
+    slot_time
+)
+
+# Almacén de solo lectura para históricos grandes (años de citas completadas).
+# Cada cita es una fila repartida en arrays paralelos de tipos fijos, unos 70
+# bytes por cita con sus índices frente a unos 400 como objetos. Las
+# filas se ordenan por (fecha, hora, id), el mismo orden de la paginación, así
+# que un rango de fechas es un rango contiguo de filas. Las entidades se
+# materializan solo para las filas que se devuelven.
+#
+# Las columnas pueden ser arrays propios (bulk_load) o vistas sobre un
+# fichero mapeado en memoria (from_columns, ver mapped_snapshot).
+
+_EPOCH = date(1970, 1, 1).toordinal()
+_STATUSES: Tuple[AppointmentStatus, ...] = tuple(AppointmentStatus)
+_STATUS_CODES: Dict[AppointmentStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_CANCELLED = _STATUS_CODES[AppointmentStatus.CANCELLED]
+_FILTERS = frozenset({'patient_id', 'doctor_id', 'date', 'status', 'start_date', 'end_date'})
+
+# Columnas del almacén con su tipo: 'i' int32 (array), 'B' un byte (bytearray).
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('ids', 'i'), ('doctor_ids', 'i'), ('patient_ids', 'i'), ('days', 'i'),
+    ('slots', 'B'), ('lengths', 'B'), ('statuses', 'B'),
+    ('sorted_ids', 'i'), ('id_rows', 'i'),
+    ('doctor_keys', 'i'), ('doctor_offsets', 'i'), ('doctor_rows', 'i'),
+    ('patient_keys', 'i'), ('patient_offsets', 'i'), ('patient_rows', 'i'),
+)
+
+def _day(value: date) -> int:
+    return value.toordinal() - _EPOCH
+
+class ArrayAppointmentStore(AppointmentRepository):
+
+    def __init__(self, patient_repository: PatientRepository, doctor_repository: DoctorRepository):
+        self._patients = patient_repository
+        self._doctors = doctor_repository
+        self._clear()
+
+    @classmethod
+    def from_columns(
+        cls,
+        patient_repository: PatientRepository,
+        doctor_repository: DoctorRepository,
+        columns: Mapping[str, Sequence[int]],
+        status_buffer=None,
+        status_offset: int = 0
+    ) -> 'ArrayAppointmentStore':
+        # Almacén sobre columnas ya construidas (p. ej. memoryviews de un
+        # mmap), sin copiarlas. `status_buffer` es el objeto con find() que
+        # contiene la columna de estados a partir de `status_offset`; por
+        # defecto la propia columna.
+        store = cls(patient_repository, doctor_repository)
+        store._set_columns(columns, status_buffer, status_offset)
+        return store
+
+    def _clear(self) -> None:
+        self._set_columns({
+            name: array(typecode) if typecode == 'i' else bytearray() for name, typecode in COLUMNS
+        })
+
+    def _set_columns(self, columns: Mapping[str, Sequence[int]], status_buffer=None, status_offset: int = 0) -> None:
+        # int32 para ids, doctor, paciente y día (días desde 1970-01-01); un
+        # byte para bloque de inicio, número de bloques y estado.
+        self._ids = columns['ids']
+        self._doctor_ids = columns['doctor_ids']
+        self._patient_ids = columns['patient_ids']
+        self._days = columns['days']
+        self._slots = columns['slots']
+        self._lengths = columns['lengths']
+        self._statuses = columns['statuses']
+        # Ids ordenados con la fila de cada uno, para find_by_id e iter_all.
+        self._sorted_ids = columns['sorted_ids']
+        self._id_rows = columns['id_rows']
+        # Filas de cada doctor y paciente, contiguas y en orden de fila: el
+        # doctor `_doctor_keys[k]` tiene las filas de `_doctor_rows` entre
+        # `_doctor_offsets[k]` y `_doctor_offsets[k + 1]`.
+        self._doctor_keys = columns['doctor_keys']
+        self._doctor_offsets = columns['doctor_offsets']
+        self._doctor_rows = columns['doctor_rows']
+        self._patient_keys = columns['patient_keys']
+        self._patient_offsets = columns['patient_offsets']
+        self._patient_rows = columns['patient_rows']
+        self._status_buffer = status_buffer if status_buffer is not None else self._statuses
+        self._status_offset = status_offset
+
+    def columns(self) -> Dict[str, Sequence[int]]:
+        return {name: getattr(self, '_' + name) for name, _ in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def bulk_load(self, appointments: Iterable[Appointment]) -> int:
+        # Las citas ya cargadas se conservan; una cita con el mismo id que
+        # otra ya cargada la sustituye.
+        rows = {row[2]: row for row in self._iter_rows()}
+        count = 0
+        for appointment in appointments:
+            if appointment.id is None:
+                raise ValueError("Solo se pueden cargar citas ya persistidas (con id)")
+            rows[appointment.id] = (
+                _day(appointment.date),
+                slot_index(appointment.time),
+                appointment.id,
+                appointment.doctor.id,
+                appointment.patient.id,
+                appointment.duration_minutes // SLOT_MINUTES,
+                _STATUS_CODES[AppointmentStatus(appointment.status)],
+            )
+            count += 1
+        self._build(sorted(rows.values()))
+        return count
+
+    def _iter_rows(self) -> Iterator[tuple]:
+        return zip(
+            self._days, self._slots, self._ids, self._doctor_ids,
+            self._patient_ids, self._lengths, self._statuses
+        )
+
+    def _build(self, rows: List[tuple]) -> None:
+        if not rows:
+            self._clear()
+            return
+        days, slots, ids, doctor_ids, patient_ids, lengths, statuses = zip(*rows)
+        by_id = sorted(range(len(ids)), key=ids.__getitem__)
+        doctor_keys, doctor_offsets, doctor_rows = self._group(doctor_ids)
+        patient_keys, patient_offsets, patient_rows = self._group(patient_ids)
+        self._set_columns({
+            'ids': array('i', ids),
+            'doctor_ids': array('i', doctor_ids),
+            'patient_ids': array('i', patient_ids),
+            'days': array('i', days),
+            'slots': bytearray(slots),
+            'lengths': bytearray(lengths),
+            'statuses': bytearray(statuses),
+            'sorted_ids': array('i', (ids[row] for row in by_id)),
+            'id_rows': array('i', by_id),
+            'doctor_keys': doctor_keys,
+            'doctor_offsets': doctor_offsets,
+            'doctor_rows': doctor_rows,
+            'patient_keys': patient_keys,
+            'patient_offsets': patient_offsets,
+            'patient_rows': patient_rows,
+        })
+
+    @staticmethod
+    def _group(keys: Sequence[int]) -> Tuple[array, array, array]:
+        # Ordenación estable por clave: dentro de cada grupo las filas siguen
+        # en orden de fecha.
+        rows = sorted(range(len(keys)), key=keys.__getitem__)
+        group_keys = array('i')
+        offsets = array('i')
+        for position, row in enumerate(rows):
+            if not group_keys or keys[row] != group_keys[-1]:
+                group_keys.append(keys[row])
+                offsets.append(position)
+        offsets.append(len(rows))
+        return group_keys, offsets, array('i', rows)
+
+    # --- Lectura ---
+
+    def find_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        row = self._row_of(appointment_id)
+        return self._materialize(row) if row is not None else None
+
+    def find_by_doctor_and_date(self, doctor_id: int, date: date) -> List[Appointment]:
+        return self._resolve(self._group_rows(self._doctors_group, doctor_id, date, date))
+
+    def find_by_patient(self, patient_id: int) -> List[Appointment]:
+        return self._resolve(self._group_rows(self._patients_group, patient_id))
+
+    def find_by_patient_and_date(self, patient_id: int, date: date) -> List[Appointment]:
+        return self._resolve(self._group_rows(self._patients_group, patient_id, date, date))
+
+    def find_by_doctor_patient_datetime(
+        self, doctor_id: int, patient_id: int, date: date, time: time
+    ) -> Optional[Appointment]:
+        slot = slot_index(time)
+        for row in self._group_rows(self._doctors_group, doctor_id, date, date):
+            if self._patient_ids[row] == patient_id and self._slots[row] == slot:
+                return self._materialize(row)
+        return None
+
+    def find_patient_appointments_at_same_time(
+        self, patient_id: int, date: date, time: time
+    ) -> List[Appointment]:
+        slot = slot_index(time)
+        rows = self._group_rows(self._patients_group, patient_id, date, date)
+        return self._resolve(row for row in rows if self._slots[row] == slot)
+
+    def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        return self.get_occupancy_masks(doctor_id, date, date).get(date, 0)
+
+    def get_occupancy_masks(self, doctor_id: int, start_date: date, end_date: date) -> Dict[date, int]:
+        return {
+            day: mask for (_, day), mask
+            in self.get_occupancy_grid((doctor_id,), start_date, end_date).items()
+        }
+
+    def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        days, slots, lengths, statuses = self._days, self._slots, self._lengths, self._statuses
+        grid: Dict[Tuple[int, date], int] = {}
+        for doctor_id in doctor_ids:
+            for row in self._group_rows(self._doctors_group, doctor_id, start_date, end_date):
+                if statuses[row] == _CANCELLED:
+                    continue
+                key = (doctor_id, date.fromordinal(days[row] + _EPOCH))
+                grid[key] = grid.get(key, 0) | (((1 << lengths[row]) - 1) << slots[row])
+        return grid
+
+    def find_available_slots(self, doctor_id: int, date: date) -> List[datetime]:
+        free = FULL_DAY_MASK & ~self.get_occupancy_mask(doctor_id, date)
+        return [datetime.combine(date, slot_time(index)) for index in iter_bits(free)]
+
+    def find_all(self, **filters) -> List[Appointment]:
+        return self._resolve(self._select(filters))
+
+    def count(self, **filters) -> int:
+        # Mismos filtros que find_all sin materializar ninguna cita.
+        return sum(1 for _ in self._select(filters))
+
+    def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        start = 0
+        if after_key:
+            after_date, after_time, after_id = after_key
+            target = (_day(after_date), slot_index(after_time), after_id)
+            start = bisect_right(range(len(self._ids)), target, key=self._sort_key)
+        rows = []
+        for row in self._select(filters, start):
+            rows.append(row)
+            if len(rows) > limit:
+                break
+        return Page.from_overfetch(self._resolve(rows), limit, self._page_key)
+
+    def iter_all(self) -> Iterator[Appointment]:
+        for row in self._id_rows:
+            yield self._materialize(row)
+
+    # --- Escritura: no admitida ---
+
+    def save(self, appointment: Appointment) -> Appointment:
+        raise NotImplementedError("ArrayAppointmentStore es de solo lectura; usa bulk_load")
+
+    def reserve_slot(self, appointment: Appointment) -> Appointment:
+        raise NotImplementedError("ArrayAppointmentStore es de solo lectura; usa bulk_load")
+
+    def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        raise NotImplementedError("ArrayAppointmentStore es de solo lectura; usa bulk_load")
+
+    def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        raise NotImplementedError("ArrayAppointmentStore es de solo lectura; usa bulk_load")
+
+    def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        raise NotImplementedError("ArrayAppointmentStore es de solo lectura; usa bulk_load")
+
+    def delete(self, appointment_id: int) -> None:
+        raise NotImplementedError("ArrayAppointmentStore es de solo lectura; usa bulk_load")
+
+    # --- Filas ---
+
+    def _row_of(self, appointment_id: int) -> Optional[int]:
+        position = bisect_left(self._sorted_ids, appointment_id)
+        if position < len(self._sorted_ids) and self._sorted_ids[position] == appointment_id:
+            return self._id_rows[position]
+        return None
+
+    def _sort_key(self, row: int) -> Tuple[int, int, int]:
+        return (self._days[row], self._slots[row], self._ids[row])
+
+    def _day_bounds(self, start_date: Optional[date], end_date: Optional[date]) -> Tuple[int, int]:
+        # Tramo contiguo de filas con fecha en [start_date, end_date].
+        lo = bisect_left(self._days, _day(start_date)) if start_date is not None else 0
+        hi = bisect_right(self._days, _day(end_date)) if end_date is not None else len(self._days)
+        return lo, max(lo, hi)
+
+    @property
+    def _doctors_group(self) -> Tuple[Sequence[int], Sequence[int], Sequence[int]]:
+        return self._doctor_keys, self._doctor_offsets, self._doctor_rows
+
+    @property
+    def _patients_group(self) -> Tuple[Sequence[int], Sequence[int], Sequence[int]]:
+        return self._patient_keys, self._patient_offsets, self._patient_rows
+
+    def _group_rows(
+        self,
+        group: Tuple[Sequence[int], Sequence[int], Sequence[int]],
+        key: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Sequence[int]:
+        # Filas de un doctor o paciente, opcionalmente acotadas por fecha con
+        # búsqueda binaria dentro de su tramo (que está en orden de fecha).
+        keys, offsets, group_rows = group
+        position = bisect_left(keys, key)
+        if position == len(keys) or keys[position] != key:
+            return ()
+        lo, hi = offsets[position], offsets[position + 1]
+        days = self._days
+        if start_date is not None:
+            lo = bisect_left(group_rows, _day(start_date), lo, hi, key=days.__getitem__)
+        if end_date is not None:
+            hi = bisect_right(group_rows, _day(end_date), lo, hi, key=days.__getitem__)
+        return group_rows[lo:max(lo, hi)]
+
+    def _select(self, filters: dict, start: int = 0) -> Iterator[int]:
+        # Filas que cumplen los filtros, en orden (fecha, hora, id) y a partir
+        # de la fila `start`. Se parte del doctor o el paciente si se filtra
+        # por ellos (sus tramos son pequeños) y si no del rango de fechas; el
+        # estado se filtra sobre el bytearray con find(), que recorre en C.
+        unknown = set(filters) - _FILTERS
+        if unknown:
+            raise ValueError(f"Filtro no soportado: {sorted(unknown)[0]}")
+        doctor_id = filters.get('doctor_id')
+        patient_id = filters.get('patient_id')
+        start_date = filters.get('start_date')
+        end_date = filters.get('end_date')
+        if filters.get('date') is not None:
+            start_date = end_date = filters['date']
+        status = filters.get('status')
+        code = _STATUS_CODES[AppointmentStatus(status)] if status is not None else None
+
+        if patient_id is not None or doctor_id is not None:
+            if patient_id is not None:
+                rows = self._group_rows(self._patients_group, patient_id, start_date, end_date)
+            else:
+                rows = self._group_rows(self._doctors_group, doctor_id, start_date, end_date)
+            rows = rows[bisect_left(rows, start):]
+            return (
+                row for row in rows
+                if (doctor_id is None or self._doctor_ids[row] == doctor_id)
+                and (code is None or self._statuses[row] == code)
+            )
+
+        lo, hi = self._day_bounds(start_date, end_date)
+        lo = max(lo, start)
+        if code is None:
+            return iter(range(lo, hi))
+        return self._find_status(code, lo, hi)
+
+    def _find_status(self, code: int, lo: int, hi: int) -> Iterator[int]:
+        # Tanto bytearray como mmap tienen find(); las posiciones se
+        # desplazan al tramo de la columna dentro del búfer.
+        find = self._status_buffer.find
+        needle = bytes((code,))
+        offset = self._status_offset
+        position = find(needle, offset + lo, offset + hi)
+        while position != -1:
+            yield position - offset
+            position = find(needle, position + 1, offset + hi)
+
+    def _resolve(self, rows: Iterable[int]) -> List[Appointment]:
+        # Doctores y pacientes se buscan una vez por llamada aunque aparezcan
+        # en muchas filas.
+        doctors: Dict[int, object] = {}
+        patients: Dict[int, object] = {}
+        return [self._materialize(row, doctors, patients) for row in rows]
+
+    def _materialize(self, row: int, doctors: Optional[dict] = None, patients: Optional[dict] = None) -> Appointment:
+        doctor_id = self._doctor_ids[row]
+        patient_id = self._patient_ids[row]
+        doctor = doctors.get(doctor_id) if doctors is not None else None
+        if doctor is None:
+            doctor = self._doctors.find_by_id(doctor_id)
+            if doctors is not None:
+                doctors[doctor_id] = doctor
+        patient = patients.get(patient_id) if patients is not None else None
+        if patient is None:
+            patient = self._patients.find_by_id(patient_id)
+            if patients is not None:
+                patients[patient_id] = patient
+        return Appointment.restore(
+            self._ids[row],
+            date=date.fromordinal(self._days[row] + _EPOCH),
+            time=slot_time(self._slots[row]),
+            status=_STATUSES[self._statuses[row]],
+            patient=patient,
+            doctor=doctor,
+            duration_minutes=self._lengths[row] * SLOT_MINUTES
+        )
+
+    @staticmethod
+    def _page_key(appointment: Appointment) -> Tuple[date, time, int]:
+        return (appointment.date, appointment.time, appointment.id)
@@ -0,0 +1,65 @@
+import atexit
+from typing import Optional, Tuple
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+
+def build_in_memory_repositories(
+    seed_snapshot: Optional[str] = None,
+    journal_dir: Optional[str] = None,
+    fsync_interval: float = 0.01,
+    snapshot_every: int = 100_000
+) -> Tuple[AppointmentRepository, InMemoryPatientRepository, InMemoryDoctorRepository, InMemoryUserRepository]:
+    # Usado por el contenedor (backend "memory") y por el proceso del almacén
+    # compartido, que sirve estos mismos repositorios a varios workers.
+    repositories = (
+        InMemoryAppointmentRepository(),
+        InMemoryPatientRepository(),
+        InMemoryDoctorRepository(),
+        InMemoryUserRepository(),
+    )
+    appointment_repo, patient_repo, doctor_repo, user_repo = repositories
+
+    journal = None
+    if journal_dir:
+        # Durabilidad: último snapshot + cola del journal al arrancar, y
+        # registro de cada cambio a partir de ahí.
+        from medical_system.infrastructure.persistence.journal import Journal
+        journal = Journal(
+            journal_dir, appointment_repo, patient_repo, doctor_repo, user_repo,
+            fsync_interval=fsync_interval,
+            snapshot_every=snapshot_every
+        )
+
+    seeded = False
+    if seed_snapshot and (journal is None or journal.is_empty()):
+        # Precarga un snapshot de `python -m medical_system.tools.seed --dump`;
+        # si el journal ya tiene datos, estos mandan y no se recarga.
+        from medical_system.infrastructure.persistence.mapped_snapshot import is_mapped_snapshot
+        if is_mapped_snapshot(seed_snapshot) and journal is None:
+            # Sin journal las citas se sirven desde el fichero mapeado hasta
+            # el primer cambio: el arranque no depende del número de citas.
+            from medical_system.infrastructure.persistence.mapped_snapshot import MappedSnapshot
+            from medical_system.infrastructure.persistence.in_memory.mapped_appointment_repository import MappedAppointmentRepository
+            snapshot = MappedSnapshot(seed_snapshot)
+            doctor_repo.bulk_load(snapshot.doctors())
+            patient_repo.bulk_load(snapshot.patients())
+            appointment_repo = MappedAppointmentRepository(snapshot.appointment_store(patient_repo, doctor_repo))
+            return appointment_repo, patient_repo, doctor_repo, user_repo
+        if is_mapped_snapshot(seed_snapshot):
+            from medical_system.infrastructure.persistence.mapped_snapshot import load_mapped_snapshot
+            load_mapped_snapshot(seed_snapshot, appointment_repo, patient_repo, doctor_repo)
+        else:
+            from medical_system.infrastructure.persistence.snapshot import load_snapshot
+            load_snapshot(seed_snapshot, appointment_repo, patient_repo, doctor_repo)
+        seeded = True
+
+    if journal is not None:
+        journal.open()
+        if seeded:
+            journal.snapshot()
+        atexit.register(journal.close)
+
+    return repositories
@@ -1,41 +1,257 @@
-from datetime import date, datetime, time
-from typing import Dict, List, Optional
+import threading
+from contextlib import ExitStack
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.page import Page
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import FULL_DAY_MASK, iter_bits, slot_time, span_mask
+from medical_system.infrastructure.persistence.journal import KIND_APPOINTMENT
 
 class InMemoryAppointmentRepository(AppointmentRepository):
+    LOCK_STRIPES = 64
+
     def __init__(self):
         self._appointments: Dict[int, Appointment] = {}
         self._next_id = 1
-        self._doctor_date_index: Dict[tuple[int, date], List[Appointment]] = {}
-        self._patient_index: Dict[int, List[Appointment]] = {}
+        # Citas por (doctor, día) y por paciente, indexadas por id: altas,
+        # bajas y cambios son O(1) y los dicts conservan el orden de llegada.
+        self._doctor_date_index: Dict[tuple[int, date], Dict[int, Appointment]] = {}
+        self._patient_index: Dict[int, Dict[int, Appointment]] = {}
+        self._occupancy: Dict[tuple[int, date], int] = {}
+        # Claves (fecha, hora, id) ordenadas: sirven a la paginación por cursor
+        # y como índice de fechas (búsqueda binaria por día o por rango).
+        self._order: List[Tuple[date, time, int]] = []
+        self._order_keys: Dict[int, Tuple[date, time, int]] = {}
+        # Las mismas claves por doctor y por estado, también ordenadas: una
+        # página filtrada empieza con una búsqueda binaria en la lista del
+        # índice elegido en lugar de recorrer _order desde el cursor.
+        self._doctor_index: Dict[int, List[Tuple[date, time, int]]] = {}
+        self._status_index: Dict[AppointmentStatus, List[Tuple[date, time, int]]] = {}
+        self._indexed_status: Dict[int, AppointmentStatus] = {}
+        # Cerrojos repartidos por doctor y por paciente: las reservas de
+        # doctores distintos no se esperan entre sí. El cerrojo de índices solo
+        # cubre la actualización de las estructuras compartidas.
+        self._doctor_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._patient_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._index_lock = threading.RLock()
+        # Lo asigna Journal.open() para registrar cada cambio.
+        self.journal = None
 
     def find_by_id(self, appointment_id: int) -> Optional[Appointment]:
         return self._appointments.get(appointment_id)
 
     def save(self, appointment: Appointment) -> Appointment:
+        with self._index_lock:
+            self._store(appointment)
+            if self.journal is not None:
+                self.journal.record_save(KIND_APPOINTMENT, appointment)
+        return appointment
+
+    def _store(self, appointment: Appointment) -> None:
         if appointment.id is None:
             appointment.id = self._next_id
             self._next_id += 1
-        
+
         self._update_indexes(appointment)
         self._appointments[appointment.id] = appointment
-        return appointment
+
+    def reserve_slot(self, appointment: Appointment) -> Appointment:
+        # Comprobación y alta atómicas. Siempre se toma primero el cerrojo del
+        # doctor y después el del paciente, así dos reservas nunca se bloquean
+        # mutuamente.
+        doctor_lock = self._doctor_locks[hash(appointment.doctor.id) % self.LOCK_STRIPES]
+        patient_lock = self._patient_locks[hash(appointment.patient.id) % self.LOCK_STRIPES]
+        with doctor_lock, patient_lock:
+            error = self._conflict(appointment)
+            if error:
+                raise ValueError(error)
+            return self.save(appointment)
+
+    def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        # Todos los cerrojos del lote de una vez, en orden: primero los de
+        # doctor y después los de paciente, cada grupo por número de franja.
+        # Así dos lotes (o un lote y una reserva suelta) nunca se esperan en
+        # círculo. Las altas se registran en el journal en un solo bloque.
+        appointments = list(appointments)
+        doctor_stripes = sorted({hash(apt.doctor.id) % self.LOCK_STRIPES for apt in appointments})
+        patient_stripes = sorted({hash(apt.patient.id) % self.LOCK_STRIPES for apt in appointments})
+        with ExitStack() as locks:
+            for stripe in doctor_stripes:
+                locks.enter_context(self._doctor_locks[stripe])
+            for stripe in patient_stripes:
+                locks.enter_context(self._patient_locks[stripe])
+            results: List[Union[Appointment, str]] = []
+            stored = []
+            with self._index_lock:
+                for appointment in appointments:
+                    error = self._conflict(appointment)
+                    if error:
+                        results.append(error)
+                        continue
+                    self._store(appointment)
+                    stored.append(appointment)
+                    results.append(appointment)
+                if self.journal is not None and stored:
+                    self.journal.record_saves(KIND_APPOINTMENT, stored)
+        return results
+
+    def _conflict(self, appointment: Appointment) -> Optional[str]:
+        # Motivo por el que no se puede reservar la cita, o None.
+        if self.get_occupancy_mask(appointment.doctor.id, appointment.date) & appointment.slot_mask:
+            return "El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)"
+        if self.find_by_patient_and_date(appointment.patient.id, appointment.date):
+            return "Solo puedes tener una cita por día"
+        return None
     
-    def update(self, appointment: Appointment) -> Appointment:
-        if appointment.id not in self._appointments:
+    def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        # Mismo orden de cerrojos que reserve_slot. La cita se modifica en el
+        # sitio: _update_indexes solo toca la clave de orden y la agenda del
+        # doctor (la del paciente va por id y no cambia).
+        appointment = self._appointments.get(appointment_id)
+        if appointment is None:
             raise ValueError("Appointment not found")
-        existing = self._appointments[appointment.id]
-        self._remove_from_indexes(existing)
-        self._update_indexes(appointment)
-        self._appointments[appointment.id] = appointment
+        doctor_lock = self._doctor_locks[hash(appointment.doctor.id) % self.LOCK_STRIPES]
+        patient_lock = self._patient_locks[hash(appointment.patient.id) % self.LOCK_STRIPES]
+        with doctor_lock, patient_lock:
+            key = (appointment.doctor.id, new_date)
+            if appointment.status != AppointmentStatus.CANCELLED:
+                if new_date == appointment.date:
+                    occupied = self._occupancy_without(key, appointment_id)
+                else:
+                    occupied = self.get_occupancy_mask(*key)
+                if occupied & span_mask(new_time, appointment.duration_minutes):
+                    raise ValueError("El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)")
+            if new_date != appointment.date and any(
+                other.date == new_date for other in self._patient_index.get(appointment.patient.id, {}).values()
+            ):
+                raise ValueError("Solo puedes tener una cita por día")
+            with self._index_lock:
+                appointment.date = new_date
+                appointment.time = new_time
+                appointment.version += 1
+                self._update_indexes(appointment)
+                if self.journal is not None:
+                    self.journal.record_save(KIND_APPOINTMENT, appointment)
+        return appointment
+
+    def _occupancy_without(self, key: tuple[int, date], appointment_id: int) -> int:
+        # Ocupación del día sin los bloques de una cita (la que se mueve).
+        mask = 0
+        for apt in self._doctor_date_index.get(key, {}).values():
+            if apt.id != appointment_id and apt.status != AppointmentStatus.CANCELLED:
+                mask |= apt.slot_mask
+        return mask
+
+    def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        # Lotes pequeños sobre un repositorio grande: insertar cada clave en la
+        # lista ordenada sale más barato que reordenarla entera (bulk_load).
+        return [self.save(appointment) for appointment in appointments]
+
+    def bulk_load(self, appointments: Iterable[Appointment]) -> int:
+        if self.journal is not None:
+            appointments = list(appointments)
+        with self._index_lock:
+            count = self._bulk_load(appointments)
+            if self.journal is not None:
+                self.journal.record_saves(KIND_APPOINTMENT, appointments)
+        return count
+
+    def _bulk_load(self, appointments: Iterable[Appointment]) -> int:
+        # Carga masiva (semillas, snapshots): sin validación ni búsquedas por
+        # cita. Los índices se construyen en una sola pasada con referencias
+        # locales y la lista ordenada se ordena una vez al final.
+        by_id = self._appointments
+        order = self._order
+        order_keys = self._order_keys
+        status_index = self._status_index
+        indexed_status = self._indexed_status
+        doctor_index = self._doctor_index
+        doctor_date_index = self._doctor_date_index
+        patient_index = self._patient_index
+        occupancy = self._occupancy
+        statuses = {status: status for status in AppointmentStatus}
+        statuses.update((status.value, status) for status in AppointmentStatus)
+        cancelled = AppointmentStatus.CANCELLED
+        spans: Dict[Tuple[time, int], int] = {}
+
+        count = 0
+        next_id = self._next_id
+        for appointment in appointments:
+            appointment_id = appointment.id
+            if appointment_id is None:
+                appointment_id = appointment.id = next_id
+            elif appointment_id in by_id:
+                self._next_id = next_id
+                self._store(appointment)
+                count += 1
+                continue
+            if appointment_id >= next_id:
+                next_id = appointment_id + 1
+
+            by_id[appointment_id] = appointment
+            page_key = (appointment.date, appointment.time, appointment_id)
+            order.append(page_key)
+            order_keys[appointment_id] = page_key
+
+            status = statuses[appointment.status]
+            indexed_status[appointment_id] = status
+            keys = status_index.get(status)
+            if keys is None:
+                keys = status_index[status] = []
+            keys.append(page_key)
+            keys = doctor_index.get(appointment.doctor.id)
+            if keys is None:
+                keys = doctor_index[appointment.doctor.id] = []
+            keys.append(page_key)
+
+            key = (appointment.doctor.id, appointment.date)
+            day = doctor_date_index.get(key)
+            if day is None:
+                day = doctor_date_index[key] = {}
+            day[appointment_id] = appointment
+            if status is not cancelled:
+                span_key = (appointment.time, appointment.duration_minutes)
+                span = spans.get(span_key)
+                if span is None:
+                    span = spans[span_key] = span_mask(*span_key)
+                occupancy[key] = occupancy.get(key, 0) | span
+            by_patient = patient_index.get(appointment.patient.id)
+            if by_patient is None:
+                by_patient = patient_index[appointment.patient.id] = {}
+            by_patient[appointment_id] = appointment
+            count += 1
+
+        self._next_id = next_id
+        order.sort()
+        for keys in doctor_index.values():
+            keys.sort()
+        for keys in status_index.values():
+            keys.sort()
+        return count
+
+    def update(self, appointment: Appointment) -> Appointment:
+        with self._index_lock:
+            if appointment.id not in self._appointments:
+                raise ValueError("Appointment not found")
+            existing = self._appointments[appointment.id]
+            # La clave de orden se conserva: _update_indexes solo la mueve si
+            # cambian fecha u hora, sin desplazar la lista ordenada en cada
+            # cambio de estado.
+            self._remove_from_indexes(existing, keep_order=True)
+            self._update_indexes(appointment)
+            self._appointments[appointment.id] = appointment
+            if self.journal is not None:
+                self.journal.record_save(KIND_APPOINTMENT, appointment)
         return appointment
     
     def find_by_doctor_and_date(self, doctor_id: int, date: date) -> List[Appointment]:
-        return self._doctor_date_index.get((doctor_id, date), []).copy()
+        return list(self._doctor_date_index.get((doctor_id, date), {}).values())
     
     def find_by_patient(self, patient_id: int) -> List[Appointment]:
-        return self._patient_index.get(patient_id, []).copy()
+        return list(self._patient_index.get(patient_id, {}).values())
     
     def find_by_patient_and_date(self, patient_id: int, date: date) -> List[Appointment]:
         patient_appointments = self.find_by_patient(patient_id)
@@ -59,64 +275,246 @@ class InMemoryAppointmentRepository(AppointmentRepository):
             if apt.date == date and apt.time == time
         ]
     
+    def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        return self._occupancy.get((doctor_id, date), 0)
+
+    def get_occupancy_masks(self, doctor_id: int, start_date: date, end_date: date) -> Dict[date, int]:
+        # Solo los días con algún bloque ocupado, de start_date a end_date
+        # ambos incluidos. Cada día es una consulta al índice de ocupación,
+        # que ya se mantiene al reservar, cancelar, completar y borrar.
+        occupancy = self._occupancy
+        masks = {}
+        day = start_date
+        while day <= end_date:
+            mask = occupancy.get((doctor_id, day), 0)
+            if mask:
+                masks[day] = mask
+            day += timedelta(days=1)
+        return masks
+
+    def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        # Celdas (doctor, día) con algún bloque ocupado. Se recorre el rango
+        # una vez y cada celda es una consulta al índice de ocupación.
+        occupancy = self._occupancy
+        days = []
+        day = start_date
+        while day <= end_date:
+            days.append(day)
+            day += timedelta(days=1)
+        grid = {}
+        for doctor_id in doctor_ids:
+            for day in days:
+                key = (doctor_id, day)
+                mask = occupancy.get(key, 0)
+                if mask:
+                    grid[key] = mask
+        return grid
+
     def find_available_slots(self, doctor_id: int, date: date) -> List[datetime]:
-        appointments = self.find_by_doctor_and_date(doctor_id, date)
-        booked_times = {apt.time for apt in appointments}
-        
-        all_slots = [
-            time(hour=h, minute=m)
-            for h in range(8, 20)
-            for m in [0, 30]
-        ]
-        
-        available = [
-            datetime.combine(date, t)
-            for t in all_slots
-            if t not in booked_times
-        ]
-        
-        return available
+        free = FULL_DAY_MASK & ~self.get_occupancy_mask(doctor_id, date)
+        return [datetime.combine(date, slot_time(index)) for index in iter_bits(free)]
     
     def find_all(self, **filters) -> List[Appointment]:
-        appointments = list(self._appointments.values())
-        
         if not filters:
-            return appointments
-            
-        filtered_appointments = []
-        for apt in appointments:
-            match = True
-            for key, value in filters.items():
-                if not hasattr(apt, key) or getattr(apt, key) != value:
-                    match = False
+            return list(self._appointments.values())
+
+        with self._index_lock:
+            _, _, candidates = self._plan(filters)
+            keys, lo, hi = candidates()
+            candidates = [self._appointments[keys[position][2]] for position in range(lo, hi)]
+        # Las claves del índice ya van en orden de página.
+        return [apt for apt in candidates if self._matches(apt, filters)]
+    
+    def plan(self, **filters) -> Tuple[str, int]:
+        # Índice que usaría find_all para estos filtros y cuántas citas
+        # tendría que examinar con él.
+        index, estimate, _ = self._plan(filters)
+        return index, estimate
+    
+    def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        # Con filtros se recorre solo el índice más selectivo (el mismo que
+        # elige find_all), desde el cursor: una página profunda cuesta lo
+        # mismo que la primera.
+        items = []
+        with self._index_lock:
+            _, _, candidates = self._plan(filters)
+            keys, lo, hi = candidates()
+            if after_key:
+                lo = max(lo, bisect_right(keys, after_key, lo, hi))
+            for position in range(lo, hi):
+                apt = self._appointments[keys[position][2]]
+                if filters and not self._matches(apt, filters):
+                    continue
+                items.append(apt)
+                if len(items) > limit:
                     break
-            if match:
-                filtered_appointments.append(apt)
-                
-        return filtered_appointments
+        return Page.from_overfetch(items, limit, self._page_key)
+    
+    def iter_all(self) -> Iterator[Appointment]:
+        # Recorre por id una copia de los ids vivos (no las citas): el coste
+        # depende de cuántas citas hay, no del id más alto emitido, y tolera
+        # altas/bajas concurrentes durante la iteración. Los ids llegan casi
+        # siempre en orden, así que ordenarlos es prácticamente lineal.
+        with self._index_lock:
+            appointment_ids = sorted(self._appointments)
+        for appointment_id in appointment_ids:
+            appointment = self._appointments.get(appointment_id)
+            if appointment is not None:
+                yield appointment
     
     def delete(self, appointment_id: int) -> None:
-        if appointment_id in self._appointments:
-            appointment = self._appointments[appointment_id]
-            self._remove_from_indexes(appointment)
-            del self._appointments[appointment_id]
+        with self._index_lock:
+            if appointment_id in self._appointments:
+                appointment = self._appointments[appointment_id]
+                self._remove_from_indexes(appointment)
+                del self._appointments[appointment_id]
+                if self.journal is not None:
+                    self.journal.record_delete(KIND_APPOINTMENT, appointment_id)
     
+    def _plan(self, filters: dict) -> Tuple[str, int, Callable[[], Tuple[Sequence[Tuple[date, time, int]], int, int]]]:
+        # Cada índice aplicable aporta su número exacto de candidatas; se elige
+        # el más selectivo y el resto de filtros se comprueba sobre él. Las
+        # candidatas son claves de orden ordenadas y el tramo [lo, hi) que
+        # cubren. Las agendas de un paciente o de un doctor en un día son
+        # cortas y se ordenan al vuelo.
+        options = []
+        patient_id = filters.get('patient_id')
+        doctor_id = filters.get('doctor_id')
+        day = filters.get('date')
+        status = filters.get('status')
+        start_date = filters.get('start_date')
+        end_date = filters.get('end_date')
+
+        if patient_id is not None:
+            by_patient = self._patient_index.get(patient_id, {})
+            options.append(('patient', len(by_patient), lambda: self._sorted_keys(by_patient)))
+        if doctor_id is not None and day is not None:
+            by_doctor_day = self._doctor_date_index.get((doctor_id, day), {})
+            options.append(('doctor_date', len(by_doctor_day), lambda: self._sorted_keys(by_doctor_day)))
+        elif doctor_id is not None:
+            by_doctor = self._doctor_index.get(doctor_id, [])
+            options.append(('doctor', len(by_doctor), lambda: (by_doctor, 0, len(by_doctor))))
+        if day is not None:
+            start_date = end_date = day
+        if start_date is not None or end_date is not None:
+            lo, hi = self._date_bounds(start_date, end_date)
+            options.append(('date', hi - lo, lambda: (self._order, lo, hi)))
+        if status is not None:
+            by_status = self._status_index.get(AppointmentStatus(status), [])
+            options.append(('status', len(by_status), lambda: (by_status, 0, len(by_status))))
+
+        if not options:
+            return 'scan', len(self._appointments), lambda: (self._order, 0, len(self._order))
+        return min(options, key=lambda option: option[1])
+
+    def _date_bounds(self, start_date: Optional[date], end_date: Optional[date]) -> Tuple[int, int]:
+        lo = bisect_left(self._order, (start_date,)) if start_date is not None else 0
+        hi = (
+            bisect_left(self._order, (end_date + timedelta(days=1),))
+            if end_date is not None and end_date < date.max else len(self._order)
+        )
+        return lo, max(lo, hi)
+
+    def _sorted_keys(self, appointments: Dict[int, Appointment]) -> Tuple[List[Tuple[date, time, int]], int, int]:
+        keys = sorted(self._order_keys[appointment_id] for appointment_id in appointments)
+        return keys, 0, len(keys)
+
+    @staticmethod
+    def _discard_key(keys: List[Tuple[date, time, int]], key: Tuple[date, time, int]) -> None:
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+    @staticmethod
+    def _page_key(appointment: Appointment) -> Tuple[date, time, int]:
+        return (appointment.date, appointment.time, appointment.id)
+
+    @staticmethod
+    def _matches(appointment: Appointment, filters: dict) -> bool:
+        for name, value in filters.items():
+            if name == 'patient_id':
+                actual = appointment.patient.id
+            elif name == 'doctor_id':
+                actual = appointment.doctor.id
+            elif name == 'start_date':
+                if value is not None and appointment.date < value:
+                    return False
+                continue
+            elif name == 'end_date':
+                if value is not None and appointment.date > value:
+                    return False
+                continue
+            else:
+                actual = getattr(appointment, name, None)
+            if actual != value:
+                return False
+        return True
+
     def _update_indexes(self, appointment: Appointment):
+        page_key = self._page_key(appointment)
+        previous = self._order_keys.get(appointment.id)
+        if previous != page_key:
+            if previous is not None:
+                del self._order[bisect_left(self._order, previous)]
+                if previous[0] != appointment.date:
+                    # Cita cambiada de día: sale de la agenda del día anterior.
+                    self._remove_from_day((appointment.doctor.id, previous[0]), appointment.id)
+            insort(self._order, page_key)
+            self._order_keys[appointment.id] = page_key
+
+        # Una cita está en los índices de doctor y de estado si y solo si
+        # tiene estado indexado.
+        status = AppointmentStatus(appointment.status)
+        previous_status = self._indexed_status.get(appointment.id)
+        if previous_status != status or previous != page_key:
+            by_doctor = self._doctor_index.setdefault(appointment.doctor.id, [])
+            if previous_status is not None:
+                self._discard_key(self._status_index[previous_status], previous)
+                self._discard_key(by_doctor, previous)
+            insort(self._status_index.setdefault(status, []), page_key)
+            insort(by_doctor, page_key)
+            self._indexed_status[appointment.id] = status
+
         key = (appointment.doctor.id, appointment.date)
-        if key not in self._doctor_date_index:
-            self._doctor_date_index[key] = []
-        if appointment not in self._doctor_date_index[key]:
-            self._doctor_date_index[key].append(appointment)
-        
-        if appointment.patient.id not in self._patient_index:
-            self._patient_index[appointment.patient.id] = []
-        if appointment not in self._patient_index[appointment.patient.id]:
-            self._patient_index[appointment.patient.id].append(appointment)
+        self._doctor_date_index.setdefault(key, {})[appointment.id] = appointment
+        self._refresh_occupancy(key)
+        self._patient_index.setdefault(appointment.patient.id, {})[appointment.id] = appointment
     
-    def _remove_from_indexes(self, appointment: Appointment):
-        key = (appointment.doctor.id, appointment.date)
-        if key in self._doctor_date_index and appointment in self._doctor_date_index[key]:
-            self._doctor_date_index[key].remove(appointment)
-        if appointment.patient.id in self._patient_index:
-            if appointment in self._patient_index[appointment.patient.id]:
-                self._patient_index[appointment.patient.id].remove(appointment)
+    def _remove_from_indexes(self, appointment: Appointment, keep_order: bool = False):
+        page_key = self._order_keys.get(appointment.id)
+        status = self._indexed_status.pop(appointment.id, None)
+        if status is not None:
+            self._discard_key(self._status_index[status], page_key)
+            self._discard_key(self._doctor_index.get(appointment.doctor.id, []), page_key)
+        if not keep_order and page_key is not None:
+            del self._order_keys[appointment.id]
+            del self._order[bisect_left(self._order, page_key)]
+
+        self._remove_from_day((appointment.doctor.id, appointment.date), appointment.id)
+        by_patient = self._patient_index.get(appointment.patient.id)
+        if by_patient is not None and by_patient.pop(appointment.id, None) is not None:
+            if not by_patient:
+                del self._patient_index[appointment.patient.id]
+
+    def _remove_from_day(self, key: tuple[int, date], appointment_id: int):
+        by_doctor_day = self._doctor_date_index.get(key)
+        if by_doctor_day is not None and by_doctor_day.pop(appointment_id, None) is not None:
+            if not by_doctor_day:
+                del self._doctor_date_index[key]
+            self._refresh_occupancy(key)
+
+    def _refresh_occupancy(self, key: tuple[int, date]):
+        # Las citas canceladas liberan sus bloques; el resto ocupa todos los
+        # que cubre su duración.
+        mask = 0
+        for apt in self._doctor_date_index.get(key, {}).values():
+            if apt.status != AppointmentStatus.CANCELLED:
+                mask |= apt.slot_mask
+        if mask:
+            self._occupancy[key] = mask
+        else:
+            self._occupancy.pop(key, None)
@@ -1,6 +1,9 @@
-from typing import Dict, List, Optional
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional
 from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
 from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.page import Page
+from medical_system.infrastructure.persistence.journal import KIND_DOCTOR
 
 class InMemoryDoctorRepository(DoctorRepository):
     def __init__(self):
@@ -8,6 +11,8 @@ class InMemoryDoctorRepository(DoctorRepository):
         self._next_id = 1
         self._email_index: Dict[str, Doctor] = {}
         self._specialty_index: Dict[str, List[Doctor]] = {}
+        self._ids: List[int] = []
+        self.journal = None
 
     def find_by_id(self, doctor_id: int) -> Optional[Doctor]:
         return self._doctors.get(doctor_id)
@@ -24,8 +29,26 @@ class InMemoryDoctorRepository(DoctorRepository):
             self._next_id += 1
         
         self._update_indexes(doctor)
+        if self.journal is not None:
+            self.journal.record_save(KIND_DOCTOR, doctor)
         return doctor
     
+    def bulk_load(self, doctors: Iterable[Doctor]) -> int:
+        if self.journal is not None:
+            doctors = list(doctors)
+        count = 0
+        for doctor in doctors:
+            if doctor.id is None:
+                doctor.id = self._next_id
+                self._next_id += 1
+            else:
+                self._next_id = max(self._next_id, doctor.id + 1)
+            self._update_indexes(doctor)
+            count += 1
+        if self.journal is not None:
+            self.journal.record_saves(KIND_DOCTOR, doctors)
+        return count
+    
     def update(self, doctor: Doctor) -> Doctor:
         if doctor.id not in self._doctors:
             raise ValueError("Doctor not found")
@@ -34,12 +57,31 @@ class InMemoryDoctorRepository(DoctorRepository):
         self._remove_from_indexes(existing)
         self._update_indexes(doctor)
         self._doctors[doctor.id] = doctor
+        if self.journal is not None:
+            self.journal.record_save(KIND_DOCTOR, doctor)
         return doctor
     
     def find_all(self) -> List[Doctor]:
         return list(self._doctors.values())
     
+    def find_page(
+        self, after_key: Optional[int], limit: int, specialty: Optional[str] = None
+    ) -> Page[Doctor]:
+        specialty_key = specialty.lower().strip() if specialty else None
+        start = bisect_right(self._ids, after_key) if after_key is not None else 0
+        items = []
+        for position in range(start, len(self._ids)):
+            doctor = self._doctors[self._ids[position]]
+            if specialty_key and (doctor.specialty or '').lower().strip() != specialty_key:
+                continue
+            items.append(doctor)
+            if len(items) > limit:
+                break
+        return Page.from_overfetch(items, limit, lambda d: d.id)
+    
     def _update_indexes(self, doctor: Doctor):
+        if doctor.id not in self._doctors:
+            insort(self._ids, doctor.id)
         self._doctors[doctor.id] = doctor
 
         if hasattr(doctor, 'email') and doctor.email:
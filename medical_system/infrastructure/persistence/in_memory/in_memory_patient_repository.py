@@ -1,12 +1,17 @@
-from typing import Dict, List, Optional
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional
 from medical_system.domain.ports.repositories.patient_repository import PatientRepository
 from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.page import Page
+from medical_system.infrastructure.persistence.journal import KIND_PATIENT
 
 class InMemoryPatientRepository(PatientRepository):
     def __init__(self):
         self._patients: Dict[int, Patient] = {}
         self._next_id = 1
         self._email_index: Dict[str, Patient] = {}
+        self._ids: List[int] = []
+        self.journal = None
 
     def find_by_id(self, patient_id: int) -> Optional[Patient]:
         return self._patients.get(patient_id)
@@ -22,9 +27,33 @@ class InMemoryPatientRepository(PatientRepository):
         if hasattr(patient, 'email') and patient.email:
             self._email_index[str(patient.email).lower()] = patient
         
+        if patient.id not in self._patients:
+            insort(self._ids, patient.id)
         self._patients[patient.id] = patient
+        if self.journal is not None:
+            self.journal.record_save(KIND_PATIENT, patient)
         return patient
     
+    def bulk_load(self, patients: Iterable[Patient]) -> int:
+        if self.journal is not None:
+            patients = list(patients)
+        count = 0
+        for patient in patients:
+            if patient.id is None:
+                patient.id = self._next_id
+                self._next_id += 1
+            else:
+                self._next_id = max(self._next_id, patient.id + 1)
+            self._email_index[str(patient.email).lower()] = patient
+            if patient.id not in self._patients:
+                self._ids.append(patient.id)
+            self._patients[patient.id] = patient
+            count += 1
+        self._ids.sort()
+        if self.journal is not None:
+            self.journal.record_saves(KIND_PATIENT, patients)
+        return count
+    
     def update(self, patient: Patient) -> Patient:
         if patient.id not in self._patients:
             raise ValueError("Patient not found")
@@ -37,7 +66,14 @@ class InMemoryPatientRepository(PatientRepository):
             self._email_index[str(patient.email).lower()] = patient
         
         self._patients[patient.id] = patient
+        if self.journal is not None:
+            self.journal.record_save(KIND_PATIENT, patient)
         return patient
     
     def find_all(self) -> List[Patient]:
         return list(self._patients.values())
+    
+    def find_page(self, after_key: Optional[int], limit: int) -> Page[Patient]:
+        start = bisect_right(self._ids, after_key) if after_key is not None else 0
+        items = [self._patients[patient_id] for patient_id in self._ids[start:start + limit + 1]]
+        return Page.from_overfetch(items, limit, lambda p: p.id)
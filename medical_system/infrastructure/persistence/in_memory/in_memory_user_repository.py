@@ -1,13 +1,18 @@
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from medical_system.domain.entities.user import User
 from medical_system.domain.ports.repositories.user_repository import UserRepository
+from medical_system.domain.value_objects.page import Page
+from medical_system.infrastructure.persistence.journal import KIND_USER
 
 class InMemoryUserRepository(UserRepository):
     def __init__(self):
         self._users: Dict[int, User] = {}
         self._next_id = 1
         self._email_index: Dict[str, User] = {}
+        self._ids: List[int] = []
+        self.journal = None
 
     def find_by_id(self, user_id: int) -> Optional[User]:
         return self._users.get(user_id)
@@ -29,10 +34,35 @@ class InMemoryUserRepository(UserRepository):
             if old_user.email in self._email_index:
                 del self._email_index[old_user.email]
         
+        if user.id not in self._users:
+            insort(self._ids, user.id)
         self._users[user.id] = user
         self._email_index[user.email] = user
+        if self.journal is not None:
+            self.journal.record_save(KIND_USER, user)
         return user
 
+    def bulk_load(self, users: Iterable[User]) -> int:
+        # Rehidrata usuarios ya persistidos conservando sus marcas de tiempo.
+        if self.journal is not None:
+            users = list(users)
+        count = 0
+        for user in users:
+            if user.id is None:
+                user.id = self._next_id
+                self._next_id += 1
+            else:
+                self._next_id = max(self._next_id, user.id + 1)
+            if user.id not in self._users:
+                self._ids.append(user.id)
+            self._users[user.id] = user
+            self._email_index[user.email.lower()] = user
+            count += 1
+        self._ids.sort()
+        if self.journal is not None:
+            self.journal.record_saves(KIND_USER, users)
+        return count
+
     def delete(self, user_id: int) -> bool:
         if user_id not in self._users:
             return False
@@ -41,7 +71,10 @@ class InMemoryUserRepository(UserRepository):
         if user.email in self._email_index:
             del self._email_index[user.email]
             
+        del self._ids[bisect_left(self._ids, user_id)]
         del self._users[user_id]
+        if self.journal is not None:
+            self.journal.record_delete(KIND_USER, user_id)
         return True
 
     def list_all(
@@ -63,12 +96,29 @@ class InMemoryUserRepository(UserRepository):
             
         return users
 
+    def find_page(self, after_key: Optional[int], limit: int, **filters) -> Page[User]:
+        role = filters.pop('role', None)
+        start = bisect_right(self._ids, after_key) if after_key is not None else 0
+        items = []
+        for position in range(start, len(self._ids)):
+            user = self._users[self._ids[position]]
+            if role is not None and not user.has_role(role):
+                continue
+            if any(getattr(user, key, None) != value for key, value in filters.items()):
+                continue
+            items.append(user)
+            if len(items) > limit:
+                break
+        return Page.from_overfetch(items, limit, lambda u: u.id)
+
     def update_last_login(self, user_id: int, login_time: datetime) -> bool:
         if user_id not in self._users:
             return False
             
         user = self._users[user_id]
         user.last_login = login_time
+        if self.journal is not None:
+            self.journal.record_save(KIND_USER, user)
         return True
 
     def exists_with_email(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
@@ -0,0 +1,256 @@
+import heapq
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.page import Page
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import FULL_DAY_MASK, iter_bits, slot_time, span_mask
+from medical_system.infrastructure.persistence.in_memory.array_appointment_store import ArrayAppointmentStore
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+
+class MappedAppointmentRepository(AppointmentRepository):
+    # Repositorio de arranque en frío sobre un snapshot binario mapeado. El
+    # ArrayAppointmentStore (sin copiar el fichero) nunca cambia: delante hay
+    # un InMemoryAppointmentRepository con las citas nuevas o modificadas y un
+    # conjunto con los ids del almacén que esas escrituras ocultan (cambiadas
+    # o borradas). Cada escritura cuesta lo mismo con mil citas que con un
+    # millón; nada se copia en bloque.
+
+    def __init__(self, store: ArrayAppointmentStore):
+        self._store = store
+        self._overlay = InMemoryAppointmentRepository()
+        ids = store.columns()['sorted_ids']
+        # Los ids nuevos siguen a los del snapshot.
+        self._first_new_id = self._overlay._next_id = ids[-1] + 1 if len(ids) else 1
+        self._shadowed: Set[int] = set()
+        # Días originales de cada cita oculta, por doctor: en esos días la
+        # ocupación del almacén se recalcula sin ellas. Una consulta solo
+        # mira los días sucios de sus doctores.
+        self._dirty_days: Dict[int, Set[date]] = {}
+        # Las comprobaciones de reserva miran almacén y capa a la vez: las
+        # escrituras se hacen de una en una.
+        self._write_lock = threading.RLock()
+
+    @property
+    def modified(self) -> bool:
+        # Si alguna escritura ha llegado a la capa.
+        return bool(self._shadowed) or self._overlay._next_id > self._first_new_id
+
+    # --- Lectura ---
+
+    def find_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        appointment = self._overlay.find_by_id(appointment_id)
+        if appointment is not None or appointment_id in self._shadowed:
+            return appointment
+        return self._store.find_by_id(appointment_id)
+
+    def _visible(self, appointments: List[Appointment]) -> List[Appointment]:
+        # Citas del almacén que ninguna escritura ha ocultado.
+        shadowed = self._shadowed
+        if not shadowed:
+            return appointments
+        return [apt for apt in appointments if apt.id not in shadowed]
+
+    def find_by_doctor_and_date(self, doctor_id: int, date: date) -> List[Appointment]:
+        return (
+            self._visible(self._store.find_by_doctor_and_date(doctor_id, date))
+            + self._overlay.find_by_doctor_and_date(doctor_id, date)
+        )
+
+    def find_by_patient(self, patient_id: int) -> List[Appointment]:
+        return self._visible(self._store.find_by_patient(patient_id)) + self._overlay.find_by_patient(patient_id)
+
+    def find_by_patient_and_date(self, patient_id: int, date: date) -> List[Appointment]:
+        return (
+            self._visible(self._store.find_by_patient_and_date(patient_id, date))
+            + self._overlay.find_by_patient_and_date(patient_id, date)
+        )
+
+    def find_available_slots(self, doctor_id: int, date: date) -> List[datetime]:
+        free = FULL_DAY_MASK & ~self.get_occupancy_mask(doctor_id, date)
+        return [datetime.combine(date, slot_time(index)) for index in iter_bits(free)]
+
+    def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        return self.get_occupancy_grid((doctor_id,), date, date).get((doctor_id, date), 0)
+
+    def get_occupancy_masks(self, doctor_id: int, start_date: date, end_date: date) -> Dict[date, int]:
+        return {
+            day: mask for (_, day), mask
+            in self.get_occupancy_grid((doctor_id,), start_date, end_date).items()
+        }
+
+    def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        grid = self._store.get_occupancy_grid(doctor_ids, start_date, end_date)
+        span = (end_date - start_date).days + 1
+        for doctor_id in doctor_ids:
+            days = self._dirty_days.get(doctor_id)
+            if not days:
+                continue
+            # Se recorre lo más corto: los días sucios del doctor o el rango.
+            if len(days) > span:
+                dirty = days
+                days = [start_date + timedelta(days=offset) for offset in range(span)]
+                days = [day for day in days if day in dirty]
+            else:
+                days = list(days)
+            for day in days:
+                if start_date <= day <= end_date:
+                    key = (doctor_id, day)
+                    mask = self._store_occupancy(doctor_id, day)
+                    if mask:
+                        grid[key] = mask
+                    else:
+                        grid.pop(key, None)
+        for key, mask in self._overlay.get_occupancy_grid(doctor_ids, start_date, end_date).items():
+            grid[key] = grid.get(key, 0) | mask
+        return grid
+
+    def _store_occupancy(self, doctor_id: int, day: date, exclude: Optional[int] = None) -> int:
+        # Ocupación del día en el almacén sin las citas ocultas (ni `exclude`).
+        mask = 0
+        for apt in self._visible(self._store.find_by_doctor_and_date(doctor_id, day)):
+            if apt.id != exclude and apt.status != AppointmentStatus.CANCELLED:
+                mask |= apt.slot_mask
+        return mask
+
+    def find_by_doctor_patient_datetime(
+        self, doctor_id: int, patient_id: int, date: date, time: time
+    ) -> Optional[Appointment]:
+        for apt in self.find_by_doctor_and_date(doctor_id, date):
+            if apt.patient.id == patient_id and apt.time == time:
+                return apt
+        return None
+
+    def find_patient_appointments_at_same_time(
+        self, patient_id: int, date: date, time: time
+    ) -> List[Appointment]:
+        return [apt for apt in self.find_by_patient_and_date(patient_id, date) if apt.time == time]
+
+    def find_all(self, **filters) -> List[Appointment]:
+        stored = self._visible(self._store.find_all(**filters))
+        changed = self._overlay.find_all(**filters)
+        if not changed:
+            return stored
+        changed.sort(key=self._page_key)
+        return list(heapq.merge(stored, changed, key=self._page_key))
+
+    def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        # limit + 1 citas visibles de cada lado, mezcladas por clave de
+        # página. Las ocultas solo alargan la lectura del almacén en tantas
+        # filas como haya ocultas en el tramo.
+        stored: List[Appointment] = []
+        cursor = after_key
+        while len(stored) <= limit:
+            page = self._store.find_page(cursor, limit + 1, **filters)
+            stored.extend(self._visible(page.items))
+            if page.next_key is None:
+                break
+            cursor = page.next_key
+        changed = self._overlay.find_page(after_key, limit + 1, **filters).items
+        items = list(heapq.merge(stored, changed, key=self._page_key))[:limit + 1]
+        return Page.from_overfetch(items, limit, self._page_key)
+
+    def iter_all(self) -> Iterator[Appointment]:
+        # Ambos lados recorren por id.
+        shadowed = self._shadowed
+        stored = (apt for apt in self._store.iter_all() if apt.id not in shadowed)
+        return heapq.merge(stored, self._overlay.iter_all(), key=lambda apt: apt.id)
+
+    @staticmethod
+    def _page_key(appointment: Appointment) -> Tuple[date, time, int]:
+        return (appointment.date, appointment.time, appointment.id)
+
+    # --- Escritura ---
+
+    def _shadow(self, appointment_id: Optional[int]) -> None:
+        # A partir de aquí la cita del almacén deja de verse; la capa guarda
+        # la versión nueva (si no es un borrado).
+        if appointment_id is None or appointment_id in self._shadowed:
+            return
+        original = self._store.find_by_id(appointment_id)
+        if original is not None:
+            self._shadowed.add(appointment_id)
+            self._dirty_days.setdefault(original.doctor.id, set()).add(original.date)
+
+    def save(self, appointment: Appointment) -> Appointment:
+        with self._write_lock:
+            self._shadow(appointment.id)
+            # Una cita leída del almacén, o antes de otra escritura, es otro
+            # objeto que el que guarda la capa: update lo sustituye en todos
+            # los índices.
+            if appointment.id is not None:
+                existing = self._overlay.find_by_id(appointment.id)
+                if existing is not None and existing is not appointment:
+                    return self._overlay.update(appointment)
+            return self._overlay.save(appointment)
+
+    def update(self, appointment: Appointment) -> Appointment:
+        with self._write_lock:
+            if self.find_by_id(appointment.id) is None:
+                raise ValueError("Appointment not found")
+            return self.save(appointment)
+
+    def reserve_slot(self, appointment: Appointment) -> Appointment:
+        with self._write_lock:
+            error = self._conflict(appointment)
+            if error:
+                raise ValueError(error)
+            return self.save(appointment)
+
+    def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        results: List[Union[Appointment, str]] = []
+        with self._write_lock:
+            for appointment in appointments:
+                error = self._conflict(appointment)
+                results.append(error if error else self.save(appointment))
+        return results
+
+    def _conflict(self, appointment: Appointment) -> Optional[str]:
+        # Mismos motivos que InMemoryAppointmentRepository._conflict, sobre
+        # almacén y capa juntos.
+        if self.get_occupancy_mask(appointment.doctor.id, appointment.date) & appointment.slot_mask:
+            return "El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)"
+        if self.find_by_patient_and_date(appointment.patient.id, appointment.date):
+            return "Solo puedes tener una cita por día"
+        return None
+
+    def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        with self._write_lock:
+            appointment = self.find_by_id(appointment_id)
+            if appointment is None:
+                raise ValueError("Appointment not found")
+            # La capa solo conoce su parte del día destino: la del almacén se
+            # comprueba aquí y después overlay.move comprueba la suya.
+            if appointment.status != AppointmentStatus.CANCELLED:
+                occupied = self._store_occupancy(appointment.doctor.id, new_date, exclude=appointment_id)
+                if occupied & span_mask(new_time, appointment.duration_minutes):
+                    raise ValueError("El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)")
+            if new_date != appointment.date and any(
+                other.id != appointment_id
+                for other in self._visible(self._store.find_by_patient_and_date(appointment.patient.id, new_date))
+            ):
+                raise ValueError("Solo puedes tener una cita por día")
+            if self._overlay.find_by_id(appointment_id) is None:
+                self.save(appointment)
+            return self._overlay.move(appointment_id, new_date, new_time)
+
+    def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        return [self.save(appointment) for appointment in appointments]
+
+    def bulk_load(self, appointments) -> int:
+        appointments = list(appointments)
+        with self._write_lock:
+            for appointment in appointments:
+                self._shadow(appointment.id)
+            return self._overlay.bulk_load(appointments)
+
+    def delete(self, appointment_id: int) -> None:
+        with self._write_lock:
+            self._shadow(appointment_id)
+            self._overlay.delete(appointment_id)
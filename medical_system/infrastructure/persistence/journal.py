@@ -0,0 +1,303 @@
+import json
+import os
+import re
+import struct
+import threading
+import zlib
+from typing import Iterable, List, Optional
+
+from medical_system.infrastructure.persistence.snapshot import (
+    appointment_from_row,
+    appointment_row,
+    doctor_from_row,
+    doctor_row,
+    patient_from_row,
+    patient_row,
+    read_snapshot,
+    user_from_row,
+    user_row,
+    write_snapshot,
+)
+
+# Cada registro: longitud del contenido, CRC32, tipo de entidad y operación,
+# seguidos de la fila posicional (la misma de los snapshots) en JSON.
+_HEADER = struct.Struct("<IIBB")
+
+OP_SAVE = 1
+OP_DELETE = 2
+
+KIND_DOCTOR = 1
+KIND_PATIENT = 2
+KIND_APPOINTMENT = 3
+KIND_USER = 4
+
+_ENCODERS = {
+    KIND_DOCTOR: doctor_row,
+    KIND_PATIENT: patient_row,
+    KIND_APPOINTMENT: appointment_row,
+    KIND_USER: user_row,
+}
+
+_SEGMENT = re.compile(r"^journal-(\d{8})\.log$")
+_SNAPSHOT = re.compile(r"^snapshot-(\d{8})\.json\.gz$")
+
+class Journal:
+    # Registro de escritura anticipada para los repositorios en memoria.
+    # Las altas, cambios y bajas se añaden al segmento actual sin esperar al
+    # disco; un hilo hace flush + fsync cada `fsync_interval` segundos, de modo
+    # que una caída pierde como mucho esa ventana. Cada `snapshot_every`
+    # registros se escribe un snapshot y se descartan los segmentos anteriores,
+    # lo que acota el tiempo de recuperación.
+
+    def __init__(
+        self,
+        directory: str,
+        appointment_repository,
+        patient_repository,
+        doctor_repository,
+        user_repository,
+        fsync_interval: float = 0.01,
+        snapshot_every: int = 100_000
+    ):
+        self.directory = directory
+        self.appointment_repo = appointment_repository
+        self.patient_repo = patient_repository
+        self.doctor_repo = doctor_repository
+        self.user_repo = user_repository
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._file = None
+        self._segment = 0
+        self._dirty = False
+        self._since_snapshot = 0
+        self._flusher: Optional[threading.Thread] = None
+
+    def open(self) -> int:
+        # Carga el último snapshot, reaplica los segmentos posteriores y abre
+        # uno nuevo. Devuelve el número de registros reaplicados.
+        os.makedirs(self.directory, exist_ok=True)
+        snapshots = self._list(_SNAPSHOT)
+        start = 0
+        if snapshots:
+            start = snapshots[-1]
+            self._load_snapshot(self._path(f"snapshot-{start:08d}.json.gz"))
+
+        replayed = 0
+        segments = [seq for seq in self._list(_SEGMENT) if seq >= start]
+        for seq in segments:
+            replayed += self._replay(self._path(f"journal-{seq:08d}.log"))
+
+        self._segment = max(segments + [start])
+        self._rotate()
+        self._since_snapshot = replayed
+        for repo in self._repositories():
+            repo.journal = self
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="journal-fsync", daemon=True)
+        self._flusher.start()
+        return replayed
+
+    def is_empty(self) -> bool:
+        if not os.path.isdir(self.directory):
+            return True
+        return not self._list(_SNAPSHOT) and all(
+            os.path.getsize(self._path(f"journal-{seq:08d}.log")) == 0
+            for seq in self._list(_SEGMENT)
+        )
+
+    def record_save(self, kind: int, entity) -> None:
+        self._append(kind, OP_SAVE, _ENCODERS[kind](entity))
+
+    def record_saves(self, kind: int, entities: Iterable) -> None:
+        encode = _ENCODERS[kind]
+        for entity in entities:
+            self._append(kind, OP_SAVE, encode(entity))
+
+    def record_delete(self, kind: int, entity_id: int) -> None:
+        self._append(kind, OP_DELETE, entity_id)
+
+    def sync(self) -> None:
+        with self._sync_lock:
+            with self._lock:
+                if self._file is None or not self._dirty:
+                    return
+                self._file.flush()
+                self._dirty = False
+                fd = self._file.fileno()
+            # fsync fuera de _lock: las escrituras siguen entrando en el búfer
+            # mientras el disco confirma el lote anterior.
+            os.fsync(fd)
+
+    def snapshot(self) -> str:
+        # Se abre un segmento nuevo antes de leer los repositorios. El snapshot
+        # puede incluir cambios de ese segmento, pero cada registro guarda el
+        # estado completo de la entidad y reaplicarlo es idempotente.
+        with self._snapshot_lock:
+            with self._sync_lock:
+                with self._lock:
+                    self._rotate()
+                    seq = self._segment
+                    self._since_snapshot = 0
+
+            path = self._path(f"snapshot-{seq:08d}.json.gz")
+            temporary = path + ".tmp.gz"
+            write_snapshot(
+                temporary,
+                self.doctor_repo.find_all(),
+                self.patient_repo.find_all(),
+                self.appointment_repo.iter_all(),
+                self.user_repo.list_all(),
+            )
+            with open(temporary, "rb") as handle:
+                os.fsync(handle.fileno())
+            os.replace(temporary, path)
+            self._fsync_directory()
+
+            for old in self._list(_SNAPSHOT):
+                if old < seq:
+                    os.remove(self._path(f"snapshot-{old:08d}.json.gz"))
+            for old in self._list(_SEGMENT):
+                if old < seq:
+                    os.remove(self._path(f"journal-{old:08d}.log"))
+            return path
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.sync()
+        for repo in self._repositories():
+            if getattr(repo, "journal", None) is self:
+                repo.journal = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, kind: int, op: int, row) -> None:
+        payload = json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        tag = bytes((kind, op))
+        header = _HEADER.pack(len(payload), zlib.crc32(payload, zlib.crc32(tag)), kind, op)
+        with self._lock:
+            self._file.write(header + payload)
+            self._dirty = True
+            self._since_snapshot += 1
+
+    def _flush_loop(self) -> None:
+        snapshot_thread = None
+        while not self._closed.wait(self.fsync_interval):
+            self.sync()
+            if (
+                self.snapshot_every
+                and self._since_snapshot >= self.snapshot_every
+                and (snapshot_thread is None or not snapshot_thread.is_alive())
+            ):
+                # En su propio hilo: un snapshot grande tarda segundos y no
+                # debe retrasar los fsync.
+                snapshot_thread = threading.Thread(target=self.snapshot, name="journal-snapshot", daemon=True)
+                snapshot_thread.start()
+        if snapshot_thread is not None:
+            snapshot_thread.join()
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._segment += 1
+        elif self._segment == 0 or os.path.exists(self._path(f"journal-{self._segment:08d}.log")):
+            self._segment += 1
+        self._file = open(self._path(f"journal-{self._segment:08d}.log"), "ab")
+        self._dirty = False
+        self._fsync_directory()
+
+    def _replay(self, path: str) -> int:
+        with open(path, "rb") as handle:
+            data = handle.read()
+
+        count = 0
+        offset = 0
+        while offset + _HEADER.size <= len(data):
+            length, checksum, kind, op = _HEADER.unpack_from(data, offset)
+            start = offset + _HEADER.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload, zlib.crc32(bytes((kind, op)))) != checksum:
+                break
+            self._apply(kind, op, json.loads(payload))
+            offset = start + length
+            count += 1
+
+        if offset < len(data):
+            # Cola escrita a medias durante una caída: se descarta.
+            with open(path, "r+b") as handle:
+                handle.truncate(offset)
+        return count
+
+    def _apply(self, kind: int, op: int, row) -> None:
+        if kind == KIND_APPOINTMENT:
+            if op == OP_DELETE:
+                self.appointment_repo.delete(row)
+                return
+            appointment = appointment_from_row(
+                row, self.doctor_repo.find_by_id(row[1]), self.patient_repo.find_by_id(row[2])
+            )
+            if self.appointment_repo.find_by_id(appointment.id):
+                self.appointment_repo.update(appointment)
+            else:
+                self.appointment_repo.bulk_load([appointment])
+        elif kind == KIND_DOCTOR:
+            self._upsert(self.doctor_repo, doctor_from_row(row))
+        elif kind == KIND_PATIENT:
+            self._upsert(self.patient_repo, patient_from_row(row))
+        elif kind == KIND_USER:
+            if op == OP_DELETE:
+                self.user_repo.delete(row)
+                return
+            user = user_from_row(row)
+            self.user_repo.delete(user.id)
+            self.user_repo.bulk_load([user])
+        else:
+            raise ValueError(f"Tipo de registro desconocido en el journal: {kind}")
+
+    @staticmethod
+    def _upsert(repo, entity) -> None:
+        if repo.find_by_id(entity.id):
+            repo.update(entity)
+        else:
+            repo.bulk_load([entity])
+
+    def _load_snapshot(self, path: str) -> None:
+        snapshot = read_snapshot(path)
+        self.doctor_repo.bulk_load(snapshot.doctors)
+        self.patient_repo.bulk_load(snapshot.patients)
+        self.appointment_repo.bulk_load(snapshot.appointments)
+        self.user_repo.bulk_load(snapshot.users)
+
+    def _repositories(self) -> List:
+        return [self.appointment_repo, self.patient_repo, self.doctor_repo, self.user_repo]
+
+    def _list(self, pattern) -> List[int]:
+        return sorted(
+            int(match.group(1))
+            for match in map(pattern.match, os.listdir(self.directory))
+            if match
+        )
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _fsync_directory(self) -> None:
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
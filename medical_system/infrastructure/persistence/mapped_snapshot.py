@@ -0,0 +1,237 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Dict, Iterable, List, Sequence
+
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.schedule_template import ScheduleTemplate
+from medical_system.infrastructure.persistence.in_memory.array_appointment_store import COLUMNS, ArrayAppointmentStore
+from medical_system.infrastructure.persistence.snapshot import Snapshot
+
+# Snapshot binario pensado para abrirse con mmap. Tras una cabecera fija
+# (firma, versión y longitud de la tabla de secciones) viene la tabla en JSON
+# y después las secciones, alineadas a 8 bytes. Cada sección es una columna
+# de ancho fijo: int32 little-endian ('i') o un byte por fila ('B'). Los
+# textos (nombres, emails, especialidades, plantillas horarias) van en una
+# tabla de cadenas y las columnas guardan su posición en ella.
+#
+# Las columnas de citas son exactamente las de ArrayAppointmentStore, ya
+# ordenadas e indexadas: abrir el snapshot no recorre las citas, el almacén
+# lee directamente de las páginas del fichero. Doctores y pacientes son pocos
+# en comparación y se cargan enteros. Los usuarios no forman parte de este
+# formato (siguen en el journal).
+
+MAPPED_SNAPSHOT_VERSION = 1
+MAPPED_SUFFIX = ".snap"
+
+_MAGIC = b"MEDSNAP\x00"
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+_NO_STRING = -1
+
+def is_mapped_snapshot(path: str) -> bool:
+    return path.endswith(MAPPED_SUFFIX)
+
+class _StringTable:
+    # Cadenas sin repetir: las especialidades y los dominios de email se
+    # repiten mucho entre filas.
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def add(self, value) -> int:
+        if value is None:
+            return _NO_STRING
+        position = self._index.get(value)
+        if position is None:
+            position = self._index[value] = len(self._values)
+            self._values.append(value)
+        return position
+
+    def sections(self) -> Dict[str, Sequence[int]]:
+        encoded = [value.encode("utf-8") for value in self._values]
+        offsets = array("i", [0])
+        total = 0
+        for value in encoded:
+            total += len(value)
+            offsets.append(total)
+        return {"strings": b"".join(encoded), "string_offsets": offsets}
+
+def write_mapped_snapshot(
+    path: str,
+    doctors: Iterable[Doctor],
+    patients: Iterable[Patient],
+    appointments: Iterable[Appointment]
+) -> None:
+    _check_platform()
+    strings = _StringTable()
+    doctors = list(doctors)
+    patients = list(patients)
+    epoch = date(1970, 1, 1).toordinal()
+
+    sections: Dict[str, Sequence[int]] = {
+        "doctor_ids": array("i", (d.id for d in doctors)),
+        "doctor_names": array("i", (strings.add(d.name) for d in doctors)),
+        "doctor_emails": array("i", (strings.add(str(d.email)) for d in doctors)),
+        "doctor_specialties": array("i", (strings.add(d.specialty) for d in doctors)),
+        "doctor_schedules": array("i", (
+            strings.add(json.dumps(d.schedule.to_dict(), separators=(",", ":")) if d.schedule else None)
+            for d in doctors
+        )),
+        "patient_ids": array("i", (p.id for p in patients)),
+        "patient_names": array("i", (strings.add(p.name) for p in patients)),
+        "patient_emails": array("i", (strings.add(str(p.email)) for p in patients)),
+        "patient_birth_days": array("i", (p.birth_date.toordinal() - epoch for p in patients)),
+    }
+    # El almacén columnar ordena las citas y construye sus índices; aquí solo
+    # se vuelcan sus columnas.
+    store = ArrayAppointmentStore(None, None)
+    store.bulk_load(appointments)
+    for name, column in store.columns().items():
+        sections["appointment_" + name] = column
+    sections.update(strings.sections())
+
+    table = {}
+    offset = 0
+    for name, column in sections.items():
+        typecode = "i" if isinstance(column, array) and column.typecode == "i" else "B"
+        table[name] = [offset, typecode, len(column)]
+        offset = _align(offset + len(column) * (4 if typecode == "i" else 1))
+    encoded_table = json.dumps({"sections": table}, separators=(",", ":")).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(encoded_table))
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(_PREAMBLE.pack(_MAGIC, MAPPED_SNAPSHOT_VERSION, len(encoded_table)))
+        handle.write(encoded_table)
+        handle.write(b"\x00" * (data_start - handle.tell()))
+        for name, column in sections.items():
+            handle.write(b"\x00" * (data_start + table[name][0] - handle.tell()))
+            handle.write(column)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+class MappedSnapshot:
+    # Vista de solo lectura de un snapshot binario. El fichero queda mapeado
+    # mientras haya algo que lo referencie (este objeto o un almacén creado
+    # con appointment_store).
+
+    def __init__(self, path: str):
+        _check_platform()
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, table_length = _PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} no es un snapshot binario")
+        if version != MAPPED_SNAPSHOT_VERSION:
+            raise ValueError(f"Versión de snapshot no soportada: {version}")
+        table = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + table_length])
+        self._data_start = _align(_PREAMBLE.size + table_length)
+        self._sections = table["sections"]
+        self._view = memoryview(self._mmap)
+        self._strings = self._column("strings")
+        self._string_offsets = self._column("string_offsets")
+
+    def doctors(self) -> List[Doctor]:
+        ids, names, emails, specialties, schedules = (
+            self._column(name) for name in
+            ("doctor_ids", "doctor_names", "doctor_emails", "doctor_specialties", "doctor_schedules")
+        )
+        string = self._string
+        return [
+            Doctor.restore(
+                ids[row],
+                name=string(names[row]),
+                email=Email.restore(string(emails[row])),
+                specialty=string(specialties[row]),
+                schedule=(
+                    ScheduleTemplate.from_dict(json.loads(string(schedules[row])))
+                    if schedules[row] != _NO_STRING else None
+                )
+            )
+            for row in range(len(ids))
+        ]
+
+    def patients(self) -> List[Patient]:
+        ids, names, emails, birth_days = (
+            self._column(name) for name in
+            ("patient_ids", "patient_names", "patient_emails", "patient_birth_days")
+        )
+        string = self._string
+        epoch = date(1970, 1, 1).toordinal()
+        return [
+            Patient.restore(
+                ids[row],
+                name=string(names[row]),
+                email=Email.restore(string(emails[row])),
+                birth_date=date.fromordinal(birth_days[row] + epoch)
+            )
+            for row in range(len(ids))
+        ]
+
+    def appointment_store(self, patient_repository, doctor_repository) -> ArrayAppointmentStore:
+        # Las columnas son vistas sobre el mmap, sin copia; el filtro por
+        # estado busca directamente en el mmap.
+        columns = {name: self._column("appointment_" + name) for name, _ in COLUMNS}
+        status_offset = self._data_start + self._sections["appointment_statuses"][0]
+        return ArrayAppointmentStore.from_columns(
+            patient_repository, doctor_repository, columns,
+            status_buffer=self._mmap, status_offset=status_offset
+        )
+
+    def _column(self, name: str) -> memoryview:
+        offset, typecode, count = self._sections[name]
+        start = self._data_start + offset
+        if typecode == "i":
+            return self._view[start:start + 4 * count].cast("i")
+        return self._view[start:start + count]
+
+    def _string(self, index: int) -> str:
+        offsets = self._string_offsets
+        return str(self._strings[offsets[index]:offsets[index + 1]], "utf-8")
+
+def read_mapped_snapshot(path: str) -> Snapshot:
+    # Todas las entidades materializadas, como read_snapshot.
+    mapped = MappedSnapshot(path)
+    doctors = {doctor.id: doctor for doctor in mapped.doctors()}
+    patients = {patient.id: patient for patient in mapped.patients()}
+    store = mapped.appointment_store(_Directory(patients), _Directory(doctors))
+    return Snapshot(
+        doctors=list(doctors.values()),
+        patients=list(patients.values()),
+        appointments=list(store.iter_all())
+    )
+
+class _Directory:
+    # Lo único que el almacén pide a los repositorios de doctores y pacientes.
+
+    def __init__(self, entities: Dict[int, object]):
+        self.find_by_id = entities.get
+
+def load_mapped_snapshot(path: str, appointment_repository, patient_repository, doctor_repository) -> MappedSnapshot:
+    # Carga completa en repositorios mutables (p. ej. con journal), igual que
+    # load_snapshot pero sin parsear JSON.
+    snapshot = MappedSnapshot(path)
+    doctor_repository.bulk_load(snapshot.doctors())
+    patient_repository.bulk_load(snapshot.patients())
+    store = snapshot.appointment_store(patient_repository, doctor_repository)
+    appointment_repository.bulk_load(store.iter_all())
+    return snapshot
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+def _check_platform() -> None:
+    # Las columnas se leen con memoryview.cast, en el orden de bytes de la
+    # máquina: el formato es little-endian con enteros de 4 bytes.
+    if sys.byteorder != "little" or array("i").itemsize != 4:
+        raise RuntimeError("El snapshot binario requiere una plataforma little-endian con int de 4 bytes")
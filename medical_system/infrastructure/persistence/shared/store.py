@@ -0,0 +1,130 @@
+import os
+import secrets
+from dataclasses import fields
+from multiprocessing.managers import BaseManager, BaseProxy
+from typing import Iterator, Optional, Tuple
+
+from medical_system.infrastructure.persistence.in_memory.bootstrap import build_in_memory_repositories
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+
+# Un proceso propietario de los repositorios en memoria los sirve por un
+# socket Unix; cada worker de uvicorn habla con él a través de proxies. Las
+# reglas de concurrencia (reserve_slot, cerrojos por doctor y paciente) se
+# aplican en un único sitio, así que todos los workers ven los mismos datos.
+
+# Métodos que en memoria o SQLite asignan el id (o normalizan campos) sobre la
+# propia entidad: el proxy copia el resultado remoto en el objeto del llamante.
+_IN_PLACE = {"save", "update", "reserve_slot"}
+
+# El protocolo de multiprocessing.managers es pickle: quien conozca la clave
+# puede ejecutar código dentro del almacén. Sin STORE_AUTHKEY no hay clave por
+# defecto; el almacén genera una aleatoria y la deja junto al socket en un
+# fichero que solo su usuario puede leer.
+AUTHKEY_SUFFIX = ".key"
+
+def _exposed(repository_class) -> Tuple[str, ...]:
+    return tuple(sorted(
+        name for name, value in vars(repository_class).items()
+        if callable(value) and not name.startswith("_")
+    ))
+
+def _remote(method: str):
+    if method in _IN_PLACE:
+        def call(self, entity):
+            stored = self._callmethod(method, (entity,))
+            # Las entidades usan __slots__: se copia campo a campo.
+            for field in fields(stored):
+                setattr(entity, field.name, getattr(stored, field.name))
+            return entity
+    else:
+        def call(self, *args, **kwargs):
+            return self._callmethod(method, args, kwargs)
+    call.__name__ = method
+    return call
+
+def _proxy_type(name: str, repository_class, local=()):
+    exposed = _exposed(repository_class)
+    namespace = {"_exposed_": exposed}
+    namespace.update((method, _remote(method)) for method in exposed if method not in local)
+    return type(name, (BaseProxy,), namespace)
+
+class SharedAppointmentRepository(_proxy_type("_AppointmentProxy", InMemoryAppointmentRepository, local=("iter_all",))):
+    ITER_PAGE_SIZE = 500
+
+    def iter_all(self) -> Iterator:
+        # Un generador no puede cruzar el socket: se recorre por páginas.
+        after_key = None
+        while True:
+            page = self.find_page(after_key, self.ITER_PAGE_SIZE)
+            yield from page.items
+            if page.next_key is None:
+                return
+            after_key = page.next_key
+
+SharedPatientRepository = _proxy_type("SharedPatientRepository", InMemoryPatientRepository)
+SharedDoctorRepository = _proxy_type("SharedDoctorRepository", InMemoryDoctorRepository)
+SharedUserRepository = _proxy_type("SharedUserRepository", InMemoryUserRepository)
+
+_TYPES = (
+    ("appointments", SharedAppointmentRepository),
+    ("patients", SharedPatientRepository),
+    ("doctors", SharedDoctorRepository),
+    ("users", SharedUserRepository),
+)
+
+class _StoreClient(BaseManager):
+    pass
+
+class _StoreServer(BaseManager):
+    pass
+
+for _typeid, _proxytype in _TYPES:
+    _StoreClient.register(_typeid, proxytype=_proxytype)
+
+def store_authkey(address: str, authkey: Optional[str] = None, create: bool = False) -> bytes:
+    # authkey es STORE_AUTHKEY; con create=True (el proceso del almacén) se
+    # escribe una clave nueva y los workers la leen después.
+    if authkey:
+        return authkey.encode()
+    path = address + AUTHKEY_SUFFIX
+    if create:
+        key = secrets.token_hex(32)
+        if os.path.lexists(path):
+            os.remove(path)
+        # O_EXCL: no se sigue un enlace ni se reutiliza un fichero ajeno.
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, "w") as handle:
+            handle.write(key)
+        return key.encode()
+    try:
+        with open(path) as handle:
+            return handle.read().strip().encode()
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"No hay STORE_AUTHKEY ni fichero de clave en {path}: arranca antes el almacén "
+            "(python -m medical_system.tools.store) o define STORE_AUTHKEY"
+        ) from None
+
+def serve(
+    address: str,
+    authkey: bytes,
+    seed_snapshot: Optional[str] = None,
+    journal_dir: Optional[str] = None
+) -> None:
+    # Bloquea sirviendo peticiones; el servidor atiende cada conexión en su
+    # propio hilo. Las lecturas no toman los cerrojos de reserva.
+    repositories = build_in_memory_repositories(seed_snapshot=seed_snapshot, journal_dir=journal_dir)
+    for (typeid, proxytype), repository in zip(_TYPES, repositories):
+        _StoreServer.register(typeid, callable=lambda repository=repository: repository, proxytype=proxytype)
+    manager = _StoreServer(address=address, authkey=authkey)
+    manager.get_server().serve_forever()
+
+def connect_store(address: str, authkey: bytes) -> Tuple[
+    SharedAppointmentRepository, SharedPatientRepository, SharedDoctorRepository, SharedUserRepository
+]:
+    client = _StoreClient(address=address, authkey=authkey)
+    client.connect()
+    return client.appointments(), client.patients(), client.doctors(), client.users()
@@ -0,0 +1,217 @@
+from datetime import date, datetime, time
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.page import Page
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import FULL_DAY_MASK, iter_bits, slot_time, span_mask
+from medical_system.infrastructure.persistence.sqlite.aiosqlite_database import AiosqliteDatabase
+from medical_system.infrastructure.persistence.sqlite.sqlite_appointment_repository import (
+    _MOVE,
+    _MOVE_OCCUPANCY,
+    _MOVE_SAME_DAY,
+    _MOVE_SOURCE,
+    _DAY_TAKEN,
+    _OCCUPANCY,
+    _SAME_DAY,
+    _SELECT,
+    _SLOT_TAKEN,
+    _UPSERT,
+    SqliteAppointmentRepository
+)
+
+# Mismo esquema y mismas consultas que SqliteAppointmentRepository; solo
+# cambia el driver, que aquí es asíncrono.
+_to_row = SqliteAppointmentRepository._to_row
+_to_entities = SqliteAppointmentRepository._to_entities
+_occupancy = SqliteAppointmentRepository._occupancy
+_grid_query = SqliteAppointmentRepository._grid_query
+_page_query = SqliteAppointmentRepository._page_query
+_where = SqliteAppointmentRepository._where
+_occupancy_grid = SqliteAppointmentRepository._occupancy_grid
+
+class AiosqliteAppointmentRepository(AsyncAppointmentRepository):
+    ITER_BATCH_SIZE = SqliteAppointmentRepository.ITER_BATCH_SIZE
+
+    def __init__(self, database: AiosqliteDatabase):
+        self._db = database
+
+    async def find_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        rows = await self._db.query(_SELECT + "WHERE a.id = ?", (appointment_id,))
+        return _to_entities(rows)[0] if rows else None
+
+    async def save(self, appointment: Appointment) -> Appointment:
+        async with self._db.transaction() as conn:
+            cursor = await conn.execute(_UPSERT, _to_row(appointment))
+            if appointment.id is None:
+                appointment.id = cursor.lastrowid
+        return appointment
+
+    async def reserve_slot(self, appointment: Appointment) -> Appointment:
+        async with self._db.transaction() as conn:
+            error = await self._conflict(conn, appointment)
+            if error:
+                raise ValueError(error)
+            cursor = await conn.execute(_UPSERT, _to_row(appointment))
+            if appointment.id is None:
+                appointment.id = cursor.lastrowid
+        return appointment
+
+    async def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        results: List[Union[Appointment, str]] = []
+        async with self._db.transaction() as conn:
+            for appointment in appointments:
+                error = await self._conflict(conn, appointment)
+                if error:
+                    results.append(error)
+                    continue
+                cursor = await conn.execute(_UPSERT, _to_row(appointment))
+                if appointment.id is None:
+                    appointment.id = cursor.lastrowid
+                results.append(appointment)
+        return results
+
+    @staticmethod
+    async def _conflict(conn, appointment: Appointment) -> Optional[str]:
+        day = appointment.date.isoformat()
+        async with conn.execute(
+            _OCCUPANCY, (appointment.doctor.id, day, AppointmentStatus.CANCELLED.value)
+        ) as cursor:
+            if _occupancy(await cursor.fetchall()) & appointment.slot_mask:
+                return _SLOT_TAKEN
+        async with conn.execute(_SAME_DAY, (appointment.patient.id, day)) as cursor:
+            if await cursor.fetchone():
+                return _DAY_TAKEN
+        return None
+
+    async def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        async with self._db.transaction() as conn:
+            async with conn.execute(_MOVE_SOURCE, (appointment_id,)) as cursor:
+                source = await cursor.fetchone()
+            if source is None:
+                raise ValueError("Appointment not found")
+            if source["status"] != AppointmentStatus.CANCELLED.value:
+                async with conn.execute(
+                    _MOVE_OCCUPANCY,
+                    (source["doctor_id"], new_date.isoformat(), AppointmentStatus.CANCELLED.value, appointment_id),
+                ) as cursor:
+                    if _occupancy(await cursor.fetchall()) & span_mask(new_time, source["duration_minutes"]):
+                        raise ValueError(_SLOT_TAKEN)
+            if new_date.isoformat() != source["date"]:
+                async with conn.execute(
+                    _MOVE_SAME_DAY, (source["patient_id"], new_date.isoformat(), appointment_id)
+                ) as cursor:
+                    if await cursor.fetchone():
+                        raise ValueError(_DAY_TAKEN)
+            await conn.execute(_MOVE, (new_date.isoformat(), new_time.isoformat(), appointment_id))
+        return await self.find_by_id(appointment_id)
+
+    async def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        appointments = list(appointments)
+        async with self._db.transaction() as conn:
+            async with conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM appointments") as cursor:
+                next_id = (await cursor.fetchone())[0]
+            for appointment in appointments:
+                if appointment.id is None:
+                    appointment.id = next_id
+                next_id = max(next_id, appointment.id + 1)
+            await conn.executemany(_UPSERT, [_to_row(appointment) for appointment in appointments])
+        return appointments
+
+    async def find_by_doctor_and_date(self, doctor_id: int, date: date) -> List[Appointment]:
+        rows = await self._db.query(
+            _SELECT + "WHERE a.doctor_id = ? AND a.date = ? ORDER BY a.time",
+            (doctor_id, date.isoformat()),
+        )
+        return _to_entities(rows)
+
+    async def find_by_patient(self, patient_id: int) -> List[Appointment]:
+        rows = await self._db.query(
+            _SELECT + "WHERE a.patient_id = ? ORDER BY a.date, a.time",
+            (patient_id,),
+        )
+        return _to_entities(rows)
+
+    async def find_by_patient_and_date(self, patient_id: int, date: date) -> List[Appointment]:
+        rows = await self._db.query(
+            _SELECT + "WHERE a.patient_id = ? AND a.date = ? ORDER BY a.time",
+            (patient_id, date.isoformat()),
+        )
+        return _to_entities(rows)
+
+    async def find_by_doctor_patient_datetime(
+        self, doctor_id: int, patient_id: int, date: date, time: time
+    ) -> Optional[Appointment]:
+        rows = await self._db.query(
+            _SELECT + "WHERE a.doctor_id = ? AND a.date = ? AND a.time = ? AND a.patient_id = ? LIMIT 1",
+            (doctor_id, date.isoformat(), time.isoformat(), patient_id),
+        )
+        return _to_entities(rows)[0] if rows else None
+
+    async def find_patient_appointments_at_same_time(
+        self, patient_id: int, date: date, time: time
+    ) -> List[Appointment]:
+        rows = await self._db.query(
+            _SELECT + "WHERE a.patient_id = ? AND a.date = ? AND a.time = ?",
+            (patient_id, date.isoformat(), time.isoformat()),
+        )
+        return _to_entities(rows)
+
+    async def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        return _occupancy(await self._db.query(
+            _OCCUPANCY, (doctor_id, date.isoformat(), AppointmentStatus.CANCELLED.value)
+        ))
+
+    async def get_occupancy_masks(self, doctor_id: int, start_date: date, end_date: date) -> Dict[date, int]:
+        rows = await self._db.query(
+            "SELECT date, time, duration_minutes FROM appointments "
+            "WHERE doctor_id = ? AND date BETWEEN ? AND ? AND status != ?",
+            (doctor_id, start_date.isoformat(), end_date.isoformat(), AppointmentStatus.CANCELLED.value),
+        )
+        masks: Dict[date, int] = {}
+        for row in rows:
+            day = date.fromisoformat(row["date"])
+            masks[day] = masks.get(day, 0) | span_mask(time.fromisoformat(row["time"]), row["duration_minutes"])
+        return masks
+
+    async def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        return _occupancy_grid(await self._db.query(*_grid_query(doctor_ids, start_date, end_date)))
+
+    async def find_available_slots(self, doctor_id: int, date: date) -> List[datetime]:
+        free = FULL_DAY_MASK & ~await self.get_occupancy_mask(doctor_id, date)
+        return [datetime.combine(date, slot_time(index)) for index in iter_bits(free)]
+
+    async def find_all(self, **filters) -> List[Appointment]:
+        clauses, params = _where(filters)
+        sql = _SELECT
+        if clauses:
+            sql += "WHERE " + " AND ".join(clauses) + " "
+        rows = await self._db.query(sql + "ORDER BY a.id", params)
+        return _to_entities(rows)
+
+    async def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        rows = await self._db.query(*_page_query(after_key, limit, filters))
+        return Page.from_overfetch(
+            _to_entities(rows), limit, lambda apt: (apt.date, apt.time, apt.id)
+        )
+
+    async def iter_all(self) -> AsyncIterator[Appointment]:
+        last_id = 0
+        while True:
+            rows = await self._db.query(
+                _SELECT + "WHERE a.id > ? ORDER BY a.id LIMIT ?",
+                (last_id, self.ITER_BATCH_SIZE),
+            )
+            if not rows:
+                return
+            for appointment in _to_entities(rows):
+                yield appointment
+            last_id = rows[-1]["id"]
+
+    async def delete(self, appointment_id: int) -> None:
+        async with self._db.transaction() as conn:
+            await conn.execute("DELETE FROM appointments WHERE id = ?", (appointment_id,))
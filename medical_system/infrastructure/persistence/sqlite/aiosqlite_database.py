@@ -0,0 +1,78 @@
+import asyncio
+import itertools
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+from medical_system.infrastructure.persistence.sqlite.database import DROPPED_INDEXES, MIGRATIONS, SCHEMA
+
+class AiosqliteDatabase:
+    # Contrapartida asíncrona de SqliteDatabase sobre aiosqlite: cada conexión
+    # ejecuta sus consultas en un hilo propio y el event loop solo espera el
+    # resultado. En WAL los lectores no se bloquean entre sí, así que las
+    # lecturas se reparten entre varias conexiones y las escrituras van por una.
+    READ_CONNECTIONS = 4
+
+    def __init__(self, path: str):
+        if path == ":memory:":
+            raise ValueError("AiosqliteDatabase necesita un fichero: una base en memoria no se comparte entre conexiones")
+        self.path = path
+        self._writer = None
+        self._readers: List = []
+        self._next_reader = None
+        self._open_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+
+    async def _open(self):
+        import aiosqlite
+
+        conn = await aiosqlite.connect(self.path, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    async def _ensure_open(self) -> None:
+        if self._writer is not None:
+            return
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+            writer = await self._open()
+            await writer.executescript(SCHEMA)
+            for table, column, statement in MIGRATIONS:
+                async with writer.execute(f"PRAGMA table_info({table})") as cursor:
+                    columns = {row[1] for row in await cursor.fetchall()}
+                if column not in columns:
+                    await writer.execute(statement)
+            for index in DROPPED_INDEXES:
+                await writer.execute(f"DROP INDEX IF EXISTS {index}")
+            self._readers = [await self._open() for _ in range(self.READ_CONNECTIONS)]
+            self._next_reader = itertools.cycle(self._readers)
+            self._writer = writer
+
+    async def query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        await self._ensure_open()
+        async with next(self._next_reader).execute(sql, params) as cursor:
+            return await cursor.fetchall()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator:
+        await self._ensure_open()
+        async with self._write_lock:
+            conn = self._writer
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                await conn.execute("ROLLBACK")
+                raise
+            await conn.execute("COMMIT")
+
+    async def close(self) -> None:
+        for conn in [self._writer] + self._readers:
+            if conn is not None:
+                await conn.close()
+        self._writer = None
+        self._readers = []
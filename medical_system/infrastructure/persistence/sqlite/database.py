@@ -0,0 +1,157 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS patients (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_key TEXT NOT NULL UNIQUE,
+    birth_date TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS doctors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_key TEXT NOT NULL UNIQUE,
+    specialty TEXT NOT NULL,
+    specialty_key TEXT NOT NULL,
+    schedule TEXT
+);
+
+CREATE INDEX IF NOT EXISTS ix_doctors_specialty ON doctors (specialty_key, id);
+
+CREATE TABLE IF NOT EXISTS appointments (
+    id INTEGER PRIMARY KEY,
+    doctor_id INTEGER NOT NULL REFERENCES doctors (id),
+    patient_id INTEGER NOT NULL REFERENCES patients (id),
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration_minutes INTEGER NOT NULL DEFAULT 30,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+-- Índices cubrientes: incluyen todas las columnas de la tabla, de modo que
+-- cada buscador (y la ocupación de un día) se resuelve con una única
+-- búsqueda en el índice sin volver a la tabla. El id va justo detrás de
+-- (date, time) para que las páginas de un doctor o de un paciente salgan ya
+-- en orden (fecha, hora, id). Al añadir una columna a la tabla hay que
+-- añadirla aquí.
+CREATE INDEX IF NOT EXISTS ix_appointments_doctor_day
+    ON appointments (doctor_id, date, time, id, patient_id, status, duration_minutes, version);
+
+CREATE INDEX IF NOT EXISTS ix_appointments_patient_day
+    ON appointments (patient_id, date, time, id, doctor_id, status, duration_minutes, version);
+
+-- Orden global (fecha, hora, id) de la paginación por cursor. Sin más
+-- columnas: el rowid va justo detrás de (date, time) y el índice sirve el
+-- ORDER BY completo, sin ordenar en un B-tree temporal la cola de la tabla.
+CREATE INDEX IF NOT EXISTS ix_appointments_page
+    ON appointments (date, time);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    is_active INTEGER NOT NULL,
+    is_admin INTEGER NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    last_login TEXT,
+    metadata TEXT NOT NULL
+);
+"""
+
+# Columnas añadidas después de crear el esquema: se agregan al abrir una base
+# que todavía no las tiene.
+MIGRATIONS = (
+    ("doctors", "schedule", "ALTER TABLE doctors ADD COLUMN schedule TEXT"),
+    ("appointments", "duration_minutes",
+     "ALTER TABLE appointments ADD COLUMN duration_minutes INTEGER NOT NULL DEFAULT 30"),
+    ("appointments", "version",
+     "ALTER TABLE appointments ADD COLUMN version INTEGER NOT NULL DEFAULT 1"),
+)
+
+# Índices sustituidos por otros con distinta definición: se eliminan al abrir
+# una base creada con una versión anterior del esquema.
+DROPPED_INDEXES = (
+    "ix_appointments_date_time",
+    "ix_appointments_doctor_date",
+    "ix_appointments_patient_date",
+)
+
+
+def missing_columns(conn) -> List[str]:
+    statements = []
+    for table, column, statement in MIGRATIONS:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        if column not in columns:
+            statements.append(statement)
+    return statements
+
+
+class SqliteDatabase:
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._shared = None
+        if path == ":memory:":
+            # Una base en memoria solo existe dentro de su conexión, así que
+            # todos los hilos deben compartir la misma.
+            self._shared = self._open()
+        with self._write_lock:
+            self.connection.executescript(SCHEMA)
+            for statement in missing_columns(self.connection):
+                self.connection.execute(statement)
+            for index in DROPPED_INDEXES:
+                self.connection.execute(f"DROP INDEX IF EXISTS {index}")
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._shared is not None:
+            return self._shared
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = self._open()
+            self._local.connection = conn
+        return conn
+
+    def query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        if self._shared is not None:
+            with self._write_lock:
+                return self._shared.execute(sql, params).fetchall()
+        return self.connection.execute(sql, params).fetchall()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        # WAL permite lectores concurrentes; solo los escritores se serializan.
+        with self._write_lock:
+            conn = self.connection
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        conn = self._shared or getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,386 @@
+from datetime import date, datetime, time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.page import Page
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import FULL_DAY_MASK, iter_bits, slot_time, span_mask
+from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+from medical_system.infrastructure.persistence.sqlite.sqlite_doctor_repository import SqliteDoctorRepository
+
+_SELECT = (
+    "SELECT a.id, a.date, a.time, a.status, a.duration_minutes, a.version, a.patient_id, a.doctor_id, "
+    "p.name AS patient_name, p.email AS patient_email, p.birth_date AS patient_birth_date, "
+    "d.name AS doctor_name, d.email AS doctor_email, d.specialty AS doctor_specialty, "
+    "d.schedule AS doctor_schedule "
+    "FROM appointments a "
+    "JOIN patients p ON p.id = a.patient_id "
+    "JOIN doctors d ON d.id = a.doctor_id "
+)
+
+_FILTER_CLAUSES = {
+    'id': 'a.id = ?',
+    'date': 'a.date = ?',
+    'time': 'a.time = ?',
+    'status': 'a.status = ?',
+    'patient': 'a.patient_id = ?',
+    'doctor': 'a.doctor_id = ?',
+    'patient_id': 'a.patient_id = ?',
+    'doctor_id': 'a.doctor_id = ?',
+    'start_date': 'a.date >= ?',
+    'end_date': 'a.date <= ?',
+}
+
+_UPSERT = (
+    "INSERT INTO appointments (id, doctor_id, patient_id, date, time, status, duration_minutes, version) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET doctor_id = excluded.doctor_id, "
+    "patient_id = excluded.patient_id, date = excluded.date, "
+    "time = excluded.time, status = excluded.status, "
+    "duration_minutes = excluded.duration_minutes, version = excluded.version"
+)
+
+# Citas no canceladas de un doctor en un día; cada una ocupa los bloques que
+# cubre su duración.
+_OCCUPANCY = (
+    "SELECT time, duration_minutes FROM appointments "
+    "WHERE doctor_id = ? AND date = ? AND status != ?"
+)
+_SAME_DAY = "SELECT 1 FROM appointments WHERE patient_id = ? AND date = ? LIMIT 1"
+
+_SLOT_TAKEN = "El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)"
+_DAY_TAKEN = "Solo puedes tener una cita por día"
+
+# move(): la cita a mover, la ocupación del día destino sin ella y el cambio
+# de fecha y hora con la versión incrementada.
+_MOVE_SOURCE = "SELECT doctor_id, patient_id, date, status, duration_minutes FROM appointments WHERE id = ?"
+_MOVE_OCCUPANCY = _OCCUPANCY + " AND id != ?"
+_MOVE_SAME_DAY = "SELECT 1 FROM appointments WHERE patient_id = ? AND date = ? AND id != ? LIMIT 1"
+_MOVE = "UPDATE appointments SET date = ?, time = ?, version = version + 1 WHERE id = ?"
+
+class SqliteAppointmentRepository(AppointmentRepository):
+    ITER_BATCH_SIZE = 500
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def find_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        rows = self._db.query(_SELECT + "WHERE a.id = ?", (appointment_id,))
+        return self._to_entities(rows)[0] if rows else None
+
+    def save(self, appointment: Appointment) -> Appointment:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(_UPSERT, self._to_row(appointment))
+            if appointment.id is None:
+                appointment.id = cursor.lastrowid
+        return appointment
+
+    def reserve_slot(self, appointment: Appointment) -> Appointment:
+        # BEGIN IMMEDIATE toma el bloqueo de escritura antes de comprobar, así
+        # ninguna otra reserva puede colarse entre la comprobación y el alta.
+        with self._db.transaction() as conn:
+            error = self._conflict(conn, appointment)
+            if error:
+                raise ValueError(error)
+            cursor = conn.execute(_UPSERT, self._to_row(appointment))
+            if appointment.id is None:
+                appointment.id = cursor.lastrowid
+        return appointment
+
+    def reserve_many(self, appointments: List[Appointment]) -> List[Union[Appointment, str]]:
+        # Una sola transacción para todo el lote: cada fila se vuelve a
+        # comprobar ya con las anteriores insertadas y se confirma una vez.
+        results: List[Union[Appointment, str]] = []
+        with self._db.transaction() as conn:
+            for appointment in appointments:
+                error = self._conflict(conn, appointment)
+                if error:
+                    results.append(error)
+                    continue
+                cursor = conn.execute(_UPSERT, self._to_row(appointment))
+                if appointment.id is None:
+                    appointment.id = cursor.lastrowid
+                results.append(appointment)
+        return results
+
+    @classmethod
+    def _conflict(cls, conn, appointment: Appointment) -> Optional[str]:
+        # Dentro de la transacción de escritura: motivo del rechazo o None.
+        day = appointment.date.isoformat()
+        occupancy = cls._occupancy(conn.execute(
+            _OCCUPANCY, (appointment.doctor.id, day, AppointmentStatus.CANCELLED.value)
+        ).fetchall())
+        if occupancy & appointment.slot_mask:
+            return _SLOT_TAKEN
+        if conn.execute(_SAME_DAY, (appointment.patient.id, day)).fetchone():
+            return _DAY_TAKEN
+        return None
+
+    def move(self, appointment_id: int, new_date: date, new_time: time) -> Appointment:
+        # Comprobación y cambio en la misma transacción BEGIN IMMEDIATE, como
+        # reserve_slot. Solo se reescriben fecha, hora y versión.
+        with self._db.transaction() as conn:
+            source = conn.execute(_MOVE_SOURCE, (appointment_id,)).fetchone()
+            if source is None:
+                raise ValueError("Appointment not found")
+            if source["status"] != AppointmentStatus.CANCELLED.value:
+                occupancy = self._occupancy(conn.execute(
+                    _MOVE_OCCUPANCY,
+                    (source["doctor_id"], new_date.isoformat(), AppointmentStatus.CANCELLED.value, appointment_id),
+                ).fetchall())
+                if occupancy & span_mask(new_time, source["duration_minutes"]):
+                    raise ValueError(_SLOT_TAKEN)
+            if new_date.isoformat() != source["date"] and conn.execute(
+                _MOVE_SAME_DAY, (source["patient_id"], new_date.isoformat(), appointment_id)
+            ).fetchone():
+                raise ValueError(_DAY_TAKEN)
+            conn.execute(_MOVE, (new_date.isoformat(), new_time.isoformat(), appointment_id))
+        return self.find_by_id(appointment_id)
+
+    def save_many(self, appointments: List[Appointment]) -> List[Appointment]:
+        appointments = list(appointments)
+        self.bulk_load(appointments)
+        return appointments
+
+    def bulk_load(self, appointments: Iterable[Appointment]) -> int:
+        # Carga masiva (semillas, snapshots) en una única transacción con
+        # executemany; los ids se asignan aquí en lugar de leer lastrowid.
+        with self._db.transaction() as conn:
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM appointments").fetchone()[0]
+
+            def rows():
+                nonlocal next_id
+                for appointment in appointments:
+                    if appointment.id is None:
+                        appointment.id = next_id
+                    next_id = max(next_id, appointment.id + 1)
+                    yield self._to_row(appointment)
+
+            cursor = conn.executemany(_UPSERT, rows())
+        return cursor.rowcount
+
+    def update(self, appointment: Appointment) -> Appointment:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE appointments SET doctor_id = ?, patient_id = ?, date = ?, time = ?, "
+                "status = ?, duration_minutes = ?, version = ? WHERE id = ?",
+                self._to_row(appointment)[1:] + (appointment.id,),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError("Appointment not found")
+        return appointment
+
+    def find_by_doctor_and_date(self, doctor_id: int, date: date) -> List[Appointment]:
+        rows = self._db.query(
+            _SELECT + "WHERE a.doctor_id = ? AND a.date = ? ORDER BY a.time",
+            (doctor_id, date.isoformat()),
+        )
+        return self._to_entities(rows)
+
+    def find_by_patient(self, patient_id: int) -> List[Appointment]:
+        rows = self._db.query(
+            _SELECT + "WHERE a.patient_id = ? ORDER BY a.date, a.time",
+            (patient_id,),
+        )
+        return self._to_entities(rows)
+
+    def find_by_patient_and_date(self, patient_id: int, date: date) -> List[Appointment]:
+        rows = self._db.query(
+            _SELECT + "WHERE a.patient_id = ? AND a.date = ? ORDER BY a.time",
+            (patient_id, date.isoformat()),
+        )
+        return self._to_entities(rows)
+
+    def find_by_doctor_patient_datetime(
+        self, doctor_id: int, patient_id: int, date: date, time: time
+    ) -> Optional[Appointment]:
+        rows = self._db.query(
+            _SELECT + "WHERE a.doctor_id = ? AND a.date = ? AND a.time = ? AND a.patient_id = ? LIMIT 1",
+            (doctor_id, date.isoformat(), time.isoformat(), patient_id),
+        )
+        return self._to_entities(rows)[0] if rows else None
+
+    def find_patient_appointments_at_same_time(
+        self, patient_id: int, date: date, time: time
+    ) -> List[Appointment]:
+        rows = self._db.query(
+            _SELECT + "WHERE a.patient_id = ? AND a.date = ? AND a.time = ?",
+            (patient_id, date.isoformat(), time.isoformat()),
+        )
+        return self._to_entities(rows)
+
+    def get_occupancy_mask(self, doctor_id: int, date: date) -> int:
+        return self._occupancy(self._db.query(
+            _OCCUPANCY, (doctor_id, date.isoformat(), AppointmentStatus.CANCELLED.value)
+        ))
+
+    def get_occupancy_masks(self, doctor_id: int, start_date: date, end_date: date) -> Dict[date, int]:
+        rows = self._db.query(
+            "SELECT date, time, duration_minutes FROM appointments "
+            "WHERE doctor_id = ? AND date BETWEEN ? AND ? AND status != ?",
+            (doctor_id, start_date.isoformat(), end_date.isoformat(), AppointmentStatus.CANCELLED.value),
+        )
+        masks: Dict[date, int] = {}
+        for row in rows:
+            day = date.fromisoformat(row["date"])
+            masks[day] = masks.get(day, 0) | span_mask(time.fromisoformat(row["time"]), row["duration_minutes"])
+        return masks
+
+    def get_occupancy_grid(
+        self, doctor_ids: Sequence[int], start_date: date, end_date: date
+    ) -> Dict[Tuple[int, date], int]:
+        return self._occupancy_grid(self._db.query(*self._grid_query(doctor_ids, start_date, end_date)))
+
+    def find_available_slots(self, doctor_id: int, date: date) -> List[datetime]:
+        free = FULL_DAY_MASK & ~self.get_occupancy_mask(doctor_id, date)
+        return [datetime.combine(date, slot_time(index)) for index in iter_bits(free)]
+
+    def find_all(self, **filters) -> List[Appointment]:
+        clauses, params = self._where(filters)
+        sql = _SELECT
+        if clauses:
+            sql += "WHERE " + " AND ".join(clauses) + " "
+        rows = self._db.query(sql + "ORDER BY a.id", params)
+        return self._to_entities(rows)
+
+    def find_page(
+        self, after_key: Optional[Tuple[date, time, int]], limit: int, **filters
+    ) -> Page[Appointment]:
+        rows = self._db.query(*self._page_query(after_key, limit, filters))
+        return Page.from_overfetch(
+            self._to_entities(rows), limit, lambda apt: (apt.date, apt.time, apt.id)
+        )
+
+    def iter_all(self) -> Iterator[Appointment]:
+        last_id = 0
+        while True:
+            rows = self._db.query(
+                _SELECT + "WHERE a.id > ? ORDER BY a.id LIMIT ?",
+                (last_id, self.ITER_BATCH_SIZE),
+            )
+            if not rows:
+                return
+            yield from self._to_entities(rows)
+            last_id = rows[-1]["id"]
+
+    def delete(self, appointment_id: int) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM appointments WHERE id = ?", (appointment_id,))
+
+    @staticmethod
+    def _to_param(value):
+        if isinstance(value, (Patient, Doctor)):
+            return value.id
+        if isinstance(value, AppointmentStatus):
+            return value.value
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        return value
+
+    @staticmethod
+    def _to_row(appointment: Appointment) -> tuple:
+        return (
+            appointment.id,
+            appointment.doctor.id,
+            appointment.patient.id,
+            appointment.date.isoformat(),
+            appointment.time.isoformat(),
+            AppointmentStatus(appointment.status).value,
+            appointment.duration_minutes,
+            appointment.version,
+        )
+
+    @classmethod
+    def _where(cls, filters: dict) -> Tuple[List[str], list]:
+        # Un filtro desconocido es un error, igual que en ArrayAppointmentStore:
+        # ignorarlo o devolver una lista vacía ocultaría la errata.
+        clauses = []
+        params = []
+        for key, value in filters.items():
+            clause = _FILTER_CLAUSES.get(key)
+            if clause is None:
+                raise ValueError(f"Filtro no soportado: {key}")
+            clauses.append(clause)
+            params.append(cls._to_param(value))
+        return clauses, params
+
+    @classmethod
+    def _page_query(
+        cls, after_key: Optional[Tuple[date, time, int]], limit: int, filters: dict
+    ) -> Tuple[str, list]:
+        # Cursor (fecha, hora, id) y ORDER BY en el orden del índice
+        # ix_appointments_page.
+        clauses, params = cls._where(filters)
+        if after_key is not None:
+            after_date, after_time, after_id = after_key
+            clauses.append("(a.date, a.time, a.id) > (?, ?, ?)")
+            params.extend((after_date.isoformat(), after_time.isoformat(), after_id))
+
+        sql = _SELECT
+        if clauses:
+            sql += "WHERE " + " AND ".join(clauses) + " "
+        return sql + "ORDER BY a.date, a.time, a.id LIMIT ?", params + [limit + 1]
+
+    @staticmethod
+    def _grid_query(doctor_ids: Sequence[int], start_date: date, end_date: date) -> Tuple[str, tuple]:
+        # Una sola consulta para todos los doctores del rango; la sirve el
+        # índice (doctor_id, date, ...) con un rango por doctor.
+        placeholders = ", ".join("?" * len(doctor_ids))
+        return (
+            "SELECT doctor_id, date, time, duration_minutes FROM appointments "
+            f"WHERE doctor_id IN ({placeholders}) AND date BETWEEN ? AND ? AND status != ?",
+            (*doctor_ids, start_date.isoformat(), end_date.isoformat(), AppointmentStatus.CANCELLED.value),
+        )
+
+    @staticmethod
+    def _occupancy_grid(rows) -> Dict[Tuple[int, date], int]:
+        grid: Dict[Tuple[int, date], int] = {}
+        for row in rows:
+            key = (row["doctor_id"], date.fromisoformat(row["date"]))
+            grid[key] = grid.get(key, 0) | span_mask(time.fromisoformat(row["time"]), row["duration_minutes"])
+        return grid
+
+    @staticmethod
+    def _occupancy(rows) -> int:
+        mask = 0
+        for row in rows:
+            mask |= span_mask(time.fromisoformat(row["time"]), row["duration_minutes"])
+        return mask
+
+    @staticmethod
+    def _to_entities(rows) -> List[Appointment]:
+        patients: Dict[int, Patient] = {}
+        doctors: Dict[int, Doctor] = {}
+        appointments = []
+        for row in rows:
+            patient = patients.get(row["patient_id"])
+            if patient is None:
+                patient = patients[row["patient_id"]] = Patient.restore(
+                    row["patient_id"],
+                    name=row["patient_name"],
+                    email=Email(row["patient_email"]),
+                    birth_date=date.fromisoformat(row["patient_birth_date"]),
+                )
+            doctor = doctors.get(row["doctor_id"])
+            if doctor is None:
+                doctor = doctors[row["doctor_id"]] = Doctor.restore(
+                    row["doctor_id"],
+                    name=row["doctor_name"],
+                    email=Email(row["doctor_email"]),
+                    specialty=row["doctor_specialty"],
+                    schedule=SqliteDoctorRepository._schedule(row["doctor_schedule"]),
+                )
+            appointments.append(Appointment.restore(
+                row["id"],
+                date=date.fromisoformat(row["date"]),
+                time=time.fromisoformat(row["time"]),
+                status=AppointmentStatus(row["status"]),
+                duration_minutes=row["duration_minutes"],
+                version=row["version"],
+                patient=patient,
+                doctor=doctor,
+            ))
+        return appointments
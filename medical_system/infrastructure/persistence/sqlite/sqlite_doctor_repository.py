@@ -0,0 +1,111 @@
+import json
+from typing import Iterable, List, Optional
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.page import Page
+from medical_system.domain.value_objects.schedule_template import ScheduleTemplate
+from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+
+_UPSERT = (
+    "INSERT INTO doctors (id, name, email, email_key, specialty, specialty_key, schedule) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET name = excluded.name, email = excluded.email, "
+    "email_key = excluded.email_key, specialty = excluded.specialty, "
+    "specialty_key = excluded.specialty_key, schedule = excluded.schedule"
+)
+
+class SqliteDoctorRepository(DoctorRepository):
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def find_by_id(self, doctor_id: int) -> Optional[Doctor]:
+        rows = self._db.query("SELECT * FROM doctors WHERE id = ?", (doctor_id,))
+        return self._to_entity(rows[0]) if rows else None
+
+    def find_by_email(self, email: str) -> Optional[Doctor]:
+        rows = self._db.query("SELECT * FROM doctors WHERE email_key = ?", (email.lower(),))
+        return self._to_entity(rows[0]) if rows else None
+
+    def find_by_specialty(self, specialty: str) -> List[Doctor]:
+        rows = self._db.query(
+            "SELECT * FROM doctors WHERE specialty_key = ? ORDER BY id",
+            (specialty.lower().strip(),),
+        )
+        return [self._to_entity(row) for row in rows]
+
+    def save(self, doctor: Doctor) -> Doctor:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(_UPSERT, self._to_row(doctor))
+            if doctor.id is None:
+                doctor.id = cursor.lastrowid
+        return doctor
+
+    def bulk_load(self, doctors: Iterable[Doctor]) -> int:
+        with self._db.transaction() as conn:
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM doctors").fetchone()[0]
+
+            def rows():
+                nonlocal next_id
+                for doctor in doctors:
+                    if doctor.id is None:
+                        doctor.id = next_id
+                    next_id = max(next_id, doctor.id + 1)
+                    yield self._to_row(doctor)
+
+            cursor = conn.executemany(_UPSERT, rows())
+        return cursor.rowcount
+
+    def update(self, doctor: Doctor) -> Doctor:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE doctors SET name = ?, email = ?, email_key = ?, specialty = ?, "
+                "specialty_key = ?, schedule = ? WHERE id = ?",
+                self._to_row(doctor)[1:] + (doctor.id,),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError("Doctor not found")
+        return doctor
+
+    def find_all(self) -> List[Doctor]:
+        return [self._to_entity(row) for row in self._db.query("SELECT * FROM doctors ORDER BY id")]
+
+    def find_page(
+        self, after_key: Optional[int], limit: int, specialty: Optional[str] = None
+    ) -> Page[Doctor]:
+        sql = "SELECT * FROM doctors WHERE id > ? "
+        params = [after_key or 0]
+        if specialty:
+            sql += "AND specialty_key = ? "
+            params.append(specialty.lower().strip())
+        rows = self._db.query(sql + "ORDER BY id LIMIT ?", params + [limit + 1])
+        return Page.from_overfetch([self._to_entity(row) for row in rows], limit, lambda d: d.id)
+
+    @staticmethod
+    def _to_row(doctor: Doctor) -> tuple:
+        email = str(doctor.email)
+        return (
+            doctor.id,
+            doctor.name,
+            email,
+            email.lower(),
+            doctor.specialty,
+            doctor.specialty.lower().strip(),
+            json.dumps(doctor.schedule.to_dict()) if doctor.schedule is not None else None,
+        )
+
+    @staticmethod
+    def _to_entity(row) -> Doctor:
+        return Doctor.restore(
+            row["id"],
+            name=row["name"],
+            email=Email(row["email"]),
+            specialty=row["specialty"],
+            schedule=SqliteDoctorRepository._schedule(row["schedule"]),
+        )
+
+    @staticmethod
+    def _schedule(value: Optional[str]) -> Optional[ScheduleTemplate]:
+        # Columna `schedule` (JSON o NULL); también la usa el repositorio de
+        # citas al hidratar el doctor de cada fila.
+        return ScheduleTemplate.from_dict(json.loads(value)) if value else None
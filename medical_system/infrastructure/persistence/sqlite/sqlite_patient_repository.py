@@ -0,0 +1,82 @@
+from datetime import date
+from typing import Iterable, List, Optional
+from medical_system.domain.ports.repositories.patient_repository import PatientRepository
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.page import Page
+from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+
+_UPSERT = (
+    "INSERT INTO patients (id, name, email, email_key, birth_date) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET name = excluded.name, email = excluded.email, "
+    "email_key = excluded.email_key, birth_date = excluded.birth_date"
+)
+
+class SqlitePatientRepository(PatientRepository):
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def find_by_id(self, patient_id: int) -> Optional[Patient]:
+        rows = self._db.query("SELECT * FROM patients WHERE id = ?", (patient_id,))
+        return self._to_entity(rows[0]) if rows else None
+
+    def find_by_email(self, email: str) -> Optional[Patient]:
+        rows = self._db.query("SELECT * FROM patients WHERE email_key = ?", (email.lower(),))
+        return self._to_entity(rows[0]) if rows else None
+
+    def save(self, patient: Patient) -> Patient:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(_UPSERT, self._to_row(patient))
+            if patient.id is None:
+                patient.id = cursor.lastrowid
+        return patient
+
+    def bulk_load(self, patients: Iterable[Patient]) -> int:
+        with self._db.transaction() as conn:
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM patients").fetchone()[0]
+
+            def rows():
+                nonlocal next_id
+                for patient in patients:
+                    if patient.id is None:
+                        patient.id = next_id
+                    next_id = max(next_id, patient.id + 1)
+                    yield self._to_row(patient)
+
+            cursor = conn.executemany(_UPSERT, rows())
+        return cursor.rowcount
+
+    def update(self, patient: Patient) -> Patient:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE patients SET name = ?, email = ?, email_key = ?, birth_date = ? WHERE id = ?",
+                self._to_row(patient)[1:] + (patient.id,),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError("Patient not found")
+        return patient
+
+    def find_all(self) -> List[Patient]:
+        return [self._to_entity(row) for row in self._db.query("SELECT * FROM patients ORDER BY id")]
+
+    def find_page(self, after_key: Optional[int], limit: int) -> Page[Patient]:
+        rows = self._db.query(
+            "SELECT * FROM patients WHERE id > ? ORDER BY id LIMIT ?",
+            (after_key or 0, limit + 1),
+        )
+        return Page.from_overfetch([self._to_entity(row) for row in rows], limit, lambda p: p.id)
+
+    @staticmethod
+    def _to_row(patient: Patient) -> tuple:
+        email = str(patient.email)
+        return (patient.id, patient.name, email, email.lower(), patient.birth_date.isoformat())
+
+    @staticmethod
+    def _to_entity(row) -> Patient:
+        return Patient.restore(
+            row["id"],
+            name=row["name"],
+            email=Email(row["email"]),
+            birth_date=date.fromisoformat(row["birth_date"]),
+        )
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime
+from typing import List, Optional
+from medical_system.domain.entities.user import User
+from medical_system.domain.ports.repositories.user_repository import UserRepository
+from medical_system.domain.value_objects.page import Page
+from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+
+class SqliteUserRepository(UserRepository):
+    PAGE_SCAN_BATCH_SIZE = 200
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        rows = self._db.query("SELECT * FROM users WHERE id = ?", (user_id,))
+        return self._to_entity(rows[0]) if rows else None
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        rows = self._db.query("SELECT * FROM users WHERE email = ?", (email.lower(),))
+        return self._to_entity(rows[0]) if rows else None
+
+    def save(self, user: User) -> User:
+        if user.id is None:
+            user.created_at = datetime.now()
+        user.updated_at = datetime.now()
+        user.email = user.email.lower()
+
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO users (id, email, password_hash, first_name, last_name, is_active, "
+                "is_admin, created_at, updated_at, last_login, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET email = excluded.email, "
+                "password_hash = excluded.password_hash, first_name = excluded.first_name, "
+                "last_name = excluded.last_name, is_active = excluded.is_active, "
+                "is_admin = excluded.is_admin, created_at = excluded.created_at, "
+                "updated_at = excluded.updated_at, last_login = excluded.last_login, "
+                "metadata = excluded.metadata",
+                self._to_row(user),
+            )
+            if user.id is None:
+                user.id = cursor.lastrowid
+        return user
+
+    def delete(self, user_id: int) -> bool:
+        with self._db.transaction() as conn:
+            cursor = conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        return cursor.rowcount > 0
+
+    def list_all(
+        self, 
+        role: Optional[str] = None, 
+        is_active: Optional[bool] = None,
+        **filters
+    ) -> List[User]:
+        if is_active is not None:
+            rows = self._db.query("SELECT * FROM users WHERE is_active = ? ORDER BY id", (int(is_active),))
+        else:
+            rows = self._db.query("SELECT * FROM users ORDER BY id")
+        users = [self._to_entity(row) for row in rows]
+
+        if role is not None:
+            users = [u for u in users if u.has_role(role)]
+
+        for key, value in filters.items():
+            users = [u for u in users if hasattr(u, key) and getattr(u, key) == value]
+
+        return users
+
+    def find_page(self, after_key: Optional[int], limit: int, **filters) -> Page[User]:
+        # Los roles viven en el JSON de metadata, así que el filtrado se hace
+        # en Python recorriendo la tabla por lotes desde el cursor.
+        role = filters.pop('role', None)
+        is_active = filters.pop('is_active', None)
+        sql = "SELECT * FROM users WHERE id > ? "
+        extra = []
+        if is_active is not None:
+            sql += "AND is_active = ? "
+            extra.append(int(is_active))
+        sql += "ORDER BY id LIMIT ?"
+
+        last_id = after_key or 0
+        items = []
+        while len(items) <= limit:
+            batch = max(limit + 1 - len(items), self.PAGE_SCAN_BATCH_SIZE)
+            rows = self._db.query(sql, [last_id] + extra + [batch])
+            for row in rows:
+                user = self._to_entity(row)
+                if role is not None and not user.has_role(role):
+                    continue
+                if any(getattr(user, key, None) != value for key, value in filters.items()):
+                    continue
+                items.append(user)
+                if len(items) > limit:
+                    break
+            if len(rows) < batch:
+                break
+            last_id = rows[-1]["id"]
+        return Page.from_overfetch(items, limit, lambda u: u.id)
+
+    def update_last_login(self, user_id: int, login_time: datetime) -> bool:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE users SET last_login = ? WHERE id = ?",
+                (login_time.isoformat(), user_id),
+            )
+        return cursor.rowcount > 0
+
+    def exists_with_email(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
+        if exclude_user_id is not None:
+            rows = self._db.query(
+                "SELECT 1 FROM users WHERE email = ? AND id != ?",
+                (email.lower(), exclude_user_id),
+            )
+        else:
+            rows = self._db.query("SELECT 1 FROM users WHERE email = ?", (email.lower(),))
+        return bool(rows)
+
+    @staticmethod
+    def _to_row(user: User) -> tuple:
+        return (
+            user.id,
+            user.email,
+            user.password_hash,
+            user.first_name,
+            user.last_name,
+            int(user.is_active),
+            int(user.is_admin),
+            user.created_at.isoformat() if user.created_at else None,
+            user.updated_at.isoformat() if user.updated_at else None,
+            user.last_login.isoformat() if user.last_login else None,
+            json.dumps(user.metadata),
+        )
+
+    @staticmethod
+    def _to_entity(row) -> User:
+        def _dt(value):
+            return datetime.fromisoformat(value) if value else None
+
+        return User(
+            id=row["id"],
+            email=row["email"],
+            password_hash=row["password_hash"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            is_active=bool(row["is_active"]),
+            is_admin=bool(row["is_admin"]),
+            created_at=_dt(row["created_at"]),
+            updated_at=_dt(row["updated_at"]),
+            last_login=_dt(row["last_login"]),
+            metadata=json.loads(row["metadata"]),
+        )
@@ -9,8 +9,10 @@ from jose import JWTError, jwt
 from .routers import appointments, doctors, patients, admin
 from medical_system.domain.auth.service import AuthService
 from medical_system.domain.auth.config import SECRET_KEY, ALGORITHM
+from medical_system.domain.exceptions import UnauthorizedError
 from medical_system.domain.ports.repositories.user_repository import UserRepository
 from medical_system.infrastructure.container import get_user_repository
+from medical_system.interfaces.api.serialization import FastJSONResponse
 
 security = HTTPBearer()
 oauth2_scheme = OAuth2PasswordBearer(
@@ -68,6 +70,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,
     contact={
         "name": "Soporte Técnico",
         "email": "soporte@clinica.com"
@@ -234,43 +237,17 @@ async def check_auth(request: Request, call_next):
         )
     
     token = auth_header.split(" ")[1].strip()
-    
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        
-        if datetime.fromtimestamp(payload.get("exp", 0)) < datetime.utcnow():
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Token expirado. Por favor, inicie sesión nuevamente."},
-                headers={"WWW-Authenticate": "Bearer"}
-            )
 
-        if "sub" not in payload:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Token inválido: falta el sujeto (sub)"},
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        request.state.user = payload
-        
-    except JWTError as e:
-        print(f"[AUTH] Error al validar el token: {str(e)}")
-        error_msg = f"Token inválido o expirado: {str(e)}"
-        print(f"[AUTH] {error_msg}")
-        raise HTTPException(
+    # Única verificación del token por petición: las dependencias de
+    # auth_middleware reutilizan request.state.principal.
+    try:
+        request.state.principal = request.app.state.auth_service.verify_token(token)
+    except UnauthorizedError as e:
+        return JSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=error_msg,
+            content={"detail": f"Token inválido o expirado: {e.message}"},
             headers={"WWW-Authenticate": "Bearer"}
         )
-    except Exception as e:
-        print(f"[AUTH] Error inesperado al validar el token: {str(e)}")
-        import traceback
-        print(f"[AUTH] Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error interno del servidor al validar el token"
-        )
 
     response = await call_next(request)
     return response
@@ -0,0 +1,39 @@
+import base64
+import binascii
+import json
+from datetime import date, time
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(key: Any) -> Optional[str]:
+    # El cursor es opaco para el cliente: la clave del último elemento de la
+    # página, serializada en JSON y codificada en base64 url-safe.
+    if key is None:
+        return None
+    parts = key if isinstance(key, tuple) else (key,)
+    payload = [part.isoformat() if isinstance(part, (date, time)) else part for part in parts]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str], parsers: Sequence[Callable[[Any], Any]]) -> Optional[Any]:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(parsers):
+            raise ValueError("longitud de cursor inesperada")
+        key: Tuple = tuple(parse(part) for parse, part in zip(parsers, payload))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginación no válido"
+        )
+    return key if len(key) > 1 else key[0]
+
+ID_CURSOR = (int,)
+APPOINTMENT_CURSOR = (date.fromisoformat, time.fromisoformat, int)
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Query, Depends
-from typing import List, Optional
+from fastapi import APIRouter, Query, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
 from datetime import date
-from medical_system.usecases.appointment.list_all_appointments import ListAllAppointmentsUseCase
-from medical_system.usecases.dtos.appointment_dto import AppointmentDTO
-from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.usecases.appointment.list_all_appointments import AsyncListAllAppointmentsUseCase
+from medical_system.infrastructure.container import get_async_appointment_repository
 from medical_system.interfaces.api.middleware.auth_middleware import get_admin_user
+from medical_system.interfaces.api.serialization import FastJSONResponse, dumps
 
 router = APIRouter(
     prefix="/admin",
@@ -16,23 +17,37 @@ router = APIRouter(
     }
 )
 
-appointment_repo = InMemoryAppointmentRepository()
+appointment_repo = get_async_appointment_repository()
 
-@router.get("/appointments", response_model=List[AppointmentDTO])
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+async def _to_ndjson(rows):
+    async for row in rows:
+        yield dumps(row) + b"\n"
+
+@router.get(
+    "/appointments",
+    responses={
+        200: {
+            "description": "Listado de citas. Con `Accept: application/x-ndjson` se envía "
+                           "una cita por línea a medida que se recorre el almacenamiento.",
+            "content": {NDJSON_MEDIA_TYPE: {}}
+        }
+    }
+)
 async def list_all_appointments(
+    request: Request,
     status: Optional[str] = Query(None, description="Filtrar por estado (scheduled, cancelled, completed)"),
     start_date: Optional[date] = Query(None, description="Fecha de inicio para filtrar citas"),
     end_date: Optional[date] = Query(None, description="Fecha de fin para filtrar citas")
 ):
 
-    use_case = ListAllAppointmentsUseCase(appointment_repo)
-    appointments = use_case.execute()
-    
-    if status:
-        appointments = [a for a in appointments if a.status == status]
-    if start_date:
-        appointments = [a for a in appointments if a.date >= start_date]
-    if end_date:
-        appointments = [a for a in appointments if a.date <= end_date]
-    
-    return appointments
+    use_case = AsyncListAllAppointmentsUseCase(appointment_repo)
+    try:
+        if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+            rows = use_case.stream(status=status, start_date=start_date, end_date=end_date)
+            return StreamingResponse(_to_ndjson(rows), media_type=NDJSON_MEDIA_TYPE)
+
+        return FastJSONResponse(await use_case.execute(status=status, start_date=start_date, end_date=end_date))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -5,39 +5,74 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-from medical_system.usecases.appointment.create_appointment import CreateAppointmentUseCase
+from medical_system.usecases.appointment.create_appointment import AsyncCreateAppointmentUseCase
+from medical_system.usecases.appointment.create_appointments_batch import CreateAppointmentsBatchUseCase
 from medical_system.usecases.appointment.cancel_appointment import CancelAppointmentUseCase
 from medical_system.usecases.appointment.complete_appointment import CompleteAppointmentUseCase
 from medical_system.usecases.appointment.get_doctor_appointments import GetDoctorAppointmentsUseCase
 from medical_system.usecases.appointment.list_patient_appointments import ListPatientAppointmentsUseCase
-from medical_system.usecases.appointment.list_all_appointments import ListAllAppointmentsUseCase
+from medical_system.usecases.appointment.list_all_appointments import AsyncListAllAppointmentsUseCase
 from medical_system.usecases.appointment.delete_appointment import DeleteAppointmentUseCase
-from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.appointment.get_available_slots import AsyncGetAvailableSlotsUseCase
 from medical_system.usecases.appointment.reschedule_appointment import RescheduleAppointmentUseCase
+from medical_system.usecases.appointment.find_earliest_slot import FindEarliestSlotUseCase
+from medical_system.usecases.appointment.get_availability_calendar import AsyncGetAvailabilityCalendarUseCase
+from medical_system.usecases.appointment.get_availability_grid import AsyncGetAvailabilityGridUseCase
+from medical_system.domain.exceptions import DomainException, ResourceNotFoundError
 
 from medical_system.usecases.dtos.appointment_dto import (
     CreateAppointmentDTO,
     AppointmentDTO,
+    AppointmentBatchResultDTO,
+    AppointmentPageDTO,
     UpdateAppointmentDTO,
     RescheduleAppointmentDTO,
     AvailableSlotsRequestDTO,
-    TimeSlotDTO
+    TimeSlotDTO,
+    EarliestSlotsRequestDTO,
+    EarliestSlotDTO,
+    AvailabilityCalendarRequestDTO,
+    DayAvailabilityDTO,
+    AvailabilityGridRequestDTO,
+    DoctorAvailabilityDTO
 )
 
-from medical_system.infrastructure.container import get_appointment_repository, get_patient_repository, get_doctor_repository
+from medical_system.infrastructure.container import (
+    get_appointment_repository,
+    get_patient_repository,
+    get_doctor_repository,
+    get_async_appointment_repository,
+    get_async_patient_repository,
+    get_async_doctor_repository
+)
+from medical_system.interfaces.api.serialization import FastJSONResponse
+from medical_system.interfaces.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    APPOINTMENT_CURSOR,
+    decode_cursor,
+    encode_cursor
+)
 
 appointment_repo = get_appointment_repository()
 patient_repo = get_patient_repository()
 doctor_repo = get_doctor_repository()
+# Las rutas más frecuentes (listado, alta y huecos libres) usan los puertos
+# asíncronos para no bloquear el event loop mientras esperan al almacenamiento.
+async_appointment_repo = get_async_appointment_repository()
+async_patient_repo = get_async_patient_repository()
+async_doctor_repo = get_async_doctor_repository()
 
 router = APIRouter()
 
-@router.get("/", response_model=List[AppointmentDTO])
+@router.get("/", response_model=AppointmentPageDTO)
 async def list_appointments(
     patient_id: Optional[int] = Query(None, description="Filtrar por ID de paciente"),
     doctor_id: Optional[int] = Query(None, description="Filtrar por ID de doctor"),
     date: Optional[date] = Query(None, description="Filtrar por fecha específica (formato: YYYY-MM-DD)"),
-    status: Optional[str] = Query(None, description="Filtrar por estado (Programada, Cancelada, Completada)")
+    status: Optional[str] = Query(None, description="Filtrar por estado (Programada, Cancelada, Completada)"),
+    cursor: Optional[str] = Query(None, description="Cursor devuelto por la página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Tamaño de página")
 ):
     try:
         if status:
@@ -48,15 +83,22 @@ async def list_appointments(
                     detail="El estado debe ser uno de: Programada, Cancelada, Completada"
                 )
         
-        use_case = ListAllAppointmentsUseCase(appointment_repo)
-        appointments = use_case.execute(
+        use_case = AsyncListAllAppointmentsUseCase(async_appointment_repo)
+        page = await use_case.page(
+            decode_cursor(cursor, APPOINTMENT_CURSOR),
+            limit,
             patient_id=patient_id,
             doctor_id=doctor_id,
             date=date,
             status=status
         )
 
-        return [_appointment_to_dto(appt) for appt in appointments]
+        # Los DTO ya tienen la forma del response_model: se serializan
+        # directamente sin que FastAPI los vuelva a validar fila a fila.
+        return FastJSONResponse(AppointmentPageDTO(
+            items=[_appointment_to_dto(appt) for appt in page.items],
+            next_cursor=encode_cursor(page.next_key)
+        ))
         
     except HTTPException:
         raise
@@ -75,12 +117,12 @@ async def create_appointment(appointment_data: dict):
             if field not in appointment_data:
                 raise HTTPException(status_code=400, detail=f"Campo requerido faltante: {field}")
 
-        patient = patient_repo.find_by_id(appointment_data['patient_id'])
+        patient = await async_patient_repo.find_by_id(appointment_data['patient_id'])
         if not patient:
             raise HTTPException(status_code=404, detail=f"Paciente con ID {appointment_data['patient_id']} no encontrado")
         
 
-        doctor = doctor_repo.find_by_id(appointment_data['doctor_id'])
+        doctor = await async_doctor_repo.find_by_id(appointment_data['doctor_id'])
         if not doctor:
             raise HTTPException(status_code=404, detail=f"Doctor con ID {appointment_data['doctor_id']} no encontrado")
         
@@ -88,13 +130,14 @@ async def create_appointment(appointment_data: dict):
             patient_id=appointment_data['patient_id'],
             doctor_id=appointment_data['doctor_id'],
             date=appointment_data['date'],
-            time=appointment_data['time']
+            time=appointment_data['time'],
+            duration_minutes=appointment_data.get('duration_minutes', 30)
         )
         
         logger.info(f"DTO creado: {create_dto}")
         
-        use_case = CreateAppointmentUseCase(appointment_repo, patient_repo, doctor_repo)
-        appointment = use_case.execute(create_dto)
+        use_case = AsyncCreateAppointmentUseCase(async_appointment_repo, async_patient_repo, async_doctor_repo)
+        appointment = await use_case.execute(create_dto)
         
         logger.info(f"Cita creada exitosamente: {appointment}")
         
@@ -108,6 +151,45 @@ async def create_appointment(appointment_data: dict):
         logger.error(f"Error inesperado al crear cita: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
+@router.post("/batch", response_model=AppointmentBatchResultDTO)
+async def create_appointments_batch(batch_data: dict):
+    # Cada cita del lote se acepta o rechaza por separado; el resultado indica
+    # el desenlace de cada una en el mismo orden en que se enviaron.
+    items = batch_data.get('appointments')
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Se esperaba una lista 'appointments'")
+
+    required_fields = ['patient_id', 'doctor_id', 'date', 'time']
+    dtos = []
+    for index, item in enumerate(items):
+        missing = [field for field in required_fields if not isinstance(item, dict) or field not in item]
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cita {index}: campo requerido faltante: {missing[0]}"
+            )
+        try:
+            dtos.append(CreateAppointmentDTO(
+                patient_id=item['patient_id'],
+                doctor_id=item['doctor_id'],
+                date=item['date'],
+                time=item['time'],
+                duration_minutes=item.get('duration_minutes', 30)
+            ))
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=f"Cita {index}: {str(e)}")
+
+    try:
+        use_case = CreateAppointmentsBatchUseCase(appointment_repo, patient_repo, doctor_repo)
+        result = use_case.execute(dtos)
+        logger.info(f"Lote de citas procesado: {result.created} creadas, {result.rejected} rechazadas")
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error inesperado al crear lote de citas: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
 def _appointment_to_dto(appointment):
 
     if not appointment:
@@ -140,14 +222,94 @@ def _appointment_to_dto(appointment):
         date=appointment.date,
         time=appointment.time,
         status=status_value,
+        patient_name=appointment.patient.name,
+        doctor_name=appointment.doctor.name,
         patient=patient_dto,
         doctor=doctor_dto,
         created_at=getattr(appointment, 'created_at', None),
         updated_at=getattr(appointment, 'updated_at', None),
         notes=getattr(appointment, 'notes', None),
-        reason=getattr(appointment, 'reason', None)
+        reason=getattr(appointment, 'reason', None),
+        duration_minutes=getattr(appointment, 'duration_minutes', 30)
     )
 
+@router.get("/earliest-slots", response_model=List[EarliestSlotDTO])
+async def find_earliest_slots(
+    specialty: str = Query(..., description="Especialidad médica a buscar"),
+    start_date: date = Query(..., description="Inicio del rango de búsqueda (formato: YYYY-MM-DD)"),
+    end_date: date = Query(..., description="Fin del rango de búsqueda (formato: YYYY-MM-DD)"),
+    duration_minutes: int = Query(30, description="Duración de la cita en minutos"),
+    limit: int = Query(5, description="Número máximo de horarios a devolver")
+):
+    try:
+        request_dto = EarliestSlotsRequestDTO(
+            specialty=specialty,
+            start_date=start_date,
+            end_date=end_date,
+            duration_minutes=duration_minutes,
+            limit=limit
+        )
+        
+        use_case = FindEarliestSlotUseCase(appointment_repo, doctor_repo)
+        return FastJSONResponse(use_case.execute(request_dto))
+    except (ValueError, DomainException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error al buscar los primeros horarios disponibles")
+        raise HTTPException(status_code=500, detail="Error interno al buscar horarios disponibles")
+
+@router.get("/calendar", response_model=List[DayAvailabilityDTO])
+async def get_availability_calendar(
+    doctor_id: int = Query(..., description="ID del doctor"),
+    start_date: date = Query(..., description="Primer día del calendario (formato: YYYY-MM-DD)"),
+    weeks: int = Query(4, description="Número de semanas a devolver"),
+    duration_minutes: int = Query(30, description="Duración de la cita en minutos")
+):
+    try:
+        request_dto = AvailabilityCalendarRequestDTO(
+            doctor_id=doctor_id,
+            start_date=start_date,
+            weeks=weeks,
+            duration_minutes=duration_minutes
+        )
+
+        use_case = AsyncGetAvailabilityCalendarUseCase(async_appointment_repo, async_doctor_repo)
+        return FastJSONResponse(await use_case.execute(request_dto))
+    except ResourceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (ValueError, DomainException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error al obtener el calendario de disponibilidad")
+        raise HTTPException(status_code=500, detail="Error interno al obtener el calendario de disponibilidad")
+
+@router.get("/availability", response_model=List[DoctorAvailabilityDTO])
+async def get_availability_grid(
+    doctor_ids: List[int] = Query(..., description="IDs de los doctores (se puede repetir el parámetro)"),
+    start_date: date = Query(..., description="Primer día del rango (formato: YYYY-MM-DD)"),
+    end_date: date = Query(..., description="Último día del rango, incluido (formato: YYYY-MM-DD)"),
+    duration_minutes: int = Query(30, description="Duración de la cita en minutos")
+):
+    # Disponibilidad de varios doctores en un rango de días con una sola
+    # petición, en lugar de una llamada a /available-slots por doctor y día.
+    try:
+        request_dto = AvailabilityGridRequestDTO(
+            doctor_ids=doctor_ids,
+            start_date=start_date,
+            end_date=end_date,
+            duration_minutes=duration_minutes
+        )
+
+        use_case = AsyncGetAvailabilityGridUseCase(async_appointment_repo, async_doctor_repo)
+        return FastJSONResponse(await use_case.execute(request_dto))
+    except ResourceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (ValueError, DomainException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error al obtener la disponibilidad de los doctores")
+        raise HTTPException(status_code=500, detail="Error interno al obtener la disponibilidad de los doctores")
+
 @router.post("/{appointment_id}/cancel", response_model=AppointmentDTO)
 async def cancel_appointment(appointment_id: int, patient_id: int = Query(..., description="ID del paciente que cancela la cita")):
     use_case = CancelAppointmentUseCase(appointment_repo, patient_repo)
@@ -210,7 +372,7 @@ async def get_doctor_appointments(
             start_date=start_date,
             end_date=end_date
         )
-        return [_appointment_to_dto(appt) for appt in appointments]
+        return FastJSONResponse([_appointment_to_dto(appt) for appt in appointments])
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -246,7 +408,7 @@ async def get_patient_appointments(
             start_date=start_date,
             end_date=end_date
         )
-        return [_appointment_to_dto(appt) for appt in appointments]
+        return FastJSONResponse([_appointment_to_dto(appt) for appt in appointments])
     except HTTPException:
         raise
     except Exception as e:
@@ -270,9 +432,9 @@ async def get_available_slots(
             end_time=end_time
         )
         
-        use_case = GetAvailableSlotsUseCase(appointment_repo, doctor_repo)
-        available_slots = use_case.execute(request_dto)
-        return available_slots
+        use_case = AsyncGetAvailableSlotsUseCase(async_appointment_repo, async_doctor_repo)
+        available_slots = await use_case.execute(request_dto)
+        return FastJSONResponse(available_slots)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -340,19 +502,15 @@ async def reschedule_appointment(
             requested_by=requesting_user_id
         )
         
-        use_case = RescheduleAppointmentUseCase(
-            appointment_repo=appointment_repo,
-            patient_repo=patient_repo,
-            doctor_repo=doctor_repo
-        )
+        use_case = RescheduleAppointmentUseCase(appointment_repo, patient_repo, doctor_repo)
+        return use_case.execute(reschedule_dto)
         
-        updated_appointment = use_case.execute(reschedule_dto)
-        return _appointment_to_dto(updated_appointment)
-        
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
+    except ResourceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (ValueError, DomainException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.exception(f"Error al reagendar cita {appointment_id}")
         raise HTTPException(status_code=500, detail="Error interno al reagendar la cita")
@@ -1,7 +1,7 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from pydantic import BaseModel
-from typing import Any, List
+from typing import Any, List, Optional
 from medical_system.domain.entities.user import User
 from medical_system.domain.ports.repositories.user_repository import UserRepository
 from medical_system.domain.auth.service import AuthService
@@ -11,13 +11,21 @@ from medical_system.domain.auth.schemas import (
     UserResponse, 
     Token,
     UserUpdate,
-    UserRoleUpdate
+    UserRoleUpdate,
+    UserPage
 )
 from medical_system.interfaces.api.middleware.auth_middleware import (
     get_current_user,
     get_admin_user
 )
 from medical_system.infrastructure.container import get_user_repository
+from medical_system.interfaces.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    ID_CURSOR,
+    decode_cursor,
+    encode_cursor
+)
 
 def get_auth_service(user_repo: UserRepository = Depends(get_user_repository)) -> AuthService:
     return AuthService(user_repo)
@@ -98,7 +106,7 @@ async def login(
             )
         
         try:
-            user = auth_service.authenticate_user(login_data.email.lower().strip(), login_data.password)
+            user = await auth_service.authenticate_user_async(login_data.email.lower().strip(), login_data.password)
             
             if not user:
                 print(f"[LOGIN] Usuario no encontrado o contraseña incorrecta: {login_data.email}")
@@ -187,7 +195,7 @@ async def register(
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Any:
     try:
-        user = auth_service.create_user(user_in)
+        user = await auth_service.create_user_async(user_in)
         return user
     except Exception as e:
         raise HTTPException(
@@ -355,14 +363,17 @@ async def update_user_roles(
             detail=str(e)
         )
 
-@router.get("/users", response_model=List[UserResponse], dependencies=[Depends(get_admin_user)])
+@router.get("/users", response_model=UserPage, dependencies=[Depends(get_admin_user)])
 async def list_users(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor devuelto por la página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Any:
-    users = auth_service.user_repository.list_all()[skip:skip + limit]
-    return users
+    page = auth_service.user_repository.find_page(decode_cursor(cursor, ID_CURSOR), limit)
+    return UserPage(
+        items=[UserResponse.from_orm(user) for user in page.items],
+        next_cursor=encode_cursor(page.next_key)
+    )
 
 @router.get(
     "/verify-token", 
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 from typing import List, Optional
 from medical_system.usecases.doctor.create_doctor import CreateDoctorUseCase
 from medical_system.usecases.doctor.list_doctors_by_specialty import ListDoctorsBySpecialtyUseCase
 from medical_system.usecases.doctor.update_doctor import UpdateDoctorUseCase
-from medical_system.usecases.dtos.doctor_dto import CreateDoctorDTO, UpdateDoctorDTO, DoctorDTO
+from medical_system.usecases.doctor.set_doctor_schedule import SetDoctorScheduleUseCase
+from medical_system.usecases.dtos.doctor_dto import CreateDoctorDTO, UpdateDoctorDTO, DoctorDTO, DoctorPageDTO, DoctorScheduleDTO
 from medical_system.infrastructure.container import get_doctor_repository
 from medical_system.domain.entities.user import User
 from ..middleware.auth_middleware import require_roles, get_admin_user
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ID_CURSOR, decode_cursor, encode_cursor
 
 router = APIRouter(
     prefix="",
@@ -121,30 +123,95 @@ async def update_doctor(
             detail="Error interno al actualizar el doctor"
         )
 
+@router.get(
+    "/{doctor_id}/schedule",
+    response_model=DoctorScheduleDTO,
+    summary="Obtener el horario de un doctor",
+    description="Devuelve la plantilla horaria del doctor (la predeterminada si no tiene una propia). Público.",
+    responses={
+        200: {"description": "Horario obtenido exitosamente"},
+        404: {"description": "Doctor no encontrado"}
+    }
+)
+async def get_doctor_schedule(doctor_id: int):
+
+    doctor = doctor_repo.find_by_id(doctor_id)
+    if not doctor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Doctor no encontrado"
+        )
+    return SetDoctorScheduleUseCase.to_dto(doctor.schedule_template)
+
+@router.put(
+    "/{doctor_id}/schedule",
+    response_model=DoctorScheduleDTO,
+    summary="Definir el horario de un doctor",
+    description="Sustituye la plantilla horaria del doctor: jornada semanal con pausas, excepciones por fecha y festivos. Requiere rol de administrador o ser el mismo doctor.",
+    responses={
+        200: {"description": "Horario actualizado exitosamente"},
+        400: {"description": "Plantilla no válida"},
+        403: {"description": "No autorizado"},
+        404: {"description": "Doctor no encontrado"}
+    }
+)
+async def set_doctor_schedule(
+    doctor_id: int,
+    schedule_data: DoctorScheduleDTO,
+    current_user: User = Depends(require_roles(["admin", "doctor"]))
+):
+
+    doctor = doctor_repo.find_by_id(doctor_id)
+    if not doctor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Doctor no encontrado"
+        )
+
+    is_admin = current_user.is_admin or current_user.has_role("admin")
+    is_self = str(doctor.email).lower() == current_user.email.lower()
+
+    if not (is_admin or is_self):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Solo puede actualizar su propio horario"
+        )
+
+    use_case = SetDoctorScheduleUseCase(doctor_repo)
+    try:
+        return use_case.execute(doctor_id, schedule_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error interno al actualizar el horario"
+        )
+
 @router.get(
     "/", 
-    response_model=List[DoctorDTO],
+    response_model=DoctorPageDTO,
     summary="Listar doctores",
-    description="Obtiene una lista de todos los doctores registrados. Público.",
+    description="Obtiene una página de doctores ordenada por id. Para la siguiente página se envía el `next_cursor` recibido. Público.",
     responses={
         200: {"description": "Lista de doctores obtenida exitosamente"},
+        400: {"description": "Cursor de paginación no válido"},
         500: {"description": "Error interno del servidor"}
     }
 )
 async def list_doctors(
     specialty: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 100
+    cursor: Optional[str] = Query(None, description="Cursor devuelto por la página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
 ):
 
+    after_key = decode_cursor(cursor, ID_CURSOR)
     try:
-        if specialty:
-            use_case = ListDoctorsBySpecialtyUseCase(doctor_repo)
-            doctors = use_case.execute(specialty)
-        else:
-            doctors = doctor_repo.find_all()
-            
-        return [_to_dto(doctor) for doctor in doctors[skip:skip + limit]]
+        page = doctor_repo.find_page(after_key, limit, specialty=specialty)
+        return DoctorPageDTO(
+            items=[_to_dto(doctor) for doctor in page.items],
+            next_cursor=encode_cursor(page.next_key)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
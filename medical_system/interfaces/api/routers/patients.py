@@ -1,11 +1,12 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from typing import List, Optional
 from medical_system.usecases.patient.create_patient import CreatePatientUseCase
 from medical_system.usecases.patient.update_patient import UpdatePatientUseCase
-from medical_system.usecases.dtos.patient_dto import CreatePatientDTO, UpdatePatientDTO, PatientDTO
+from medical_system.usecases.dtos.patient_dto import CreatePatientDTO, UpdatePatientDTO, PatientDTO, PatientPageDTO
 from medical_system.infrastructure.container import get_patient_repository, get_user_repository
 from medical_system.domain.entities.user import User
 from ..middleware.auth_middleware import get_current_user, get_admin_user, require_roles, get_doctor_or_admin_user
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ID_CURSOR, decode_cursor, encode_cursor
 
 router = APIRouter(
     prefix="",
@@ -120,23 +121,27 @@ async def update_patient(
 
 @router.get(
     "/", 
-    response_model=List[PatientDTO],
+    response_model=PatientPageDTO,
     summary="Listar pacientes",
-    description="Obtiene una lista de todos los pacientes registrados. Requiere rol de administrador o doctor.",
+    description="Obtiene una página de pacientes ordenada por id; la siguiente se pide con `next_cursor`. Requiere rol de administrador o doctor.",
     responses={
         200: {"description": "Lista de pacientes obtenida exitosamente"},
+        400: {"description": "Cursor de paginación no válido"},
         403: {"description": "No autorizado"},
         500: {"description": "Error interno del servidor"}
     }
 )
 async def list_patients(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor devuelto por la página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_doctor_or_admin_user)
 ):
 
-    patients = patient_repo.find_all()[skip:skip + limit]
-    return [_to_dto(patient) for patient in patients]
+    page = patient_repo.find_page(decode_cursor(cursor, ID_CURSOR), limit)
+    return PatientPageDTO(
+        items=[_to_dto(patient) for patient in page.items],
+        next_cursor=encode_cursor(page.next_key)
+    )
 
 def _is_patient_owner(current_user: User, patient_id: int) -> bool:
     patient = patient_repo.find_by_id(patient_id)
@@ -0,0 +1,111 @@
+import dataclasses
+import json
+import typing
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Callable, Dict
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; sin él se usa el módulo json
+    orjson = None
+
+# Serialización rápida de las respuestas. Los DTO son dataclasses planas, así
+# que para cada clase se genera una vez una función que produce el dict JSON
+# leyendo los campos directamente, sin pasar por la validación de pydantic
+# del response_model. Con orjson instalado los dataclasses y las fechas se
+# serializan en C y las funciones generadas solo se usan como respaldo.
+
+_ISO_TYPES = (date, datetime, time)
+
+_serializers: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def serializer_for(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    serializer = _serializers.get(cls)
+    if serializer is None:
+        serializer = _serializers[cls] = _compile(cls)
+    return serializer
+
+
+def _compile(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    hints = typing.get_type_hints(cls)
+    namespace: Dict[str, Any] = {}
+    items = []
+    for index, field in enumerate(dataclasses.fields(cls)):
+        value = f"obj.{field.name}"
+        kind, inner = _field_kind(hints.get(field.name, Any))
+        if kind == "iso":
+            expression = f"(None if {value} is None else {value}.isoformat())"
+        elif kind == "dataclass":
+            # Las clases anidadas se resuelven al llamar: así una clase puede
+            # referirse a sí misma sin compilar en bucle.
+            namespace[f"_cls{index}"] = inner
+            expression = f"(None if {value} is None else _serializer_for(_cls{index})({value}))"
+        elif kind == "dataclass_list":
+            namespace[f"_cls{index}"] = inner
+            expression = (
+                f"(None if {value} is None else "
+                f"[_serializer_for(_cls{index})(item) for item in {value}])"
+            )
+        else:
+            expression = value
+        items.append(f"{field.name!r}: {expression}")
+
+    source = "def serialize(obj):\n    return {" + ", ".join(items) + "}\n"
+    namespace["_serializer_for"] = serializer_for
+    exec(compile(source, f"<serializer {cls.__qualname__}>", "exec"), namespace)
+    return namespace["serialize"]
+
+
+def _field_kind(annotation):
+    # Optional[X] se trata como X: las funciones generadas ya admiten None.
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if isinstance(annotation, type):
+        if issubclass(annotation, _ISO_TYPES):
+            return "iso", annotation
+        if dataclasses.is_dataclass(annotation):
+            return "dataclass", annotation
+    if typing.get_origin(annotation) in (list, typing.List):
+        (item,) = typing.get_args(annotation) or (Any,)
+        if isinstance(item, type) and dataclasses.is_dataclass(item):
+            return "dataclass_list", item
+    return "plain", None
+
+
+def _default(value):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return serializer_for(type(value))(value)
+    if isinstance(value, _ISO_TYPES):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Tipo no serializable a JSON: {type(value).__name__}")
+
+
+if orjson is not None:
+    def dumps(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
+else:
+    def dumps(content: Any) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    # Respuesta por defecto de la API. Devolverla directamente desde una ruta
+    # evita además que FastAPI vuelva a validar el contenido contra el
+    # response_model, que en listados grandes es lo más caro de la respuesta.
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
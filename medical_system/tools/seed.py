@@ -0,0 +1,184 @@
+import argparse
+import random
+import sys
+import time as clock
+from datetime import date, timedelta
+from typing import List, Optional
+
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import SLOTS_PER_DAY, slot_time
+from medical_system.infrastructure.persistence.mapped_snapshot import is_mapped_snapshot, read_mapped_snapshot, write_mapped_snapshot
+from medical_system.infrastructure.persistence.snapshot import Snapshot, read_snapshot, write_snapshot
+
+SPECIALTIES = [
+    "Cardiología", "Dermatología", "Pediatría", "Neurología", "Traumatología",
+    "Oftalmología", "Ginecología", "Psiquiatría", "Endocrinología", "Urología",
+    "Neumología", "Oncología", "Reumatología", "Otorrinolaringología", "Medicina General",
+]
+
+FIRST_NAMES = [
+    "Ana", "Carlos", "Lucía", "Javier", "María", "Pablo", "Elena", "Diego",
+    "Sofía", "Miguel", "Laura", "Andrés", "Carmen", "Jorge", "Isabel", "Raúl",
+]
+
+LAST_NAMES = [
+    "García", "Martínez", "López", "Sánchez", "Pérez", "Gómez", "Fernández", "Díaz",
+    "Ruiz", "Hernández", "Jiménez", "Moreno", "Álvarez", "Romero", "Navarro", "Torres",
+]
+
+def specialty_names(count: int) -> List[str]:
+    if count <= len(SPECIALTIES):
+        return SPECIALTIES[:count]
+    return SPECIALTIES + [f"Especialidad {index}" for index in range(len(SPECIALTIES) + 1, count + 1)]
+
+FULL_NAMES = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+
+def generate(
+    doctors: int,
+    specialties: int,
+    patients: int,
+    appointments: int,
+    seed: int = 42,
+    start: Optional[date] = None,
+    occupancy: float = 0.6,
+    cancelled_ratio: float = 0.05
+) -> Snapshot:
+    # Genera un dataset reproducible que cumple las reglas de reserva: citas
+    # futuras en días laborables y bloques de 30 minutos, nunca dos citas en
+    # el mismo bloque de un doctor y como máximo una cita por paciente y día.
+    if doctors <= 0 or patients <= 0 or specialties <= 0:
+        raise ValueError("Se necesita al menos un doctor, un paciente y una especialidad")
+    if not 0 < occupancy <= 1:
+        raise ValueError("La ocupación debe estar entre 0 y 1")
+
+    rng = random.Random(seed)
+    names = specialty_names(specialties)
+
+    doctor_list = [
+        Doctor.restore(
+            index,
+            name=f"Dr. {name}",
+            email=Email(f"doctor{index}@seed.example.com"),
+            specialty=names[(index - 1) % len(names)]
+        )
+        for index, name in enumerate(rng.choices(FULL_NAMES, k=doctors), start=1)
+    ]
+    earliest_birth = date(1940, 1, 1)
+    birth_span = (date.today() - timedelta(days=365) - earliest_birth).days
+    patient_list = [
+        Patient.restore(
+            index,
+            name=name,
+            email=Email(f"paciente{index}@seed.example.com"),
+            birth_date=earliest_birth + timedelta(days=days)
+        )
+        for index, name, days in zip(
+            range(1, patients + 1),
+            rng.choices(FULL_NAMES, k=patients),
+            rng.choices(range(birth_span), k=patients)
+        )
+    ]
+
+    # Una cita por paciente y día: el día admite como mucho tantas citas
+    # como pacientes, además del límite de ocupación de las agendas.
+    per_day = min(max(1, round(doctors * SLOTS_PER_DAY * occupancy)), patients)
+    statuses = (AppointmentStatus.SCHEDULED, AppointmentStatus.CANCELLED)
+    weights = (1 - cancelled_ratio, cancelled_ratio)
+
+    slot_times = [slot_time(index) for index in range(SLOTS_PER_DAY)]
+    day = start or date.today() + timedelta(days=1)
+    appointment_list: List[Appointment] = []
+    while len(appointment_list) < appointments:
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+        todays = min(per_day, appointments - len(appointment_list))
+        cells = sorted(rng.sample(range(doctors * SLOTS_PER_DAY), todays))
+        day_patients = rng.sample(patient_list, todays)
+        day_statuses = rng.choices(statuses, weights, k=todays)
+        for cell, patient, status in zip(cells, day_patients, day_statuses):
+            doctor_index, slot = divmod(cell, SLOTS_PER_DAY)
+            appointment_list.append(Appointment.restore(
+                len(appointment_list) + 1,
+                date=day,
+                time=slot_times[slot],
+                status=status,
+                patient=patient,
+                doctor=doctor_list[doctor_index]
+            ))
+        day += timedelta(days=1)
+
+    return Snapshot(doctors=doctor_list, patients=patient_list, appointments=appointment_list)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m medical_system.tools.seed",
+        description=(
+            "Genera doctores, pacientes y citas sintéticas y los carga en los "
+            "repositorios configurados (STORAGE_BACKEND) por la vía masiva."
+        )
+    )
+    parser.add_argument("--doctors", type=int, default=100)
+    parser.add_argument("--specialties", type=int, default=10)
+    parser.add_argument("--patients", type=int, default=10_000)
+    parser.add_argument("--appointments", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42, help="Semilla del generador")
+    parser.add_argument("--start", type=date.fromisoformat, help="Primer día (YYYY-MM-DD); por defecto mañana")
+    parser.add_argument("--occupancy", type=float, default=0.6, help="Fracción de bloques ocupados por día")
+    parser.add_argument("--from-snapshot", metavar="PATH", help="Carga un snapshot existente en lugar de generar")
+    parser.add_argument("--dump", metavar="PATH", help="Guarda el dataset en un snapshot (.json, .json.gz o binario .snap)")
+    parser.add_argument("--no-load", action="store_true", help="Solo genera (y vuelca); no carga en los repositorios")
+    args = parser.parse_args(argv)
+
+    started = clock.perf_counter()
+    if args.from_snapshot:
+        read = read_mapped_snapshot if is_mapped_snapshot(args.from_snapshot) else read_snapshot
+        snapshot = read(args.from_snapshot)
+        action = f"leído {args.from_snapshot}"
+    else:
+        snapshot = generate(
+            doctors=args.doctors,
+            specialties=args.specialties,
+            patients=args.patients,
+            appointments=args.appointments,
+            seed=args.seed,
+            start=args.start,
+            occupancy=args.occupancy
+        )
+        action = "generado"
+    print(
+        f"Dataset {action}: {len(snapshot.doctors)} doctores, {len(snapshot.patients)} pacientes, "
+        f"{len(snapshot.appointments)} citas ({clock.perf_counter() - started:.2f} s)",
+        file=sys.stderr
+    )
+
+    if not args.no_load:
+        from medical_system.infrastructure.container import (
+            STORAGE_BACKEND,
+            get_appointment_repository,
+            get_doctor_repository,
+            get_patient_repository
+        )
+
+        started = clock.perf_counter()
+        get_doctor_repository().bulk_load(snapshot.doctors)
+        get_patient_repository().bulk_load(snapshot.patients)
+        get_appointment_repository().bulk_load(snapshot.appointments)
+        print(
+            f"Cargado en el backend '{STORAGE_BACKEND}' ({clock.perf_counter() - started:.2f} s)",
+            file=sys.stderr
+        )
+
+    if args.dump:
+        started = clock.perf_counter()
+        write = write_mapped_snapshot if is_mapped_snapshot(args.dump) else write_snapshot
+        write(args.dump, snapshot.doctors, snapshot.patients, snapshot.appointments)
+        print(f"Snapshot guardado en {args.dump} ({clock.perf_counter() - started:.2f} s)", file=sys.stderr)
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
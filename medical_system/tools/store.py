@@ -0,0 +1,38 @@
+import argparse
+import os
+import stat
+import sys
+from typing import List, Optional
+
+from medical_system.infrastructure.persistence.shared.store import serve, store_authkey
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Arranca el almacén compartido: un proceso con los repositorios en "
+            "memoria al que se conectan los workers con STORAGE_BACKEND=shared."
+        )
+    )
+    parser.add_argument("--socket", default=os.getenv("STORE_SOCKET", "medical_system.sock"), help="Ruta del socket Unix")
+    parser.add_argument("--seed-snapshot", default=os.getenv("SEED_SNAPSHOT"), help="Snapshot a precargar")
+    parser.add_argument("--journal-dir", default=os.getenv("JOURNAL_DIR"), help="Directorio del journal")
+    args = parser.parse_args(argv)
+
+    # Solo se borra un socket de una ejecución anterior, nunca otro fichero
+    # que se haya pasado por error en --socket.
+    if os.path.lexists(args.socket):
+        if not stat.S_ISSOCK(os.lstat(args.socket).st_mode):
+            parser.error(f"{args.socket} existe y no es un socket")
+        os.remove(args.socket)
+    authkey = store_authkey(args.socket, os.getenv("STORE_AUTHKEY"), create=True)
+    print(f"Almacén compartido escuchando en {args.socket}", file=sys.stderr)
+    serve(
+        args.socket,
+        authkey,
+        seed_snapshot=args.seed_snapshot,
+        journal_dir=args.journal_dir
+    )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,13 @@
-from datetime import datetime
 from medical_system.usecases.dtos.appointment_dto import CreateAppointmentDTO, AppointmentDTO
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.ports.repositories.patient_repository import PatientRepository
 from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.ports.repositories.async_patient_repository import AsyncPatientRepository
+from medical_system.domain.ports.repositories.async_doctor_repository import AsyncDoctorRepository
 from medical_system.domain.entities.appointment import Appointment
 from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import span_mask
 
 
 class CreateAppointmentUseCase:
@@ -56,20 +59,17 @@ class CreateAppointmentUseCase:
         except Exception as e:
             raise
 
-        try:
-            appointments = self.appointment_repository.find_by_doctor_and_date(
-                doctor_id=doctor.id, date=appointment_dto.date
-            )
-            requested_datetime = datetime.combine(appointment_dto.date, appointment_dto.time)
-
-            for appointment in appointments:
-                appointment_datetime = datetime.combine(appointment.date, appointment.time)
-                time_diff = abs((appointment_datetime - requested_datetime).total_seconds())
+        if not doctor.accepts(appointment_dto.date, appointment_dto.time, appointment_dto.duration_minutes):
+            raise ValueError("El doctor no atiende en el horario solicitado")
 
-                if time_diff < 1800:  # 30 minutos
-                    raise ValueError("El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)")
-        except Exception as e:
-            raise
+        occupancy = self.appointment_repository.get_occupancy_mask(
+            doctor_id=doctor.id, date=appointment_dto.date
+        )
+        # Las horas van en bloques de 30 minutos, así que "al menos 30 minutos
+        # entre citas" equivale a que todos los bloques que cubre la cita
+        # estén libres.
+        if occupancy & span_mask(appointment_dto.time, appointment_dto.duration_minutes):
+            raise ValueError("El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)")
 
         try:
             appointment = Appointment(
@@ -78,8 +78,12 @@ class CreateAppointmentUseCase:
                 status=AppointmentStatus.SCHEDULED,
                 patient=patient,
                 doctor=doctor,
+                duration_minutes=appointment_dto.duration_minutes,
             )
-            saved_appointment = self.appointment_repository.save(appointment)
+            # Las comprobaciones anteriores dan el mensaje de error preciso;
+            # reserve_slot las repite de forma atómica frente a reservas
+            # concurrentes.
+            saved_appointment = self.appointment_repository.reserve_slot(appointment)
             return self._to_dto(saved_appointment)
         except Exception as e:
             raise
@@ -111,4 +115,64 @@ class CreateAppointmentUseCase:
                 email=str(appointment.doctor.email),
                 specialty=appointment.doctor.specialty,
             ),
-        )
\ No newline at end of file
+            duration_minutes=appointment.duration_minutes,
+        )
+
+
+class AsyncCreateAppointmentUseCase:
+    # Mismas reglas y mensajes que CreateAppointmentUseCase sobre los puertos
+    # asíncronos; cada consulta cede el event loop mientras espera.
+
+    def __init__(
+        self,
+        appointment_repository: AsyncAppointmentRepository,
+        patient_repository: AsyncPatientRepository,
+        doctor_repository: AsyncDoctorRepository,
+    ):
+        self.appointment_repository = appointment_repository
+        self.patient_repository = patient_repository
+        self.doctor_repository = doctor_repository
+
+    async def execute(self, appointment_dto: CreateAppointmentDTO) -> AppointmentDTO:
+
+        patient = await self.patient_repository.find_by_id(appointment_dto.patient_id)
+        if not patient:
+            raise ValueError(f"No se encontró el paciente con ID: {appointment_dto.patient_id}")
+
+        doctor = await self.doctor_repository.find_by_id(appointment_dto.doctor_id)
+        if not doctor:
+            raise ValueError(f"No se encontró el doctor con ID: {appointment_dto.doctor_id}")
+
+        # Un único viaje para las tres reglas del paciente: la cita idéntica y
+        # la de la misma hora son casos particulares de "mismo día".
+        same_day_appointments = await self.appointment_repository.find_by_patient_and_date(
+            patient_id=patient.id,
+            date=appointment_dto.date
+        )
+        for existing in same_day_appointments:
+            if existing.doctor.id == doctor.id and existing.time == appointment_dto.time:
+                raise ValueError("Ya existe una cita idéntica")
+        if any(existing.time == appointment_dto.time for existing in same_day_appointments):
+            raise ValueError("Ya tienes una cita programada a esta misma hora")
+        if same_day_appointments:
+            raise ValueError("Solo puedes tener una cita por día")
+
+        if not doctor.accepts(appointment_dto.date, appointment_dto.time, appointment_dto.duration_minutes):
+            raise ValueError("El doctor no atiende en el horario solicitado")
+
+        occupancy = await self.appointment_repository.get_occupancy_mask(
+            doctor_id=doctor.id, date=appointment_dto.date
+        )
+        if occupancy & span_mask(appointment_dto.time, appointment_dto.duration_minutes):
+            raise ValueError("El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)")
+
+        appointment = Appointment(
+            date=appointment_dto.date,
+            time=appointment_dto.time,
+            status=AppointmentStatus.SCHEDULED,
+            patient=patient,
+            doctor=doctor,
+            duration_minutes=appointment_dto.duration_minutes,
+        )
+        saved_appointment = await self.appointment_repository.reserve_slot(appointment)
+        return CreateAppointmentUseCase._to_dto(saved_appointment)
@@ -0,0 +1,132 @@
+from datetime import date, time
+from typing import Dict, List, Optional, Tuple
+from medical_system.usecases.appointment.create_appointment import CreateAppointmentUseCase
+from medical_system.usecases.dtos.appointment_dto import (
+    CreateAppointmentDTO,
+    AppointmentBatchItemDTO,
+    AppointmentBatchResultDTO
+)
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.patient_repository import PatientRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import span_mask
+
+
+class CreateAppointmentsBatchUseCase:
+
+    MAX_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        patient_repository: PatientRepository,
+        doctor_repository: DoctorRepository,
+    ):
+        self.appointment_repository = appointment_repository
+        self.patient_repository = patient_repository
+        self.doctor_repository = doctor_repository
+
+    def execute(self, appointment_dtos: List[CreateAppointmentDTO]) -> AppointmentBatchResultDTO:
+        if not appointment_dtos:
+            raise ValueError("El lote no contiene citas")
+        if len(appointment_dtos) > self.MAX_BATCH_SIZE:
+            raise ValueError(f"El lote no puede superar {self.MAX_BATCH_SIZE} citas")
+
+        # Mismas reglas que CreateAppointmentUseCase, pero cada paciente, doctor,
+        # agenda (doctor, día) y día de paciente se consulta una sola vez y las
+        # citas ya aceptadas en el lote cuentan como ocupadas para las siguientes.
+        patients: Dict[int, object] = {}
+        doctors: Dict[int, object] = {}
+        occupancy: Dict[Tuple[int, date], int] = {}
+        patient_days: Dict[Tuple[int, date], List[Tuple[int, time]]] = {}
+
+        errors: Dict[int, str] = {}
+        accepted: List[Tuple[int, Appointment]] = []
+        for index, dto in enumerate(appointment_dtos):
+            try:
+                appointment = self._check(dto, patients, doctors, occupancy, patient_days)
+            except ValueError as e:
+                errors[index] = str(e)
+                continue
+            accepted.append((index, appointment))
+            occupancy[(dto.doctor_id, dto.date)] |= appointment.slot_mask
+            patient_days[(dto.patient_id, dto.date)].append((dto.doctor_id, dto.time))
+
+        # Todas las altas en una sola llamada a reserve_many (una transacción
+        # en SQLite): el repositorio vuelve a comprobar cada hueco, así que una
+        # reserva concurrente que lo haya ocupado tras la validación se
+        # rechaza en lugar de duplicarse.
+        results: List[Optional[AppointmentBatchItemDTO]] = [None] * len(appointment_dtos)
+        created = 0
+        reserved = []
+        if accepted:
+            reserved = self.appointment_repository.reserve_many([appointment for _, appointment in accepted])
+        for (index, _), saved in zip(accepted, reserved):
+            if isinstance(saved, str):
+                errors[index] = saved
+                continue
+            created += 1
+            results[index] = AppointmentBatchItemDTO(
+                index=index,
+                success=True,
+                appointment=CreateAppointmentUseCase._to_dto(saved)
+            )
+        for index, error in errors.items():
+            results[index] = AppointmentBatchItemDTO(index=index, success=False, error=error)
+
+        return AppointmentBatchResultDTO(
+            created=created,
+            rejected=len(errors),
+            results=results
+        )
+
+    def _check(self, dto, patients, doctors, occupancy, patient_days) -> Appointment:
+        if dto.patient_id not in patients:
+            patients[dto.patient_id] = self.patient_repository.find_by_id(dto.patient_id)
+        patient = patients[dto.patient_id]
+        if not patient:
+            raise ValueError(f"No se encontró el paciente con ID: {dto.patient_id}")
+
+        if dto.doctor_id not in doctors:
+            doctors[dto.doctor_id] = self.doctor_repository.find_by_id(dto.doctor_id)
+        doctor = doctors[dto.doctor_id]
+        if not doctor:
+            raise ValueError(f"No se encontró el doctor con ID: {dto.doctor_id}")
+
+        day_key = (patient.id, dto.date)
+        if day_key not in patient_days:
+            patient_days[day_key] = [
+                (apt.doctor.id, apt.time)
+                for apt in self.appointment_repository.find_by_patient_and_date(
+                    patient_id=patient.id, date=dto.date
+                )
+            ]
+        same_day = patient_days[day_key]
+        if (doctor.id, dto.time) in same_day:
+            raise ValueError("Ya existe una cita idéntica")
+        if any(booked_time == dto.time for _, booked_time in same_day):
+            raise ValueError("Ya tienes una cita programada a esta misma hora")
+        if same_day:
+            raise ValueError("Solo puedes tener una cita por día")
+
+        if not doctor.accepts(dto.date, dto.time, dto.duration_minutes):
+            raise ValueError("El doctor no atiende en el horario solicitado")
+
+        agenda_key = (doctor.id, dto.date)
+        if agenda_key not in occupancy:
+            occupancy[agenda_key] = self.appointment_repository.get_occupancy_mask(
+                doctor_id=doctor.id, date=dto.date
+            )
+        if occupancy[agenda_key] & span_mask(dto.time, dto.duration_minutes):
+            raise ValueError("El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)")
+
+        return Appointment(
+            date=dto.date,
+            time=dto.time,
+            status=AppointmentStatus.SCHEDULED,
+            patient=patient,
+            doctor=doctor,
+            duration_minutes=dto.duration_minutes,
+        )
@@ -0,0 +1,99 @@
+import heapq
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Iterator, List, Tuple
+import logging
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.exceptions import ValidationError
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.dtos.appointment_dto import EarliestSlotsRequestDTO, EarliestSlotDTO
+
+logger = logging.getLogger(__name__)
+
+class FindEarliestSlotUseCase:
+
+    MAX_WINDOW_DAYS = 31
+    MAX_RESULTS = 50
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        doctor_repository: DoctorRepository
+    ):
+        self.doctor_repo = doctor_repository
+        self.slots_use_case = GetAvailableSlotsUseCase(appointment_repository, doctor_repository)
+
+    def execute(self, request_dto: EarliestSlotsRequestDTO) -> List[EarliestSlotDTO]:
+
+        logger.info(
+            f"Buscando los {request_dto.limit} primeros horarios de {request_dto.specialty} "
+            f"entre {request_dto.start_date} y {request_dto.end_date}"
+        )
+
+        self._validate_request(request_dto)
+
+        doctors = self.doctor_repo.find_by_specialty(request_dto.specialty)
+        if not doctors:
+            return []
+
+        # Cada doctor produce sus horarios en orden cronológico y día a día;
+        # heapq.merge solo avanza el generador del que sale el siguiente
+        # resultado, así que se deja de calcular en cuanto hay `limit`.
+        now = datetime.now()
+        start_date = max(request_dto.start_date, now.date())
+        streams = [
+            self._doctor_slots(doctor, start_date, request_dto.end_date, request_dto.duration_minutes, now)
+            for doctor in doctors
+        ]
+        merged = heapq.merge(*streams)
+
+        return [slot for _, _, slot in islice(merged, request_dto.limit)]
+
+    def _doctor_slots(
+        self,
+        doctor,
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+        now: datetime
+    ) -> Iterator[Tuple[datetime, int, EarliestSlotDTO]]:
+
+        current = start_date
+        while current <= end_date:
+            if self.slots_use_case.open_mask(doctor, current):
+                for slot in self.slots_use_case.list_slots(doctor, current, duration_minutes):
+                    starts_at = datetime.combine(current, slot.start_time)
+                    if starts_at <= now:
+                        continue
+                    yield starts_at, doctor.id, EarliestSlotDTO(
+                        doctor_id=doctor.id,
+                        doctor_name=doctor.name,
+                        date=current,
+                        start_time=slot.start_time,
+                        end_time=slot.end_time,
+                        duration_minutes=duration_minutes
+                    )
+            current += timedelta(days=1)
+
+    def _validate_request(self, request_dto: EarliestSlotsRequestDTO) -> None:
+
+        if not request_dto.specialty or not request_dto.specialty.strip():
+            raise ValidationError("Se requiere una especialidad")
+
+        if request_dto.start_date > request_dto.end_date:
+            raise ValidationError("La fecha de inicio no puede ser posterior a la fecha de fin")
+
+        if request_dto.end_date < date.today():
+            raise ValidationError("No se pueden buscar horarios en fechas pasadas")
+
+        if (request_dto.end_date - request_dto.start_date).days >= self.MAX_WINDOW_DAYS:
+            raise ValidationError(
+                f"El rango de búsqueda no puede superar {self.MAX_WINDOW_DAYS} días"
+            )
+
+        if request_dto.duration_minutes <= 0:
+            raise ValidationError("La duración debe ser mayor a 0 minutos")
+
+        if not (1 <= request_dto.limit <= self.MAX_RESULTS):
+            raise ValidationError(f"El número de resultados debe estar entre 1 y {self.MAX_RESULTS}")
@@ -0,0 +1,124 @@
+from datetime import date, timedelta
+from typing import Dict, List
+import logging
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.ports.repositories.async_doctor_repository import AsyncDoctorRepository
+from medical_system.domain.exceptions import ResourceNotFoundError, ValidationError
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.dtos.appointment_dto import AvailabilityCalendarRequestDTO, DayAvailabilityDTO
+
+logger = logging.getLogger(__name__)
+
+class GetAvailabilityCalendarUseCase:
+
+    MAX_WEEKS = 8
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        doctor_repository: DoctorRepository
+    ):
+        self.appointment_repo = appointment_repository
+        self.doctor_repo = doctor_repository
+        self.slots_use_case = GetAvailableSlotsUseCase(appointment_repository, doctor_repository)
+
+    def execute(self, request_dto: AvailabilityCalendarRequestDTO) -> List[DayAvailabilityDTO]:
+
+        logger.info(
+            f"Calculando calendario de {request_dto.weeks} semanas para doctor "
+            f"{request_dto.doctor_id} desde {request_dto.start_date}"
+        )
+
+        self._validate_request(request_dto)
+
+        doctor = self.doctor_repo.find_by_id(request_dto.doctor_id)
+        if not doctor:
+            raise ResourceNotFoundError("El doctor especificado no existe")
+
+        # Una sola consulta para todo el rango en lugar de una por día; los
+        # días sin entrada no tienen ningún bloque ocupado.
+        end_date = self._end_date(request_dto)
+        occupancy = self.appointment_repo.get_occupancy_masks(
+            doctor_id=doctor.id,
+            start_date=request_dto.start_date,
+            end_date=end_date
+        )
+
+        return self._build_calendar(doctor, request_dto, end_date, occupancy)
+
+    def _validate_request(self, request_dto: AvailabilityCalendarRequestDTO) -> None:
+
+        if not request_dto.doctor_id:
+            raise ValidationError("Se requiere el ID del doctor")
+
+        if not request_dto.start_date:
+            raise ValidationError("Se requiere una fecha de inicio")
+
+        if request_dto.start_date < date.today():
+            raise ValidationError("No se pueden buscar horarios en fechas pasadas")
+
+        if not (1 <= request_dto.weeks <= self.MAX_WEEKS):
+            raise ValidationError(f"El número de semanas debe estar entre 1 y {self.MAX_WEEKS}")
+
+        if request_dto.duration_minutes <= 0:
+            raise ValidationError("La duración debe ser mayor a 0 minutos")
+
+    @staticmethod
+    def _end_date(request_dto: AvailabilityCalendarRequestDTO) -> date:
+        return request_dto.start_date + timedelta(weeks=request_dto.weeks, days=-1)
+
+    def _build_calendar(
+        self,
+        doctor,
+        request_dto: AvailabilityCalendarRequestDTO,
+        end_date: date,
+        occupancy: Dict[date, int]
+    ) -> List[DayAvailabilityDTO]:
+
+        # La plantilla del doctor ya está compilada en máscaras por día, así
+        # que cada día es combinar máscaras y consultar el caché de huecos.
+        # Los días sin consulta no aparecen.
+        slots_use_case = self.slots_use_case
+        calendar = []
+        current = request_dto.start_date
+        one_day = timedelta(days=1)
+        while current <= end_date:
+            open_mask = slots_use_case.open_mask(doctor, current)
+            if open_mask:
+                calendar.append(DayAvailabilityDTO(
+                    date=current,
+                    slots=slots_use_case.slots_from_free_mask(
+                        open_mask & ~occupancy.get(current, 0), request_dto.duration_minutes
+                    )
+                ))
+            current += one_day
+        return calendar
+
+
+class AsyncGetAvailabilityCalendarUseCase(GetAvailabilityCalendarUseCase):
+
+    def __init__(
+        self,
+        appointment_repository: AsyncAppointmentRepository,
+        doctor_repository: AsyncDoctorRepository
+    ):
+        super().__init__(appointment_repository, doctor_repository)
+
+    async def execute(self, request_dto: AvailabilityCalendarRequestDTO) -> List[DayAvailabilityDTO]:
+
+        self._validate_request(request_dto)
+
+        doctor = await self.doctor_repo.find_by_id(request_dto.doctor_id)
+        if not doctor:
+            raise ResourceNotFoundError("El doctor especificado no existe")
+
+        end_date = self._end_date(request_dto)
+        occupancy = await self.appointment_repo.get_occupancy_masks(
+            doctor_id=doctor.id,
+            start_date=request_dto.start_date,
+            end_date=end_date
+        )
+
+        return self._build_calendar(doctor, request_dto, end_date, occupancy)
@@ -0,0 +1,147 @@
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+import logging
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.ports.repositories.async_doctor_repository import AsyncDoctorRepository
+from medical_system.domain.exceptions import ResourceNotFoundError, ValidationError
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.dtos.appointment_dto import (
+    AvailabilityGridRequestDTO,
+    DayAvailabilityDTO,
+    DoctorAvailabilityDTO
+)
+
+logger = logging.getLogger(__name__)
+
+class GetAvailabilityGridUseCase:
+
+    MAX_DOCTORS = 100
+    MAX_DAYS = 31
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        doctor_repository: DoctorRepository
+    ):
+        self.appointment_repo = appointment_repository
+        self.doctor_repo = doctor_repository
+
+    def execute(self, request_dto: AvailabilityGridRequestDTO) -> List[DoctorAvailabilityDTO]:
+
+        logger.info(
+            f"Calculando disponibilidad de {len(request_dto.doctor_ids)} doctores "
+            f"del {request_dto.start_date} al {request_dto.end_date}"
+        )
+
+        doctor_ids = self._validate_request(request_dto)
+
+        doctors = []
+        for doctor_id in doctor_ids:
+            doctor = self.doctor_repo.find_by_id(doctor_id)
+            if not doctor:
+                raise ResourceNotFoundError(f"El doctor {doctor_id} no existe")
+            doctors.append(doctor)
+
+        # Una sola consulta para toda la rejilla doctores × días; las celdas
+        # sin entrada no tienen ningún bloque ocupado.
+        occupancy = self.appointment_repo.get_occupancy_grid(
+            doctor_ids=doctor_ids,
+            start_date=request_dto.start_date,
+            end_date=request_dto.end_date
+        )
+
+        return self._build_grid(doctors, request_dto, occupancy)
+
+    def _validate_request(self, request_dto: AvailabilityGridRequestDTO) -> List[int]:
+
+        if not request_dto.doctor_ids:
+            raise ValidationError("Se requiere al menos un ID de doctor")
+
+        doctor_ids = list(dict.fromkeys(request_dto.doctor_ids))
+        if len(doctor_ids) > self.MAX_DOCTORS:
+            raise ValidationError(f"No se pueden consultar más de {self.MAX_DOCTORS} doctores a la vez")
+
+        if not request_dto.start_date or not request_dto.end_date:
+            raise ValidationError("Se requieren las fechas de inicio y fin")
+
+        if request_dto.start_date < date.today():
+            raise ValidationError("No se pueden buscar horarios en fechas pasadas")
+
+        if request_dto.end_date < request_dto.start_date:
+            raise ValidationError("La fecha de fin debe ser posterior o igual a la de inicio")
+
+        if (request_dto.end_date - request_dto.start_date).days >= self.MAX_DAYS:
+            raise ValidationError(f"El rango no puede superar {self.MAX_DAYS} días")
+
+        if request_dto.duration_minutes <= 0:
+            raise ValidationError("La duración debe ser mayor a 0 minutos")
+
+        return doctor_ids
+
+    @staticmethod
+    def _build_grid(
+        doctors,
+        request_dto: AvailabilityGridRequestDTO,
+        occupancy: Dict[Tuple[int, date], int]
+    ) -> List[DoctorAvailabilityDTO]:
+
+        # Cada celda es combinar la máscara de consulta del doctor con la de
+        # ocupación y consultar el caché de huecos por máscara libre, así que
+        # el coste no depende de cuántas citas haya en el rango. Los días sin
+        # consulta no aparecen.
+        days = []
+        current = request_dto.start_date
+        while current <= request_dto.end_date:
+            days.append(current)
+            current += timedelta(days=1)
+
+        duration = request_dto.duration_minutes
+        slots_for = GetAvailableSlotsUseCase.slots_from_free_mask
+        grid = []
+        for doctor in doctors:
+            template = doctor.schedule_template
+            availability = []
+            for day in days:
+                open_mask = template.day_mask(day)
+                if open_mask:
+                    availability.append(DayAvailabilityDTO(
+                        date=day,
+                        slots=slots_for(open_mask & ~occupancy.get((doctor.id, day), 0), duration)
+                    ))
+            grid.append(DoctorAvailabilityDTO(
+                doctor_id=doctor.id,
+                doctor_name=doctor.name,
+                days=availability
+            ))
+        return grid
+
+
+class AsyncGetAvailabilityGridUseCase(GetAvailabilityGridUseCase):
+
+    def __init__(
+        self,
+        appointment_repository: AsyncAppointmentRepository,
+        doctor_repository: AsyncDoctorRepository
+    ):
+        super().__init__(appointment_repository, doctor_repository)
+
+    async def execute(self, request_dto: AvailabilityGridRequestDTO) -> List[DoctorAvailabilityDTO]:
+
+        doctor_ids = self._validate_request(request_dto)
+
+        doctors = []
+        for doctor_id in doctor_ids:
+            doctor = await self.doctor_repo.find_by_id(doctor_id)
+            if not doctor:
+                raise ResourceNotFoundError(f"El doctor {doctor_id} no existe")
+            doctors.append(doctor)
+
+        occupancy = await self.appointment_repo.get_occupancy_grid(
+            doctor_ids=doctor_ids,
+            start_date=request_dto.start_date,
+            end_date=request_dto.end_date
+        )
+
+        return self._build_grid(doctors, request_dto, occupancy)
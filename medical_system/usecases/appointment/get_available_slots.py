@@ -1,28 +1,54 @@
-from datetime import time, date, datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Tuple
 import logging
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.ports.repositories.async_doctor_repository import AsyncDoctorRepository
 from medical_system.domain.exceptions import (
     ResourceNotFoundError,
     ValidationError,
     BusinessRuleViolationError
 )
+from medical_system.domain.value_objects.time_slots import (
+    iter_bits,
+    run_starts,
+    slot_time,
+    slots_needed
+)
 from medical_system.usecases.dtos.appointment_dto import TimeSlotDTO
 
 logger = logging.getLogger(__name__)
 
-class GetAvailableSlotsUseCase:
+@lru_cache(maxsize=8192)
+def _slots_for_free_mask(free: int, duration_minutes: int) -> Tuple[TimeSlotDTO, ...]:
+    # Los huecos dependen solo de la máscara libre y de la duración, y en la
+    # práctica se repiten pocas combinaciones (día vacío, una o dos citas...):
+    # se calculan una vez y las consultas siguientes son un acceso al caché.
+    # Los DTO se comparten entre respuestas, así que no deben modificarse.
+    length = slots_needed(duration_minutes)
+    starts = run_starts(free, length)
 
-    DEFAULT_WORK_HOURS = {
-        'start': time(9, 0),
-        'end': time(18, 0),
-        'lunch_start': time(13, 0),
-        'lunch_end': time(14, 0),
-    }
+    available_slots = []
+    next_allowed = 0
+    for index in iter_bits(starts):
+        if index < next_allowed:
+            continue
+        start = datetime.combine(date.min, slot_time(index))
+        available_slots.append(
+            TimeSlotDTO(
+                id=len(available_slots) + 1,
+                start_time=start.time(),
+                end_time=(start + timedelta(minutes=duration_minutes)).time(),
+                duration_minutes=duration_minutes
+            )
+        )
+        next_allowed = index + length
+    return tuple(available_slots)
+
+class GetAvailableSlotsUseCase:
 
-    WORK_DAYS = [0, 1, 2, 3, 4]
-    
     def __init__(
         self,
         appointment_repository: AppointmentRepository,
@@ -43,24 +69,43 @@ class GetAvailableSlotsUseCase:
         doctor = self.doctor_repo.find_by_id(request_dto.doctor_id)
         if not doctor:
             raise ResourceNotFoundError("El doctor especificado no existe")
+        self._check_open_day(doctor, request_dto.date)
 
-        work_schedule = self._get_doctor_schedule(doctor, request_dto.date)
-        
-        existing_appointments = self.appointment_repo.find_by_doctor_and_date(
-            doctor_id=request_dto.doctor_id,
-            date=request_dto.date,
-            status='scheduled'
-        )
-        
-        available_slots = self._calculate_available_slots(
-            work_schedule=work_schedule,
-            existing_appointments=existing_appointments,
-            duration_minutes=request_dto.duration_minutes
-        )
+        available_slots = self.list_slots(doctor, request_dto.date, request_dto.duration_minutes)
         
         logger.info(f"Encontrados {len(available_slots)} horarios disponibles")
         return available_slots
     
+    def list_slots(self, doctor, schedule_date: date, duration_minutes: int) -> List[TimeSlotDTO]:
+
+        occupancy = self.appointment_repo.get_occupancy_mask(
+            doctor_id=doctor.id,
+            date=schedule_date
+        )
+        
+        return self.slots_from_occupancy(doctor, schedule_date, occupancy, duration_minutes)
+
+    def slots_from_occupancy(
+        self,
+        doctor,
+        schedule_date: date,
+        occupancy: int,
+        duration_minutes: int
+    ) -> List[TimeSlotDTO]:
+
+        free = self.open_mask(doctor, schedule_date) & ~occupancy
+        return self.slots_from_free_mask(free, duration_minutes)
+
+    @staticmethod
+    def open_mask(doctor, schedule_date: date) -> int:
+        # Bloques en los que el doctor atiende ese día según su plantilla,
+        # ya compilada y cacheada en la propia plantilla.
+        return doctor.schedule_template.day_mask(schedule_date)
+
+    @staticmethod
+    def slots_from_free_mask(free: int, duration_minutes: int) -> List[TimeSlotDTO]:
+        return list(_slots_for_free_mask(free, duration_minutes))
+    
     def _validate_request(self, request_dto) -> None:
 
         if not request_dto.doctor_id:
@@ -74,81 +119,42 @@ class GetAvailableSlotsUseCase:
             
         if request_dto.duration_minutes <= 0:
             raise ValidationError("La duración debe ser mayor a 0 minutos")
-            
-        if request_dto.date.weekday() not in self.WORK_DAYS:
+    
+    def _check_open_day(self, doctor, schedule_date: date) -> None:
+
+        if not self.open_mask(doctor, schedule_date):
             raise BusinessRuleViolationError(
-                "No hay disponibilidad los fines de semana"
+                "El doctor no tiene consulta ese día"
             )
-    
-    def _get_doctor_schedule(
-        self, 
-        doctor, 
-        schedule_date: date
-    ) -> dict:
-
-        schedule = {
-            'start': self.DEFAULT_WORK_HOURS['start'],
-            'end': self.DEFAULT_WORK_HOURS['end'],
-            'lunch_start': self.DEFAULT_WORK_HOURS['lunch_start'],
-            'lunch_end': self.DEFAULT_WORK_HOURS['lunch_end'],
-            'unavailable_periods': []
-        }
-
-        if schedule_date.weekday() == 4:
-            schedule['end'] = time(14, 0)
-            schedule['lunch_start'] = time(12, 30)
-            schedule['lunch_end'] = time(13, 30)
-        
-        return schedule
-    
-    def _calculate_available_slots(
+
+
+class AsyncGetAvailableSlotsUseCase(GetAvailableSlotsUseCase):
+    # Reutiliza la validación y el cálculo sobre la máscara; solo las dos
+    # consultas al repositorio pasan a ser asíncronas.
+
+    def __init__(
         self,
-        work_schedule: dict,
-        existing_appointments: list,
-        duration_minutes: int
-    ) -> List[TimeSlotDTO]:
+        appointment_repository: AsyncAppointmentRepository,
+        doctor_repository: AsyncDoctorRepository
+    ):
+        super().__init__(appointment_repository, doctor_repository)
 
-        date_ref = datetime.now().date()
-        busy_blocks = []
-        lunch_start = datetime.combine(date_ref, work_schedule['lunch_start'])
-        lunch_end = datetime.combine(date_ref, work_schedule['lunch_end'])
-        busy_blocks.append((lunch_start, lunch_end))
+    async def execute(self, request_dto) -> List[TimeSlotDTO]:
 
-        for appt in existing_appointments:
-            appt_start = datetime.combine(date_ref, appt.time)
-            appt_end = appt_start + timedelta(minutes=appt.duration_minutes or 30)
-            busy_blocks.append((appt_start, appt_end))
-        
-        busy_blocks.sort()
-        available_slots = []
-        current_time = datetime.combine(date_ref, work_schedule['start'])
-        end_time = datetime.combine(date_ref, work_schedule['end'])
-        
-        slot_index = 1
-        
-        while current_time < end_time:
-            slot_end = current_time + timedelta(minutes=duration_minutes)
+        self._validate_request(request_dto)
 
-            if slot_end > end_time:
-                break
-            
-            is_available = True
-            for busy_start, busy_end in busy_blocks:
-                if (current_time < busy_end and slot_end > busy_start):
-                    is_available = False
-                    current_time = busy_end
-                    break
-            
-            if is_available:
-                available_slots.append(
-                    TimeSlotDTO(
-                        id=slot_index,
-                        start_time=current_time.time(),
-                        end_time=slot_end.time(),
-                        duration_minutes=duration_minutes
-                    )
-                )
-                slot_index += 1
-                current_time = slot_end
+        doctor = await self.doctor_repo.find_by_id(request_dto.doctor_id)
+        if not doctor:
+            raise ResourceNotFoundError("El doctor especificado no existe")
+        self._check_open_day(doctor, request_dto.date)
 
-        return available_slots
+        return await self.list_slots(doctor, request_dto.date, request_dto.duration_minutes)
+
+    async def list_slots(self, doctor, schedule_date: date, duration_minutes: int) -> List[TimeSlotDTO]:
+
+        occupancy = await self.appointment_repo.get_occupancy_mask(
+            doctor_id=doctor.id,
+            date=schedule_date
+        )
+
+        return self.slots_from_occupancy(doctor, schedule_date, occupancy, duration_minutes)
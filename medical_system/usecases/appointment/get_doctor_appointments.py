@@ -55,4 +55,5 @@ class GetDoctorAppointmentsUseCase:
                 email=str(appointment.doctor.email),
                 specialty=appointment.doctor.specialty,
             ),
+            duration_minutes=appointment.duration_minutes,
         )
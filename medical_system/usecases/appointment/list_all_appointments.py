@@ -1,11 +1,15 @@
 from datetime import date
-from typing import List, Optional, Dict, Any
-from medical_system.domain.entities.appointment import AppointmentStatus
+from typing import AsyncIterator, Iterator, List, Optional, Dict, Any, Tuple
+from medical_system.domain.entities.appointment import Appointment, AppointmentStatus
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.ports.repositories.patient_repository import PatientRepository
 from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.ports.repositories.async_appointment_repository import AsyncAppointmentRepository
+from medical_system.domain.value_objects.page import Page
 
 class ListAllAppointmentsUseCase:
+    # Citas por página al exportar en streaming (NDJSON).
+    STREAM_PAGE_SIZE = 500
 
     def __init__(
         self, 
@@ -29,31 +33,93 @@ class ListAllAppointmentsUseCase:
     ) -> List[Dict[str, Any]]:
         self._validate_parameters(date, status, start_date, end_date)
         
-        appointments = self.appointment_repository.find_all()
-        
-        if patient_id is not None:
-            appointments = [apt for apt in appointments if apt.patient.id == patient_id]
-            
-        if doctor_id is not None:
-            appointments = [apt for apt in appointments if apt.doctor.id == doctor_id]
-            
-        if date is not None:
-            appointments = [apt for apt in appointments if apt.date == date]
-            
-        if status is not None:
-            try:
-                status_enum = AppointmentStatus[status.upper()]
-                appointments = [apt for apt in appointments if apt.status == status_enum]
-            except KeyError:
-                raise ValueError(f"Estado no válido: {status}")
-        
-        if start_date or end_date:
-            appointments = self._filter_by_date_range(appointments, start_date, end_date)
+        # Todos los filtros se delegan al repositorio, que elige el índice
+        # más selectivo en lugar de recorrer todas las citas.
+        appointments = self.appointment_repository.find_all(
+            **self._criteria(patient_id, doctor_id, date, status, start_date, end_date)
+        )
         
         appointments.sort(key=lambda x: (x.date, x.time), reverse=True)
         
         return [self._to_dict(apt) for apt in appointments]
     
+    def stream(
+        self,
+        patient_id: Optional[int] = None,
+        doctor_id: Optional[int] = None,
+        date: Optional[date] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Iterator[Dict[str, Any]]:
+        # Los parámetros se validan aquí, antes de empezar a emitir filas. El
+        # recorrido es perezoso: páginas de find_page con el cursor (fecha,
+        # hora, id), así los filtros usan los índices del repositorio y el
+        # orden es el mismo en la versión asíncrona.
+        self._validate_parameters(date, status, start_date, end_date)
+        filters = self._criteria(patient_id, doctor_id, date, status, start_date, end_date)
+
+        def _rows() -> Iterator[Dict[str, Any]]:
+            after_key = None
+            while True:
+                page = self.appointment_repository.find_page(after_key, self.STREAM_PAGE_SIZE, **filters)
+                for apt in page.items:
+                    yield self._to_dict(apt)
+                if page.next_key is None:
+                    return
+                after_key = page.next_key
+
+        return _rows()
+
+    def page(
+        self,
+        after_key: Optional[Tuple],
+        limit: int,
+        patient_id: Optional[int] = None,
+        doctor_id: Optional[int] = None,
+        date: Optional[date] = None,
+        status: Optional[str] = None
+    ) -> Page[Appointment]:
+        # Paginación por cursor en orden (fecha, hora, id): el coste de cada
+        # página no depende de cuántas se hayan recorrido antes.
+        if limit <= 0:
+            raise ValueError("El tamaño de página debe ser mayor a 0")
+
+        filters = self._criteria(patient_id, doctor_id, date, status, None, None)
+
+        return self.appointment_repository.find_page(after_key, limit, **filters)
+
+    def _criteria(
+        self,
+        patient_id: Optional[int],
+        doctor_id: Optional[int],
+        date: Optional[date],
+        status: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> Dict[str, Any]:
+        criteria = {
+            'patient_id': patient_id,
+            'doctor_id': doctor_id,
+            'date': date,
+            'status': self._parse_status(status) if status else None,
+            'start_date': start_date,
+            'end_date': end_date,
+        }
+        return {key: value for key, value in criteria.items() if value is not None}
+
+    @staticmethod
+    def _parse_status(status: str) -> AppointmentStatus:
+        # Acepta tanto el nombre ("scheduled") como el valor ("Programada").
+        try:
+            return AppointmentStatus[status.upper()]
+        except KeyError:
+            pass
+        try:
+            return AppointmentStatus(status.capitalize())
+        except ValueError:
+            raise ValueError(f"Estado no válido: {status}")
+
     def _validate_parameters(
         self,
         date: Optional[date],
@@ -84,20 +150,6 @@ class ListAllAppointmentsUseCase:
                     f"Estado no válido. Debe ser uno de: {', '.join(valid_statuses)}"
                 )
     
-    def _filter_by_date_range(
-        self,
-        appointments: list,
-        start_date: Optional[date],
-        end_date: Optional[date]
-    ) -> list:
-        if not start_date or not end_date:
-            return appointments
-            
-        return [
-            apt for apt in appointments
-            if start_date <= apt.date <= end_date
-        ]
-    
     def _to_dict(self, appointment):
         appointment_dict = {
             'id': appointment.id,
@@ -127,3 +179,69 @@ class ListAllAppointmentsUseCase:
             appointment_dict['updated_at'] = appointment.updated_at.isoformat() if hasattr(appointment, 'updated_at') and appointment.updated_at else None
             
         return appointment_dict
+
+
+class AsyncListAllAppointmentsUseCase(ListAllAppointmentsUseCase):
+
+    def __init__(self, appointment_repository: AsyncAppointmentRepository):
+        super().__init__(appointment_repository)
+
+    async def execute(
+        self,
+        patient_id: Optional[int] = None,
+        doctor_id: Optional[int] = None,
+        date: Optional[date] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        self._validate_parameters(date, status, start_date, end_date)
+
+        appointments = await self.appointment_repository.find_all(
+            **self._criteria(patient_id, doctor_id, date, status, start_date, end_date)
+        )
+
+        appointments.sort(key=lambda x: (x.date, x.time), reverse=True)
+
+        return [self._to_dict(apt) for apt in appointments]
+
+    async def page(
+        self,
+        after_key: Optional[Tuple],
+        limit: int,
+        patient_id: Optional[int] = None,
+        doctor_id: Optional[int] = None,
+        date: Optional[date] = None,
+        status: Optional[str] = None
+    ) -> Page[Appointment]:
+        if limit <= 0:
+            raise ValueError("El tamaño de página debe ser mayor a 0")
+
+        filters = self._criteria(patient_id, doctor_id, date, status, None, None)
+
+        return await self.appointment_repository.find_page(after_key, limit, **filters)
+
+    def stream(
+        self,
+        patient_id: Optional[int] = None,
+        doctor_id: Optional[int] = None,
+        date: Optional[date] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self._validate_parameters(date, status, start_date, end_date)
+        filters = self._criteria(patient_id, doctor_id, date, status, start_date, end_date)
+
+        async def _rows() -> AsyncIterator[Dict[str, Any]]:
+            after_key = None
+            while True:
+                page = await self.appointment_repository.find_page(after_key, self.STREAM_PAGE_SIZE, **filters)
+                for apt in page.items:
+                    yield self._to_dict(apt)
+                if page.next_key is None:
+                    return
+                after_key = page.next_key
+
+        return _rows()
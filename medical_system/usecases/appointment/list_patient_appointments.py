@@ -38,20 +38,20 @@ class ListPatientAppointmentsUseCase:
 
         self._validate_parameters(date, status, start_date, end_date)
 
-        appointments = self.appointment_repository.find_by_patient(patient_id=patient_id)
-        
-        if date:
-            appointments = [apt for apt in appointments if apt.date == date]
-            
-        if status:
-            try:
-                status_enum = AppointmentStatus[status.upper()]
-                appointments = [apt for apt in appointments if apt.status == status_enum]
-            except KeyError:
-                raise ValueError(f"Estado no válido: {status}")
-
-        if start_date or end_date:
-            appointments = self._filter_by_date_range(appointments, start_date, end_date)
+        if date or status or start_date or end_date:
+            # Con filtros adicionales el repositorio escoge el índice más
+            # selectivo (paciente, fecha o estado) en lugar del de paciente.
+            criteria = {'patient_id': patient_id}
+            if date:
+                criteria['date'] = date
+            if status:
+                criteria['status'] = AppointmentStatus[status.upper()]
+            if start_date and end_date:
+                criteria['start_date'] = start_date
+                criteria['end_date'] = end_date
+            appointments = self.appointment_repository.find_all(**criteria)
+        else:
+            appointments = self.appointment_repository.find_by_patient(patient_id=patient_id)
 
         appointments.sort(key=lambda x: (x.date, x.time), reverse=True)
 
@@ -86,20 +86,6 @@ class ListPatientAppointmentsUseCase:
                     f"Estado no válido. Debe ser uno de: {', '.join(valid_statuses)}"
                 )
     
-    def _filter_by_date_range(
-        self,
-        appointments: list,
-        start_date: Optional[date],
-        end_date: Optional[date]
-    ) -> list:
-        if not start_date or not end_date:
-            return appointments
-            
-        return [
-            apt for apt in appointments
-            if start_date <= apt.date <= end_date
-        ]
-    
     @staticmethod
     def _to_dto(appointment) -> Dict[str, Any]:
         return ListPatientAppointmentsUseCase._to_dict(appointment)
@@ -51,4 +51,5 @@ class MarkAppointmentCompletedUseCase:
                 email=str(appointment.doctor.email),
                 specialty=appointment.doctor.specialty,
             ),
+            duration_minutes=appointment.duration_minutes,
         )
@@ -1,10 +1,12 @@
 from datetime import datetime, date, time, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional
 import logging
 from medical_system.domain.entities.appointment import Appointment, AppointmentStatus
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.ports.repositories.patient_repository import PatientRepository
 from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.usecases.appointment.create_appointment import CreateAppointmentUseCase
+from medical_system.usecases.dtos.appointment_dto import AppointmentDTO
 from medical_system.domain.exceptions import (
     ResourceNotFoundError,
     ValidationError,
@@ -25,10 +27,10 @@ class RescheduleAppointmentUseCase:
         doctor_repository: Optional[DoctorRepository] = None
     ):
         self.appointment_repo = appointment_repository
-        self.patient_repo = patient_repo
-        self.doctor_repo = doctor_repo
+        self.patient_repo = patient_repository
+        self.doctor_repo = doctor_repository
     
-    def execute(self, request_dto) -> Dict[str, Any]:
+    def execute(self, request_dto) -> AppointmentDTO:
 
         logger.info(
             f"Iniciando reagendamiento de cita {request_dto.appointment_id} "
@@ -45,25 +47,26 @@ class RescheduleAppointmentUseCase:
 
         self._validate_can_reschedule(appointment)
 
-        try:
+        doctor = self._current_doctor(appointment)
+        if not doctor.accepts(request_dto.new_date, request_dto.new_time, appointment.duration_minutes):
+            raise BusinessRuleViolationError("El doctor no atiende en el horario solicitado")
 
-            updated_appointment = self._create_rescheduled_appointment(
-                appointment=appointment,
-                new_date=request_dto.new_date,
-                new_time=request_dto.new_time,
-                reason=request_dto.reason
+        try:
+            # move() comprueba el hueco y cambia fecha y hora en el propio
+            # repositorio: sin crear otra cita ni volver a validarla entera.
+            # El repositorio en memoria modifica la misma instancia, así que
+            # la fecha y hora anteriores se guardan antes.
+            previous_date, previous_time = appointment.date, appointment.time
+            moved_appointment = self.appointment_repo.move(
+                appointment.id, request_dto.new_date, request_dto.new_time
             )
-            saved_appointment = self.appointment_repo.save(updated_appointment)
             
-            self._log_reschedule_event(appointment, saved_appointment, request_dto.requested_by)
-            
-            logger.info(
-                f"Cita {appointment.id} reagendada exitosamente de "
-                f"{appointment.date} {appointment.time} a "
-                f"{saved_appointment.date} {saved_appointment.time}"
+            self._log_reschedule_event(
+                moved_appointment, previous_date, previous_time,
+                request_dto.requested_by, request_dto.reason
             )
             
-            return self._to_dto(saved_appointment)
+            return CreateAppointmentUseCase._to_dto(moved_appointment)
             
         except Exception as e:
             logger.error(
@@ -72,6 +75,16 @@ class RescheduleAppointmentUseCase:
             )
             raise
     
+    def _current_doctor(self, appointment):
+        # El doctor guardado con la cita puede estar desfasado (o sin
+        # plantilla): el horario vigente es el del repositorio de doctores.
+        if self.doctor_repo is None:
+            return appointment.doctor
+        doctor = self.doctor_repo.find_by_id(appointment.doctor.id)
+        if not doctor:
+            raise ResourceNotFoundError("El doctor especificado no existe")
+        return doctor
+
     def _validate_request(self, request_dto) -> None:
 
         if not request_dto.appointment_id:
@@ -120,66 +133,20 @@ class RescheduleAppointmentUseCase:
                 "horas de anticipación"
             )
     
-    def _create_rescheduled_appointment(
-        self,
-        appointment: Appointment,
-        new_date: date,
-        new_time: time,
-        reason: Optional[str] = None
-    ) -> Appointment:
-        updated_appointment = Appointment(
-            id=appointment.id,
-            patient=appointment.patient,
-            doctor=appointment.doctor,
-            date=new_date,
-            time=new_time,
-            status=appointment.status,
-            reason=reason or appointment.reason,
-            created_at=appointment.created_at,
-            updated_at=datetime.now()
-        )
-        
-        if hasattr(appointment, 'notes'):
-            updated_appointment.notes = appointment.notes
-            
-        if hasattr(appointment, 'cancellation_reason'):
-            updated_appointment.cancellation_reason = appointment.cancellation_reason
-        
-        return updated_appointment
-    
     def _log_reschedule_event(
         self, 
-        original_appointment: Appointment, 
-        updated_appointment: Appointment,
-        requested_by: int
+        appointment: Appointment, 
+        previous_date: date,
+        previous_time: time,
+        requested_by: int,
+        reason: Optional[str] = None
     ) -> None:
 
         log_message = (
-            f"Cita {original_appointment.id} reagendada por usuario {requested_by}. "
-            f"Antes: {original_appointment.date} {original_appointment.time}. "
-            f"Después: {updated_appointment.date} {updated_appointment.time}."
+            f"Cita {appointment.id} reagendada por usuario {requested_by}. "
+            f"Antes: {previous_date} {previous_time}. "
+            f"Después: {appointment.date} {appointment.time} (versión {appointment.version})."
         )
+        if reason:
+            log_message += f" Motivo: {reason}"
         logger.info(log_message)
-
-    @staticmethod
-    def _to_dto(appointment) -> Dict[str, Any]:
-        return {
-            'id': appointment.id,
-            'date': appointment.date,
-            'time': appointment.time,
-            'status': appointment.status.name.lower(),
-            'patient': {
-                'id': appointment.patient.id,
-                'name': appointment.patient.name,
-                'email': str(appointment.patient.email),
-            },
-            'doctor': {
-                'id': appointment.doctor.id,
-                'name': appointment.doctor.name,
-                'email': str(appointment.doctor.email),
-                'specialty': appointment.doctor.specialty,
-            },
-            'created_at': appointment.created_at,
-            'updated_at': appointment.updated_at,
-            'reason': getattr(appointment, 'reason', None),
-        }
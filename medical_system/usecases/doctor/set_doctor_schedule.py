@@ -0,0 +1,32 @@
+from medical_system.usecases.dtos.doctor_dto import DoctorScheduleDTO
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.value_objects.schedule_template import ScheduleTemplate
+
+class SetDoctorScheduleUseCase:
+    def __init__(self, doctor_repository: DoctorRepository):
+        self.doctor_repository = doctor_repository
+
+    def execute(self, doctor_id: int, schedule_dto: DoctorScheduleDTO) -> DoctorScheduleDTO:
+        doctor = self.doctor_repository.find_by_id(doctor_id)
+        if not doctor:
+            raise ValueError("Doctor not found")
+
+        try:
+            schedule = ScheduleTemplate.from_dict({
+                "weekly": schedule_dto.weekly,
+                "exceptions": schedule_dto.exceptions,
+                "holidays": schedule_dto.holidays,
+            })
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid schedule template: {e}")
+
+        # Una plantilla nueva trae sus propias máscaras compiladas; la
+        # anterior se descarta con las suyas.
+        doctor.schedule = schedule
+        updated_doctor = self.doctor_repository.update(doctor)
+
+        return self.to_dto(updated_doctor.schedule_template)
+
+    @staticmethod
+    def to_dto(schedule: ScheduleTemplate) -> DoctorScheduleDTO:
+        return DoctorScheduleDTO(**schedule.to_dict())
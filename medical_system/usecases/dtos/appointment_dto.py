@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import date, time, datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from medical_system.usecases.dtos.doctor_dto import DoctorDTO
 from medical_system.usecases.dtos.patient_dto import PatientDTO
 
@@ -10,6 +10,7 @@ class CreateAppointmentDTO:
     doctor_id: int
     date: date
     time: time
+    duration_minutes: int = 30
 
     def __post_init__(self):
         if isinstance(self.date, str):
@@ -54,6 +55,7 @@ class AppointmentDTO(AppointmentListDTO):
     updated_at: Optional[datetime] = None
     notes: Optional[str] = None
     reason: Optional[str] = None
+    duration_minutes: int = 30
     
     def to_dict(self) -> Dict[str, Any]:
         base_dict = super().to_dict()
@@ -76,12 +78,19 @@ class AppointmentDTO(AppointmentListDTO):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'notes': self.notes,
-            'reason': self.reason
+            'reason': self.reason,
+            'duration_minutes': self.duration_minutes
         })
         
         return base_dict
 
 
+@dataclass
+class AppointmentPageDTO:
+    items: List[AppointmentDTO]
+    next_cursor: Optional[str] = None
+
+
 @dataclass
 class UpdateAppointmentDTO:
     appointment_id: int
@@ -129,7 +138,7 @@ class RescheduleAppointmentDTO:
     new_date: date
     new_time: time
     reason: Optional[str] = None
-    requesting_user_id: Optional[int] = None
+    requested_by: Optional[int] = None
     
     def __post_init__(self):
         if isinstance(self.new_date, str):
@@ -148,7 +157,7 @@ class RescheduleAppointmentDTO:
             'new_date': self.new_date.isoformat(),
             'new_time': self.new_time.isoformat(),
             'reason': self.reason,
-            'requesting_user_id': self.requesting_user_id
+            'requested_by': self.requested_by
         }
 
 
@@ -168,3 +177,105 @@ class TimeSlotDTO:
             'duration_minutes': self.duration_minutes,
             'is_available': self.is_available
         }
+
+
+@dataclass
+class EarliestSlotsRequestDTO:
+    specialty: str
+    start_date: date
+    end_date: date
+    duration_minutes: int = 30
+    limit: int = 5
+    
+    def __post_init__(self):
+        if isinstance(self.start_date, str):
+            self.start_date = datetime.strptime(self.start_date, "%Y-%m-%d").date()
+        if isinstance(self.end_date, str):
+            self.end_date = datetime.strptime(self.end_date, "%Y-%m-%d").date()
+
+
+@dataclass
+class EarliestSlotDTO:
+    doctor_id: int
+    doctor_name: str
+    date: date
+    start_time: time
+    end_time: time
+    duration_minutes: int
+    
+    def to_dict(self) -> dict:
+        return {
+            'doctor_id': self.doctor_id,
+            'doctor_name': self.doctor_name,
+            'date': self.date.isoformat(),
+            'start_time': self.start_time.isoformat(),
+            'end_time': self.end_time.isoformat(),
+            'duration_minutes': self.duration_minutes
+        }
+
+
+@dataclass
+class AvailabilityCalendarRequestDTO:
+    doctor_id: int
+    start_date: date
+    weeks: int = 4
+    duration_minutes: int = 30
+    
+    def __post_init__(self):
+        if isinstance(self.start_date, str):
+            self.start_date = datetime.strptime(self.start_date, "%Y-%m-%d").date()
+
+
+@dataclass
+class DayAvailabilityDTO:
+    date: date
+    slots: List[TimeSlotDTO]
+    
+    def to_dict(self) -> dict:
+        return {
+            'date': self.date.isoformat(),
+            'slots': [slot.to_dict() for slot in self.slots]
+        }
+
+
+@dataclass
+class AvailabilityGridRequestDTO:
+    doctor_ids: List[int]
+    start_date: date
+    end_date: date
+    duration_minutes: int = 30
+    
+    def __post_init__(self):
+        if isinstance(self.start_date, str):
+            self.start_date = datetime.strptime(self.start_date, "%Y-%m-%d").date()
+        if isinstance(self.end_date, str):
+            self.end_date = datetime.strptime(self.end_date, "%Y-%m-%d").date()
+
+
+@dataclass
+class DoctorAvailabilityDTO:
+    doctor_id: int
+    doctor_name: str
+    days: List[DayAvailabilityDTO]
+    
+    def to_dict(self) -> dict:
+        return {
+            'doctor_id': self.doctor_id,
+            'doctor_name': self.doctor_name,
+            'days': [day.to_dict() for day in self.days]
+        }
+
+
+@dataclass
+class AppointmentBatchItemDTO:
+    index: int
+    success: bool
+    appointment: Optional[AppointmentDTO] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class AppointmentBatchResultDTO:
+    created: int
+    rejected: int
+    results: List[AppointmentBatchItemDTO]
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 @dataclass
 class CreateDoctorDTO:
@@ -19,3 +19,16 @@ class DoctorDTO:
     name: str
     email: str
     specialty: str
+
+@dataclass
+class DoctorScheduleDTO:
+    # Mismo formato que ScheduleTemplate.to_dict: siete días (lunes primero)
+    # con {"start", "end", "breaks"} o null, excepciones por fecha y festivos.
+    weekly: List[Optional[Dict[str, Any]]]
+    exceptions: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+    holidays: List[str] = field(default_factory=list)
+
+@dataclass
+class DoctorPageDTO:
+    items: List[DoctorDTO]
+    next_cursor: Optional[str] = None
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 @dataclass
 class CreatePatientDTO:
@@ -21,3 +21,8 @@ class PatientDTO:
     name: str
     email: str
     birth_date: date
+
+@dataclass
+class PatientPageDTO:
+    items: List[PatientDTO]
+    next_cursor: Optional[str] = None
@@ -0,0 +1 @@
+"""Pruebas unitarias para la capa HTTP de la API."""
@@ -0,0 +1,66 @@
+import json
+import pytest
+from datetime import date, datetime, time
+from typing import List
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from medical_system.interfaces.api.serialization import FastJSONResponse, dumps, serializer_for
+from medical_system.usecases.dtos.appointment_dto import (
+    AppointmentDTO,
+    AppointmentPageDTO,
+    DayAvailabilityDTO,
+    DoctorAvailabilityDTO,
+    TimeSlotDTO
+)
+from medical_system.usecases.dtos.doctor_dto import DoctorDTO
+from medical_system.usecases.dtos.patient_dto import PatientDTO
+
+class TestSerialization:
+
+    @pytest.fixture
+    def page(self):
+        appointment = AppointmentDTO(
+            id=1,
+            date=date(2030, 1, 7),
+            time=time(10, 30),
+            status="Programada",
+            patient_name="Juan Pérez",
+            doctor_name="Dr. Carlos García",
+            patient=PatientDTO(id=1, name="Juan Pérez", email="juan@example.com", birth_date=date(1990, 1, 1)),
+            doctor=DoctorDTO(id=2, name="Dr. Carlos García", email="dr.garcia@example.com", specialty="Cardiología"),
+            created_at=datetime(2030, 1, 1, 9, 15, 0, 250),
+            duration_minutes=60
+        )
+        return AppointmentPageDTO(items=[appointment, AppointmentDTO(
+            id=2, date=date(2030, 1, 8), time=time(9, 0), status="Cancelada",
+            patient_name="Ana López", doctor_name="Dr. Carlos García"
+        )], next_cursor="abc")
+
+    @staticmethod
+    async def _response_model_json(model, content):
+        field = create_model_field(name="response", type_=model, mode="serialization")
+        return await serialize_response(field=field, response_content=content)
+
+    @pytest.mark.asyncio
+    async def test_should_match_response_model_output(self, page):
+        calendar = [DoctorAvailabilityDTO(doctor_id=2, doctor_name="Dr. Carlos García", days=[
+            DayAvailabilityDTO(date=date(2030, 1, 7), slots=[
+                TimeSlotDTO(id=1, start_time=time(9, 0), end_time=time(9, 30), duration_minutes=30)
+            ])
+        ])]
+
+        assert json.loads(dumps(page)) == await self._response_model_json(AppointmentPageDTO, page)
+        assert json.loads(dumps(calendar)) == await self._response_model_json(List[DoctorAvailabilityDTO], calendar)
+
+    def test_should_compile_one_serializer_per_class(self, page):
+        serializer = serializer_for(AppointmentDTO)
+
+        assert serializer_for(AppointmentDTO) is serializer
+        assert serializer(page.items[1])["patient"] is None
+        assert serializer(page.items[0])["time"] == "10:30:00"
+
+    def test_should_render_without_ascii_escapes(self, page):
+        body = FastJSONResponse(page).body
+
+        assert "Cardiología".encode("utf-8") in body
+        assert FastJSONResponse(page).headers["content-type"] == "application/json"
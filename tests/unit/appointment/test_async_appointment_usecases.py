@@ -0,0 +1,96 @@
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.infrastructure.persistence.executor.executor_repositories import (
+    ExecutorAppointmentRepository,
+    ExecutorDoctorRepository,
+    ExecutorPatientRepository,
+)
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.usecases.appointment.create_appointment import AsyncCreateAppointmentUseCase
+from medical_system.usecases.appointment.get_available_slots import AsyncGetAvailableSlotsUseCase
+from medical_system.usecases.appointment.list_all_appointments import AsyncListAllAppointmentsUseCase
+from medical_system.usecases.dtos.appointment_dto import CreateAppointmentDTO
+
+class TestAsyncAppointmentUseCases:
+
+    @pytest.fixture(params=[True, False], ids=["offload", "inline"])
+    def repos(self, request):
+        offload = request.param
+        return (
+            ExecutorAppointmentRepository(InMemoryAppointmentRepository(), offload=offload),
+            ExecutorPatientRepository(InMemoryPatientRepository(), offload=offload),
+            ExecutorDoctorRepository(InMemoryDoctorRepository(), offload=offload),
+        )
+
+    @pytest.fixture
+    def next_monday(self):
+        today = date.today()
+        return today + timedelta(days=7 - today.weekday())
+
+    async def _people(self, repos):
+        _, patient_repo, doctor_repo = repos
+        patient = await patient_repo.save(Patient(
+            name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1)
+        ))
+        doctor = await doctor_repo.save(Doctor(
+            name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"
+        ))
+        return patient, doctor
+
+    @pytest.mark.asyncio
+    async def test_should_create_appointment(self, repos, next_monday):
+        patient, doctor = await self._people(repos)
+        use_case = AsyncCreateAppointmentUseCase(*repos)
+
+        result = await use_case.execute(CreateAppointmentDTO(
+            patient_id=patient.id, doctor_id=doctor.id, date=next_monday, time=time(10, 0)
+        ))
+
+        assert result.id is not None
+        assert result.patient_name == "Juan Pérez"
+        assert await repos[0].get_occupancy_mask(doctor.id, next_monday) != 0
+
+    @pytest.mark.asyncio
+    async def test_should_reject_second_appointment_same_day(self, repos, next_monday):
+        patient, doctor = await self._people(repos)
+        use_case = AsyncCreateAppointmentUseCase(*repos)
+        request = CreateAppointmentDTO(
+            patient_id=patient.id, doctor_id=doctor.id, date=next_monday, time=time(10, 0)
+        )
+        await use_case.execute(request)
+
+        with pytest.raises(ValueError, match="Ya existe una cita idéntica"):
+            await use_case.execute(request)
+        with pytest.raises(ValueError, match="Solo puedes tener una cita por día"):
+            await use_case.execute(CreateAppointmentDTO(
+                patient_id=patient.id, doctor_id=doctor.id, date=next_monday, time=time(11, 0)
+            ))
+
+    @pytest.mark.asyncio
+    async def test_should_reject_unknown_patient(self, repos, next_monday):
+        _, doctor = await self._people(repos)
+        use_case = AsyncCreateAppointmentUseCase(*repos)
+
+        with pytest.raises(ValueError, match="No se encontró el paciente con ID: 999"):
+            await use_case.execute(CreateAppointmentDTO(
+                patient_id=999, doctor_id=doctor.id, date=next_monday, time=time(10, 0)
+            ))
+
+    @pytest.mark.asyncio
+    async def test_should_exclude_booked_slot_and_stream_it(self, repos, next_monday):
+        patient, doctor = await self._people(repos)
+        await AsyncCreateAppointmentUseCase(*repos).execute(CreateAppointmentDTO(
+            patient_id=patient.id, doctor_id=doctor.id, date=next_monday, time=time(10, 0)
+        ))
+
+        slots = await AsyncGetAvailableSlotsUseCase(repos[0], repos[2]).list_slots(doctor, next_monday, 30)
+        streamed = [dto async for dto in AsyncListAllAppointmentsUseCase(repos[0]).stream()]
+
+        assert time(10, 0) not in [slot.start_time for slot in slots]
+        assert time(9, 30) in [slot.start_time for slot in slots]
+        assert [row["time"] for row in streamed] == ["10:00:00"]
@@ -8,6 +8,7 @@ from medical_system.domain.entities.doctor import Doctor
 from medical_system.domain.entities.appointment import Appointment
 from medical_system.domain.value_objects.email import Email
 from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.ports.repositories.patient_repository import PatientRepository
 from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
@@ -48,7 +49,11 @@ class TestCreateAppointmentUseCase:
     
     @pytest.fixture
     def appointment_datetime(self):
-        return datetime.now() + timedelta(days=2)
+        # Un día de lunes a jueves, dentro del horario por defecto.
+        moment = datetime.now() + timedelta(days=2)
+        while moment.weekday() > 3:
+            moment += timedelta(days=1)
+        return moment
     
     @pytest.fixture
     def appointment_data(self, appointment_datetime):
@@ -67,6 +72,7 @@ class TestCreateAppointmentUseCase:
         appointment_repo.find_by_doctor_patient_datetime.return_value = None
         appointment_repo.find_patient_appointments_at_same_time.return_value = []
         appointment_repo.find_by_patient_and_date.return_value = []
+        appointment_repo.get_occupancy_mask.return_value = 0
         
         return CreateAppointmentUseCase(
             appointment_repository=appointment_repo,
@@ -86,13 +92,13 @@ class TestCreateAppointmentUseCase:
             status=AppointmentStatus.SCHEDULED
         )
         saved_appointment.id = 1
-        appointment_repo.save.return_value = saved_appointment
+        appointment_repo.reserve_slot.return_value = saved_appointment
         
         result = use_case.execute(appointment_data)
         
         assert result.id == 1
         assert result.status == AppointmentStatus.SCHEDULED.value.lower()
-        appointment_repo.save.assert_called_once()
+        appointment_repo.reserve_slot.assert_called_once()
     
     def test_should_raise_error_when_patient_not_found(self, use_case, patient_repo, appointment_data):
         patient_repo.find_by_id.return_value = None
@@ -155,3 +161,73 @@ class TestCreateAppointmentUseCase:
         
         with pytest.raises(ValueError, match="Solo puedes tener una cita por día"):
             use_case.execute(appointment_data)
+
+    def test_should_raise_error_when_outside_doctor_schedule(
+        self, use_case, appointment_repo, appointment_data, doctor
+    ):
+        doctor.schedule = ScheduleTemplate(weekly=(DaySchedule(time(8, 0), time(10, 0)),) * 7)
+
+        with pytest.raises(ValueError, match="El doctor no atiende en el horario solicitado"):
+            use_case.execute(appointment_data)
+        appointment_repo.reserve_slot.assert_not_called()
+
+    def test_should_apply_default_schedule_to_doctors_without_template(
+        self, use_case, appointment_repo, appointment_data, appointment_datetime
+    ):
+        appointment_data.time = time(19, 30)
+        with pytest.raises(ValueError, match="El doctor no atiende en el horario solicitado"):
+            use_case.execute(appointment_data)
+
+        appointment_data.time = time(10, 0)
+        appointment_data.date = appointment_datetime.date() + timedelta(days=5 - appointment_datetime.weekday())
+        with pytest.raises(ValueError, match="El doctor no atiende en el horario solicitado"):
+            use_case.execute(appointment_data)
+        appointment_repo.reserve_slot.assert_not_called()
+
+    def test_should_raise_error_when_doctor_slot_is_occupied(
+        self, use_case, appointment_repo, appointment_data
+    ):
+        appointment_repo.get_occupancy_mask.return_value = 1 << 4  # 10:00
+        
+        with pytest.raises(ValueError, match="El doctor no está disponible"):
+            use_case.execute(appointment_data)
+    
+    def test_should_raise_error_when_longer_appointment_overlaps_next_slot(
+        self, use_case, appointment_repo, appointment_data
+    ):
+        appointment_repo.get_occupancy_mask.return_value = 1 << 6  # 11:00
+        appointment_data.duration_minutes = 90
+
+        with pytest.raises(ValueError, match="El doctor no está disponible"):
+            use_case.execute(appointment_data)
+        appointment_repo.reserve_slot.assert_not_called()
+
+    def test_should_raise_error_when_appointment_runs_past_doctor_schedule(
+        self, use_case, appointment_repo, appointment_data, doctor
+    ):
+        doctor.schedule = ScheduleTemplate(weekly=(DaySchedule(time(9, 0), time(10, 30)),) * 7)
+        appointment_data.duration_minutes = 60
+
+        with pytest.raises(ValueError, match="El doctor no atiende en el horario solicitado"):
+            use_case.execute(appointment_data)
+
+    def test_should_create_appointment_when_only_adjacent_slots_are_occupied(
+        self, use_case, appointment_repo, appointment_data, patient, doctor, appointment_datetime
+    ):
+        appointment_repo.get_occupancy_mask.return_value = (1 << 3) | (1 << 5)  # 9:30 y 10:30
+        saved_appointment = Appointment(
+            date=appointment_datetime.date(),
+            time=time(10, 0),
+            patient=patient,
+            doctor=doctor,
+            status=AppointmentStatus.SCHEDULED
+        )
+        saved_appointment.id = 1
+        appointment_repo.reserve_slot.return_value = saved_appointment
+        
+        result = use_case.execute(appointment_data)
+        
+        assert result.id == 1
+        appointment_repo.get_occupancy_mask.assert_called_once_with(
+            doctor_id=1, date=appointment_datetime.date()
+        )
@@ -0,0 +1,122 @@
+import pytest
+from unittest.mock import create_autospec
+from datetime import date, time, timedelta
+from medical_system.usecases.appointment.create_appointments_batch import CreateAppointmentsBatchUseCase
+from medical_system.usecases.dtos.appointment_dto import CreateAppointmentDTO
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.patient_repository import PatientRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+
+class TestCreateAppointmentsBatchUseCase:
+
+    @pytest.fixture
+    def appointment_repo(self):
+        return InMemoryAppointmentRepository()
+
+    @pytest.fixture
+    def patient_repo(self):
+        repo = InMemoryPatientRepository()
+        for index in range(3):
+            repo.save(Patient(
+                name=f"Paciente {index}",
+                email=Email(f"paciente{index}@example.com"),
+                birth_date=date(1990, 1, 1)
+            ))
+        return repo
+
+    @pytest.fixture
+    def doctor_repo(self):
+        repo = InMemoryDoctorRepository()
+        repo.save(Doctor(name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"))
+        return repo
+
+    @pytest.fixture
+    def use_case(self, appointment_repo, patient_repo, doctor_repo):
+        return CreateAppointmentsBatchUseCase(appointment_repo, patient_repo, doctor_repo)
+
+    @pytest.fixture
+    def day(self):
+        # Un día de lunes a jueves, dentro del horario por defecto.
+        day = date.today() + timedelta(days=2)
+        while day.weekday() > 3:
+            day += timedelta(days=1)
+        return day
+
+    def test_should_create_all_valid_appointments(self, use_case, appointment_repo, day):
+        result = use_case.execute([
+            CreateAppointmentDTO(patient_id=1, doctor_id=1, date=day, time=time(9, 0)),
+            CreateAppointmentDTO(patient_id=2, doctor_id=1, date=day, time=time(9, 30)),
+        ])
+
+        assert (result.created, result.rejected) == (2, 0)
+        assert [item.appointment.id for item in result.results] == [1, 2]
+        assert appointment_repo.get_occupancy_mask(1, day) == (1 << 2) | (1 << 3)
+
+    def test_should_detect_conflicts_within_the_batch(self, use_case, day):
+        result = use_case.execute([
+            CreateAppointmentDTO(patient_id=1, doctor_id=1, date=day, time=time(9, 0)),
+            CreateAppointmentDTO(patient_id=2, doctor_id=1, date=day, time=time(9, 0)),
+            CreateAppointmentDTO(patient_id=1, doctor_id=1, date=day, time=time(11, 0)),
+            CreateAppointmentDTO(patient_id=3, doctor_id=1, date=day, time=time(11, 0)),
+        ])
+
+        assert [item.success for item in result.results] == [True, False, False, True]
+        assert "no está disponible" in result.results[1].error
+        assert result.results[2].error == "Solo puedes tener una cita por día"
+
+    def test_should_detect_conflicts_with_existing_appointments(self, use_case, day):
+        use_case.execute([CreateAppointmentDTO(patient_id=1, doctor_id=1, date=day, time=time(9, 0))])
+
+        result = use_case.execute([
+            CreateAppointmentDTO(patient_id=1, doctor_id=1, date=day, time=time(9, 0)),
+            CreateAppointmentDTO(patient_id=2, doctor_id=1, date=day, time=time(9, 0)),
+            CreateAppointmentDTO(patient_id=9, doctor_id=1, date=day, time=time(10, 0)),
+            CreateAppointmentDTO(patient_id=3, doctor_id=1, date=day, time=time(21, 0)),
+        ])
+
+        assert result.created == 0
+        assert result.results[0].error == "Ya existe una cita idéntica"
+        assert "no está disponible" in result.results[1].error
+        assert result.results[2].error == "No se encontró el paciente con ID: 9"
+        assert result.results[3].error is not None
+
+    def test_should_query_each_agenda_once(self, day):
+        appointment_repo = create_autospec(AppointmentRepository, instance=True)
+        appointment_repo.get_occupancy_mask.return_value = 0
+        appointment_repo.find_by_patient_and_date.return_value = []
+        appointment_repo.reserve_many.side_effect = lambda appointments: list(appointments)
+        patient_repo = create_autospec(PatientRepository, instance=True)
+        patient_repo.find_by_id.side_effect = lambda pid: Patient.restore(
+            pid, name=f"Paciente {pid}", email=Email(f"p{pid}@example.com"), birth_date=date(1990, 1, 1)
+        )
+        doctor_repo = create_autospec(DoctorRepository, instance=True)
+        doctor_repo.find_by_id.return_value = Doctor.restore(
+            1, name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"
+        )
+        use_case = CreateAppointmentsBatchUseCase(appointment_repo, patient_repo, doctor_repo)
+
+        use_case.execute([
+            CreateAppointmentDTO(patient_id=pid, doctor_id=1, date=day, time=time(hour, 0))
+            for pid, hour in zip(range(1, 6), (9, 10, 11, 12, 14))
+        ])
+
+        doctor_repo.find_by_id.assert_called_once_with(1)
+        appointment_repo.get_occupancy_mask.assert_called_once_with(doctor_id=1, date=day)
+        appointment_repo.reserve_many.assert_called_once()
+        assert len(appointment_repo.reserve_many.call_args.args[0]) == 5
+        appointment_repo.reserve_slot.assert_not_called()
+        appointment_repo.save.assert_not_called()
+
+    def test_should_reject_empty_and_oversized_batches(self, use_case, day):
+        with pytest.raises(ValueError):
+            use_case.execute([])
+        with pytest.raises(ValueError):
+            use_case.execute([
+                CreateAppointmentDTO(patient_id=1, doctor_id=1, date=day, time=time(9, 0))
+            ] * (CreateAppointmentsBatchUseCase.MAX_BATCH_SIZE + 1))
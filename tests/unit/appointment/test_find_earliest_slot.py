@@ -0,0 +1,102 @@
+import pytest
+from datetime import date, time, timedelta
+from unittest.mock import create_autospec
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.exceptions import ValidationError
+from medical_system.usecases.appointment.find_earliest_slot import FindEarliestSlotUseCase
+from medical_system.usecases.dtos.appointment_dto import EarliestSlotsRequestDTO
+
+def _next_weekday(weekday: int) -> date:
+    day = date.today() + timedelta(days=1)
+    while day.weekday() != weekday:
+        day += timedelta(days=1)
+    return day
+
+class TestFindEarliestSlotUseCase:
+
+    @pytest.fixture
+    def monday(self):
+        return _next_weekday(0)
+
+    @pytest.fixture
+    def doctors(self):
+        first = Doctor(name="Dr. Carlos García", email=Email("garcia@example.com"), specialty="Cardiología")
+        first.id = 1
+        second = Doctor(name="Dra. Ana López", email=Email("lopez@example.com"), specialty="Cardiología")
+        second.id = 2
+        return [first, second]
+
+    @pytest.fixture
+    def appointment_repo(self):
+        repo = create_autospec(AppointmentRepository, instance=True)
+        repo.get_occupancy_mask.return_value = 0
+        return repo
+
+    @pytest.fixture
+    def doctor_repo(self, doctors):
+        repo = create_autospec(DoctorRepository, instance=True)
+        repo.find_by_specialty.return_value = doctors
+        return repo
+
+    @pytest.fixture
+    def use_case(self, appointment_repo, doctor_repo):
+        return FindEarliestSlotUseCase(appointment_repo, doctor_repo)
+
+    def test_should_merge_slots_of_all_doctors_in_chronological_order(self, use_case, monday):
+        result = use_case.execute(EarliestSlotsRequestDTO(
+            specialty="Cardiología", start_date=monday, end_date=monday + timedelta(days=4), limit=4
+        ))
+
+        assert [(r.start_time, r.doctor_id) for r in result] == [
+            (time(9, 0), 1), (time(9, 0), 2), (time(9, 30), 1), (time(9, 30), 2)
+        ]
+        assert all(r.date == monday for r in result)
+
+    def test_should_prefer_doctor_with_earlier_free_slot(self, use_case, appointment_repo, monday):
+        appointment_repo.get_occupancy_mask.side_effect = (
+            lambda doctor_id, date: 0b111100 if doctor_id == 1 else 0
+        )
+
+        result = use_case.execute(EarliestSlotsRequestDTO(
+            specialty="Cardiología", start_date=monday, end_date=monday, limit=3
+        ))
+
+        assert [(r.start_time, r.doctor_id) for r in result] == [
+            (time(9, 0), 2), (time(9, 30), 2), (time(10, 0), 2)
+        ]
+
+    def test_should_stop_computing_once_limit_is_reached(self, use_case, appointment_repo, monday):
+        use_case.execute(EarliestSlotsRequestDTO(
+            specialty="Cardiología", start_date=monday, end_date=monday + timedelta(days=4), limit=2
+        ))
+
+        assert appointment_repo.get_occupancy_mask.call_count == 2
+
+    def test_should_skip_days_without_availability(self, use_case, appointment_repo, monday):
+        appointment_repo.get_occupancy_mask.side_effect = (
+            lambda doctor_id, date: (1 << 24) - 1 if date == monday else 0
+        )
+
+        result = use_case.execute(EarliestSlotsRequestDTO(
+            specialty="Cardiología", start_date=monday, end_date=monday + timedelta(days=1), limit=1
+        ))
+
+        assert result[0].date == monday + timedelta(days=1)
+
+    def test_should_return_empty_list_when_no_doctors_in_specialty(self, use_case, doctor_repo, monday):
+        doctor_repo.find_by_specialty.return_value = []
+
+        result = use_case.execute(EarliestSlotsRequestDTO(
+            specialty="Neurología", start_date=monday, end_date=monday
+        ))
+
+        assert result == []
+
+    def test_should_raise_error_when_window_is_inverted(self, use_case, monday):
+        with pytest.raises(ValidationError):
+            use_case.execute(EarliestSlotsRequestDTO(
+                specialty="Cardiología", start_date=monday, end_date=monday - timedelta(days=1)
+            ))
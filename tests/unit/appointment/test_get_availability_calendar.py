@@ -0,0 +1,79 @@
+import pytest
+from datetime import date, time, timedelta
+from unittest.mock import create_autospec
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.exceptions import ResourceNotFoundError, ValidationError
+from medical_system.usecases.appointment.get_availability_calendar import GetAvailabilityCalendarUseCase
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.dtos.appointment_dto import AvailabilityCalendarRequestDTO
+
+def _next_weekday(weekday: int) -> date:
+    day = date.today() + timedelta(days=1)
+    while day.weekday() != weekday:
+        day += timedelta(days=1)
+    return day
+
+class TestGetAvailabilityCalendarUseCase:
+
+    @pytest.fixture
+    def monday(self):
+        return _next_weekday(0)
+
+    @pytest.fixture
+    def appointment_repo(self):
+        repo = create_autospec(AppointmentRepository, instance=True)
+        repo.get_occupancy_masks.return_value = {}
+        return repo
+
+    @pytest.fixture
+    def doctor_repo(self):
+        repo = create_autospec(DoctorRepository, instance=True)
+        doctor = Doctor(
+            name="Dr. Carlos García",
+            email=Email("dr.garcia@example.com"),
+            specialty="Cardiología"
+        )
+        doctor.id = 1
+        repo.find_by_id.return_value = doctor
+        return repo
+
+    @pytest.fixture
+    def use_case(self, appointment_repo, doctor_repo):
+        return GetAvailabilityCalendarUseCase(appointment_repo, doctor_repo)
+
+    def test_should_return_work_days_with_a_single_repository_call(self, use_case, appointment_repo, monday):
+        calendar = use_case.execute(AvailabilityCalendarRequestDTO(doctor_id=1, start_date=monday, weeks=2))
+
+        assert [day.date.weekday() for day in calendar] == [0, 1, 2, 3, 4] * 2
+        appointment_repo.get_occupancy_masks.assert_called_once_with(
+            doctor_id=1, start_date=monday, end_date=monday + timedelta(days=13)
+        )
+        appointment_repo.get_occupancy_mask.assert_not_called()
+
+    def test_should_match_per_day_slots(self, use_case, appointment_repo, doctor_repo, monday):
+        busy = {monday: (1 << 2) | (1 << 4), monday + timedelta(days=4): 1 << 3}
+        appointment_repo.get_occupancy_masks.return_value = busy
+        appointment_repo.get_occupancy_mask.side_effect = lambda doctor_id, date: busy.get(date, 0)
+        per_day = GetAvailableSlotsUseCase(appointment_repo, doctor_repo)
+        doctor = doctor_repo.find_by_id.return_value
+
+        calendar = use_case.execute(
+            AvailabilityCalendarRequestDTO(doctor_id=1, start_date=monday, weeks=1, duration_minutes=60)
+        )
+
+        for day in calendar:
+            assert day.slots == per_day.list_slots(doctor, day.date, 60)
+        assert time(9, 0) not in [slot.start_time for slot in calendar[0].slots]
+
+    def test_should_raise_error_when_doctor_not_found(self, use_case, doctor_repo, monday):
+        doctor_repo.find_by_id.return_value = None
+
+        with pytest.raises(ResourceNotFoundError):
+            use_case.execute(AvailabilityCalendarRequestDTO(doctor_id=1, start_date=monday))
+
+    def test_should_reject_too_many_weeks(self, use_case, monday):
+        with pytest.raises(ValidationError):
+            use_case.execute(AvailabilityCalendarRequestDTO(doctor_id=1, start_date=monday, weeks=9))
@@ -0,0 +1,83 @@
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
+from medical_system.domain.exceptions import ResourceNotFoundError, ValidationError
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.usecases.appointment.get_availability_grid import GetAvailabilityGridUseCase
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.dtos.appointment_dto import AvailabilityGridRequestDTO
+
+def _next_weekday(weekday: int) -> date:
+    day = date.today() + timedelta(days=1)
+    while day.weekday() != weekday:
+        day += timedelta(days=1)
+    return day
+
+class TestGetAvailabilityGridUseCase:
+
+    @pytest.fixture
+    def monday(self):
+        return _next_weekday(0)
+
+    @pytest.fixture
+    def appointment_repo(self):
+        return InMemoryAppointmentRepository()
+
+    @pytest.fixture
+    def doctor_repo(self):
+        repo = InMemoryDoctorRepository()
+        repo.save(Doctor(
+            name="Dr. Carlos García",
+            email=Email("dr.garcia@example.com"),
+            specialty="Cardiología"
+        ))
+        repo.save(Doctor(
+            name="Dra. Ana López",
+            email=Email("ana@example.com"),
+            specialty="Pediatría",
+            schedule=ScheduleTemplate(weekly=(None,) * 5 + (DaySchedule(time(9, 0), time(12, 0)),) * 2)
+        ))
+        return repo
+
+    @pytest.fixture
+    def use_case(self, appointment_repo, doctor_repo):
+        return GetAvailabilityGridUseCase(appointment_repo, doctor_repo)
+
+    def test_should_match_per_day_slots_for_every_doctor(self, use_case, appointment_repo, doctor_repo, monday):
+        garcia, lopez = doctor_repo.find_all()
+        patient = Patient(name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1))
+        patient.id = 1
+        appointment_repo.reserve_slot(Appointment(
+            date=monday, time=time(10, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=garcia, duration_minutes=60
+        ))
+
+        grid = use_case.execute(AvailabilityGridRequestDTO(
+            doctor_ids=[garcia.id, lopez.id], start_date=monday, end_date=monday + timedelta(days=6)
+        ))
+
+        per_day = GetAvailableSlotsUseCase(appointment_repo, doctor_repo)
+        assert [row.doctor_id for row in grid] == [garcia.id, lopez.id]
+        assert [day.date.weekday() for day in grid[0].days] == [0, 1, 2, 3, 4]
+        assert [day.date.weekday() for day in grid[1].days] == [5, 6]
+        for row, doctor in zip(grid, (garcia, lopez)):
+            for day in row.days:
+                assert day.slots == per_day.list_slots(doctor, day.date, 30)
+        assert time(10, 30) not in [slot.start_time for slot in grid[0].days[0].slots]
+
+    def test_should_raise_error_when_a_doctor_is_missing(self, use_case, monday):
+        with pytest.raises(ResourceNotFoundError, match="El doctor 999 no existe"):
+            use_case.execute(AvailabilityGridRequestDTO(doctor_ids=[1, 999], start_date=monday, end_date=monday))
+
+    @pytest.mark.parametrize("doctor_ids, days", [([], 1), ([1], 31), ([1], -1)])
+    def test_should_reject_invalid_ranges(self, use_case, monday, doctor_ids, days):
+        with pytest.raises(ValidationError):
+            use_case.execute(AvailabilityGridRequestDTO(
+                doctor_ids=doctor_ids, start_date=monday, end_date=monday + timedelta(days=days)
+            ))
@@ -0,0 +1,106 @@
+import pytest
+from datetime import date, time, timedelta
+from unittest.mock import create_autospec
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+from medical_system.domain.exceptions import ResourceNotFoundError, BusinessRuleViolationError
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
+from medical_system.usecases.appointment.get_available_slots import GetAvailableSlotsUseCase
+from medical_system.usecases.dtos.appointment_dto import AvailableSlotsRequestDTO
+
+def _next_weekday(weekday: int) -> date:
+    day = date.today() + timedelta(days=1)
+    while day.weekday() != weekday:
+        day += timedelta(days=1)
+    return day
+
+class TestGetAvailableSlotsUseCase:
+
+    @pytest.fixture
+    def appointment_repo(self):
+        repo = create_autospec(AppointmentRepository, instance=True)
+        repo.get_occupancy_mask.return_value = 0
+        return repo
+
+    @pytest.fixture
+    def doctor_repo(self):
+        repo = create_autospec(DoctorRepository, instance=True)
+        doctor = Doctor(
+            name="Dr. Carlos García",
+            email=Email("dr.garcia@example.com"),
+            specialty="Cardiología"
+        )
+        doctor.id = 1
+        repo.find_by_id.return_value = doctor
+        return repo
+
+    @pytest.fixture
+    def use_case(self, appointment_repo, doctor_repo):
+        return GetAvailableSlotsUseCase(appointment_repo, doctor_repo)
+
+    def test_should_return_all_slots_outside_lunch_when_day_is_free(self, use_case):
+        slots = use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=_next_weekday(0)))
+
+        starts = [slot.start_time for slot in slots]
+        assert len(slots) == 16
+        assert starts[0] == time(9, 0)
+        assert starts[-1] == time(17, 30)
+        assert time(13, 0) not in starts and time(13, 30) not in starts
+
+    def test_should_skip_occupied_slots(self, use_case, appointment_repo):
+        appointment_repo.get_occupancy_mask.return_value = (1 << 2) | (1 << 4)  # 9:00 y 10:00
+
+        slots = use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=_next_weekday(1)))
+
+        starts = [slot.start_time for slot in slots]
+        assert time(9, 0) not in starts
+        assert time(10, 0) not in starts
+        assert starts[0] == time(9, 30)
+
+    def test_should_only_return_runs_long_enough_for_duration(self, use_case, appointment_repo):
+        appointment_repo.get_occupancy_mask.return_value = 1 << 3  # 9:30
+
+        slots = use_case.execute(
+            AvailableSlotsRequestDTO(doctor_id=1, date=_next_weekday(4), duration_minutes=60)
+        )
+
+        assert [(s.start_time, s.end_time) for s in slots] == [
+            (time(10, 0), time(11, 0)),
+            (time(11, 0), time(12, 0)),
+        ]
+
+    def test_should_raise_error_when_doctor_not_found(self, use_case, doctor_repo):
+        doctor_repo.find_by_id.return_value = None
+
+        with pytest.raises(ResourceNotFoundError):
+            use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=_next_weekday(2)))
+
+    def test_should_raise_error_on_weekends(self, use_case):
+        with pytest.raises(BusinessRuleViolationError):
+            use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=_next_weekday(5)))
+
+    def test_should_follow_doctor_schedule_template(self, use_case, doctor_repo):
+        saturday = _next_weekday(5)
+        monday = _next_weekday(0)
+        doctor_repo.find_by_id.return_value.schedule = ScheduleTemplate(
+            weekly=(None,) * 5 + (DaySchedule(time(10, 0), time(12, 0), ((time(11, 0), time(11, 30)),)), None),
+            exceptions=((monday, DaySchedule(time(16, 0), time(17, 0))),)
+        )
+
+        weekend = use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=saturday))
+        exception = use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=monday))
+
+        assert [s.start_time for s in weekend] == [time(10, 0), time(10, 30), time(11, 30)]
+        assert [s.start_time for s in exception] == [time(16, 0), time(16, 30)]
+
+    def test_should_raise_error_on_holiday(self, use_case, doctor_repo):
+        tuesday = _next_weekday(1)
+        doctor_repo.find_by_id.return_value.schedule = ScheduleTemplate(
+            weekly=(DaySchedule(time(9, 0), time(17, 0)),) * 7,
+            holidays=frozenset({tuesday})
+        )
+
+        with pytest.raises(BusinessRuleViolationError):
+            use_case.execute(AvailableSlotsRequestDTO(doctor_id=1, date=tuesday))
@@ -1,11 +1,12 @@
 import pytest
-from datetime import date, time
+from datetime import date, time, timedelta
 from unittest.mock import create_autospec
 from medical_system.domain.entities.appointment import Appointment, AppointmentStatus
 from medical_system.domain.entities.doctor import Doctor
 from medical_system.domain.entities.patient import Patient
 from medical_system.domain.ports.repositories.appointment_repository import AppointmentRepository
 from medical_system.domain.value_objects.email import Email
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
 from medical_system.usecases.appointment.list_all_appointments import ListAllAppointmentsUseCase
 
 class TestListAllAppointmentsUseCase:
@@ -131,15 +132,127 @@ class TestListAllAppointmentsUseCase:
     ):
         from medical_system.domain.entities.appointment import AppointmentStatus
 
-        appointment_repo.find_all.return_value = [
-            scheduled_appointment,
-            completed_appointment,
-            cancelled_appointment
-        ]
+        appointment_repo.find_all.return_value = [scheduled_appointment]
         result = use_case.execute(status="scheduled")
         
         assert len(result) == 1
         assert result[0]['id'] == 1
         assert result[0]['status'] == "Programada"
         
-        appointment_repo.find_all.assert_called_once()
+        appointment_repo.find_all.assert_called_once_with(status=AppointmentStatus.SCHEDULED)
+
+
+class TestListAllAppointmentsStream:
+
+    @pytest.fixture
+    def stored(self, appointments):
+        repo = InMemoryAppointmentRepository()
+        repo.bulk_load(appointments)
+        return repo
+
+    @pytest.fixture
+    def appointment_repo(self, stored):
+        # find_page de verdad (en memoria) para seguir las llamadas.
+        repo = create_autospec(AppointmentRepository, instance=True)
+        repo.find_page.side_effect = stored.find_page
+        return repo
+
+    @pytest.fixture
+    def appointments(self):
+        patient = Patient(name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1))
+        patient.id = 1
+        doctor = Doctor(name="Dr. Ana López", email=Email("ana@example.com"), specialty="Cardiología")
+        doctor.id = 1
+        next_week = date.today() + timedelta(days=7)
+        result = []
+        for index, (day_offset, status) in enumerate([
+            (0, AppointmentStatus.SCHEDULED),
+            (1, AppointmentStatus.CANCELLED),
+            (2, AppointmentStatus.SCHEDULED),
+        ], start=1):
+            appointment = Appointment(
+                date=next_week + timedelta(days=day_offset),
+                time=time(10, 0),
+                patient=patient,
+                doctor=doctor,
+                status=status
+            )
+            appointment.id = index
+            result.append(appointment)
+        return result
+
+    @pytest.fixture
+    def use_case(self, appointment_repo):
+        return ListAllAppointmentsUseCase(appointment_repo)
+
+    def test_should_stream_rows_lazily_page_by_page(self, use_case, appointment_repo, monkeypatch):
+        monkeypatch.setattr(ListAllAppointmentsUseCase, "STREAM_PAGE_SIZE", 2)
+        rows = use_case.stream()
+
+        first = next(rows)
+
+        assert first['id'] == 1
+        appointment_repo.find_page.assert_called_once_with(None, 2)
+        assert [row['id'] for row in rows] == [2, 3]
+        assert appointment_repo.find_page.call_count == 2
+        appointment_repo.iter_all.assert_not_called()
+        appointment_repo.find_all.assert_not_called()
+
+    def test_should_delegate_stream_filters_to_the_repository(self, use_case, appointment_repo, appointments):
+        list(use_case.stream(doctor_id=1, status="scheduled"))
+
+        appointment_repo.find_page.assert_called_once_with(
+            None, ListAllAppointmentsUseCase.STREAM_PAGE_SIZE, doctor_id=1, status=AppointmentStatus.SCHEDULED
+        )
+
+    def test_should_filter_streamed_rows_by_status(self, use_case):
+        rows = list(use_case.stream(status="scheduled"))
+
+        assert [row['id'] for row in rows] == [1, 3]
+        assert all(row['status'] == "Programada" for row in rows)
+
+    def test_should_filter_streamed_rows_by_date_range(self, use_case, appointments):
+        rows = list(use_case.stream(start_date=appointments[1].date, end_date=appointments[2].date))
+
+        assert [row['id'] for row in rows] == [2, 3]
+
+    def test_should_validate_parameters_before_streaming(self, use_case, appointment_repo):
+        with pytest.raises(ValueError):
+            use_case.stream(status="unknown")
+
+        appointment_repo.find_page.assert_not_called()
+
+
+class TestListAllAppointmentsPage:
+
+    @pytest.fixture
+    def appointment_repo(self):
+        return create_autospec(AppointmentRepository, instance=True)
+
+    @pytest.fixture
+    def use_case(self, appointment_repo):
+        return ListAllAppointmentsUseCase(appointment_repo)
+
+    def test_should_delegate_to_repository_with_filters(self, use_case, appointment_repo):
+        after_key = (date(2030, 1, 1), time(10, 0), 7)
+
+        use_case.page(after_key, 20, doctor_id=3, status="Programada")
+
+        appointment_repo.find_page.assert_called_once_with(
+            after_key, 20, doctor_id=3, status=AppointmentStatus.SCHEDULED
+        )
+
+    def test_should_accept_status_names(self, use_case, appointment_repo):
+        use_case.page(None, 20, status="cancelled")
+
+        appointment_repo.find_page.assert_called_once_with(
+            None, 20, status=AppointmentStatus.CANCELLED
+        )
+
+    def test_should_reject_invalid_page_parameters(self, use_case, appointment_repo):
+        with pytest.raises(ValueError):
+            use_case.page(None, 0)
+        with pytest.raises(ValueError):
+            use_case.page(None, 10, status="unknown")
+
+        appointment_repo.find_page.assert_not_called()
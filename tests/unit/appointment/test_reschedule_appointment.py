@@ -0,0 +1,117 @@
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
+from medical_system.domain.exceptions import BusinessRuleViolationError, UnauthorizedError
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.usecases.appointment.reschedule_appointment import RescheduleAppointmentUseCase
+from medical_system.usecases.dtos.appointment_dto import AppointmentDTO, RescheduleAppointmentDTO
+
+def _next_weekday(weekday: int) -> date:
+    day = date.today() + timedelta(days=2)
+    while day.weekday() != weekday:
+        day += timedelta(days=1)
+    return day
+
+class TestRescheduleAppointmentUseCase:
+
+    @pytest.fixture
+    def monday(self):
+        return _next_weekday(0)
+
+    @pytest.fixture
+    def patient(self):
+        patient = Patient(name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1))
+        patient.id = 1
+        return patient
+
+    @pytest.fixture
+    def doctor(self):
+        doctor = Doctor(
+            name="Dr. Carlos García", email=Email("garcia@example.com"), specialty="Cardiología",
+            schedule=ScheduleTemplate(weekly=(DaySchedule(time(9, 0), time(14, 0)),) * 5 + (None, None))
+        )
+        doctor.id = 10
+        return doctor
+
+    @pytest.fixture
+    def appointment_repo(self):
+        return InMemoryAppointmentRepository()
+
+    @pytest.fixture
+    def appointment(self, appointment_repo, patient, doctor, monday):
+        return appointment_repo.reserve_slot(Appointment(
+            date=monday, time=time(9, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=doctor
+        ))
+
+    @pytest.fixture
+    def use_case(self, appointment_repo):
+        return RescheduleAppointmentUseCase(appointment_repo)
+
+    def test_should_move_appointment_to_the_new_day(self, use_case, appointment_repo, appointment, patient, doctor, monday):
+        tuesday = monday + timedelta(days=1)
+
+        result = use_case.execute(RescheduleAppointmentDTO(
+            appointment_id=appointment.id, new_date=tuesday, new_time=time(11, 0), requested_by=patient.id
+        ))
+
+        assert isinstance(result, AppointmentDTO)
+        assert (result.id, result.date, result.time) == (appointment.id, tuesday, time(11, 0))
+        assert appointment_repo.find_by_id(appointment.id).version == 2
+        assert appointment_repo.get_occupancy_mask(doctor.id, monday) == 0
+        assert appointment_repo.find_by_doctor_and_date(doctor.id, tuesday) == [appointment]
+        assert appointment_repo.find_by_patient(patient.id) == [appointment]
+
+    def test_should_reject_users_outside_the_appointment(self, use_case, appointment, monday):
+        with pytest.raises(UnauthorizedError):
+            use_case.execute(RescheduleAppointmentDTO(
+                appointment_id=appointment.id, new_date=monday, new_time=time(11, 0), requested_by=99
+            ))
+
+    def test_should_reject_taken_slots(self, use_case, appointment_repo, appointment, doctor, monday):
+        other_patient = Patient(name="Ana López", email=Email("ana@example.com"), birth_date=date(1985, 5, 5))
+        other_patient.id = 2
+        appointment_repo.reserve_slot(Appointment(
+            date=monday, time=time(11, 0), status=AppointmentStatus.SCHEDULED,
+            patient=other_patient, doctor=doctor
+        ))
+
+        with pytest.raises(ValueError, match="El doctor no está disponible"):
+            use_case.execute(RescheduleAppointmentDTO(
+                appointment_id=appointment.id, new_date=monday, new_time=time(11, 0), requested_by=doctor.id
+            ))
+        assert (appointment.time, appointment.version) == (time(9, 0), 1)
+
+    def test_should_reject_times_outside_the_doctor_schedule(self, use_case, appointment, patient, monday):
+        with pytest.raises(BusinessRuleViolationError, match="no atiende"):
+            use_case.execute(RescheduleAppointmentDTO(
+                appointment_id=appointment.id, new_date=monday, new_time=time(16, 0), requested_by=patient.id
+            ))
+
+    def test_should_check_the_doctor_current_schedule(self, appointment_repo, appointment, patient, doctor, monday):
+        # La cita guarda el doctor con su horario antiguo (lunes a viernes);
+        # el vigente, en el repositorio de doctores, solo abre los sábados.
+        saturdays = ScheduleTemplate(weekly=(None,) * 5 + (DaySchedule(time(8, 0), time(12, 0)), None))
+        doctor_repo = InMemoryDoctorRepository()
+        doctor_repo.save(Doctor.restore(
+            doctor.id, name=doctor.name, email=doctor.email, specialty=doctor.specialty, schedule=saturdays
+        ))
+        use_case = RescheduleAppointmentUseCase(appointment_repo, doctor_repository=doctor_repo)
+        saturday = monday + timedelta(days=5)
+
+        result = use_case.execute(RescheduleAppointmentDTO(
+            appointment_id=appointment.id, new_date=saturday, new_time=time(8, 30), requested_by=patient.id
+        ))
+
+        assert (result.date, result.time) == (saturday, time(8, 30))
+        with pytest.raises(BusinessRuleViolationError, match="no atiende"):
+            use_case.execute(RescheduleAppointmentDTO(
+                appointment_id=appointment.id, new_date=monday + timedelta(days=7), new_time=time(9, 0),
+                requested_by=patient.id
+            ))
@@ -60,6 +60,47 @@ class TestAuthService:
         self.mock_repo.find_by_email.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_authenticate_user_async_verifies_password_off_event_loop(self, monkeypatch):
+        import threading
+        from medical_system.domain.auth import config
+
+        threads = []
+
+        def fake_verify(plain_password, hashed_password):
+            threads.append(threading.current_thread().name)
+            return plain_password == "secret"
+
+        monkeypatch.setattr(config, "verify_password", fake_verify)
+        self.mock_repo.find_by_email.return_value = self.test_user
+
+        user = await self.auth_service.authenticate_user_async("test@example.com", "secret")
+
+        assert user.email == "test@example.com"
+        assert threads and threads[0].startswith("password-hash")
+        assert threads[0] != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_async_wrong_password(self, monkeypatch):
+        from medical_system.domain.auth import config
+
+        monkeypatch.setattr(config, "verify_password", lambda plain, hashed: False)
+        self.mock_repo.find_by_email.return_value = self.test_user
+
+        with pytest.raises(UnauthorizedError, match="Credenciales inválidas"):
+            await self.auth_service.authenticate_user_async("test@example.com", "wrongpassword")
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_async_inactive(self, monkeypatch):
+        from medical_system.domain.auth import config
+
+        monkeypatch.setattr(config, "verify_password", lambda plain, hashed: True)
+        self.test_user.is_active = False
+        self.mock_repo.find_by_email.return_value = self.test_user
+
+        with pytest.raises(UnauthorizedError, match="inactivo"):
+            await self.auth_service.authenticate_user_async("test@example.com", "secret")
+
     # Tests de verificación de token temporalmente deshabilitados
     # debido a problemas con la generación de tokens
     pass
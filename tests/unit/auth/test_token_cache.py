@@ -0,0 +1,112 @@
+import time
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime
+from fastapi.testclient import TestClient
+from jose import jwt
+from medical_system.domain.auth.config import ALGORITHM, SECRET_KEY
+from medical_system.domain.entities.user import User
+from medical_system.domain.auth.schemas import TokenData
+from medical_system.domain.auth.service import AuthService
+from medical_system.domain.auth.token_cache import VerifiedTokenCache
+from medical_system.domain.exceptions import UnauthorizedError
+from medical_system.domain.ports.repositories.user_repository import UserRepository
+from medical_system.interfaces.api.main import app
+
+class TestVerifiedTokenCache:
+
+    def test_should_return_cached_token_data(self):
+        cache = VerifiedTokenCache(max_size=2)
+        token_data = TokenData(email="a@example.com", user_id=1, expires_at=time.time() + 60)
+
+        cache.put("a.b.c", token_data)
+
+        assert cache.get("a.b.c") is token_data
+        assert cache.get("x.y.z") is None
+
+    def test_should_drop_expired_entries(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("a.b.c", TokenData(email="a@example.com", user_id=1, expires_at=time.time() - 1))
+
+        assert cache.get("a.b.c") is None
+        assert len(cache) == 0
+
+    def test_should_evict_least_recently_used(self):
+        cache = VerifiedTokenCache(max_size=2)
+        expires_at = time.time() + 60
+        for token in ("t.o.1", "t.o.2"):
+            cache.put(token, TokenData(email="a@example.com", user_id=1, expires_at=expires_at))
+
+        cache.get("t.o.1")
+        cache.put("t.o.3", TokenData(email="a@example.com", user_id=1, expires_at=expires_at))
+
+        assert cache.get("t.o.1") is not None
+        assert cache.get("t.o.2") is None
+        assert cache.get("t.o.3") is not None
+
+    def test_should_refuse_entries_without_expiry(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("a.b.c", TokenData(email="a@example.com", user_id=1))
+
+        assert cache.get("a.b.c") is None
+        assert len(cache) == 0
+
+
+class TestAuthServiceTokenVerification:
+
+    @pytest.fixture
+    def auth_service(self):
+        return AuthService(Mock(spec=UserRepository), token_cache=VerifiedTokenCache())
+
+    @pytest.fixture
+    def user(self):
+        return User(
+            id=7,
+            email="test@example.com",
+            first_name="Test",
+            last_name="User",
+            created_at=datetime.utcnow(),
+            metadata={"roles": ["doctor"]}
+        )
+
+    def test_should_decode_token_only_once_for_repeated_calls(self, auth_service, user):
+        token = auth_service.create_tokens(user).access_token
+
+        with patch("medical_system.domain.auth.service.jwt.decode", wraps=__import__("jose").jwt.decode) as decode:
+            first = auth_service.verify_token(token)
+            second = auth_service.verify_token(token)
+
+        assert decode.call_count == 1
+        assert first is second
+        assert first.user_id == 7
+        assert first.roles == ["doctor"]
+        assert first.token_type == "access"
+        assert first.expires_at > time.time()
+
+    def test_should_check_token_type_on_cached_tokens(self, auth_service, user):
+        token = auth_service.create_tokens(user).access_token
+        auth_service.verify_token(token)
+
+        with pytest.raises(UnauthorizedError, match="Tipo de token inválido"):
+            auth_service.verify_token(token, token_type="refresh")
+
+    def test_should_not_cache_invalid_tokens(self, auth_service):
+        with pytest.raises(UnauthorizedError):
+            auth_service.verify_token("invalid.token.value")
+
+        assert len(auth_service.token_cache) == 0
+
+    def test_should_reject_tokens_without_expiry(self, auth_service):
+        token = jwt.encode({"sub": "test@example.com", "user_id": 7, "type": "access"}, SECRET_KEY, algorithm=ALGORITHM)
+
+        with pytest.raises(UnauthorizedError):
+            auth_service.verify_token(token)
+
+        assert len(auth_service.token_cache) == 0
+
+    def test_api_should_answer_401_to_tokens_without_expiry(self):
+        token = jwt.encode({"sub": "test@example.com", "user_id": 7, "type": "access"}, SECRET_KEY, algorithm=ALGORITHM)
+
+        response = TestClient(app).get("/api/appointments/", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 401
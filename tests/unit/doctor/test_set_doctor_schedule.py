@@ -0,0 +1,63 @@
+import pytest
+from datetime import date, time
+from unittest.mock import create_autospec
+from medical_system.usecases.doctor.set_doctor_schedule import SetDoctorScheduleUseCase
+from medical_system.usecases.dtos.doctor_dto import DoctorScheduleDTO
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.schedule_template import DEFAULT_SCHEDULE
+from medical_system.domain.ports.repositories.doctor_repository import DoctorRepository
+
+class TestSetDoctorScheduleUseCase:
+
+    @pytest.fixture
+    def doctor(self):
+        doctor = Doctor(
+            name="Dr. Ana López",
+            email=Email("ana.lopez@example.com"),
+            specialty="Cardiología"
+        )
+        doctor.id = 1
+        return doctor
+
+    @pytest.fixture
+    def doctor_repo(self, doctor):
+        repo = create_autospec(DoctorRepository, instance=True)
+        repo.find_by_id.return_value = doctor
+        repo.update.side_effect = lambda updated: updated
+        return repo
+
+    @pytest.fixture
+    def use_case(self, doctor_repo):
+        return SetDoctorScheduleUseCase(doctor_repo)
+
+    def test_should_replace_schedule_and_compiled_masks(self, use_case, doctor_repo, doctor):
+        monday = date(2030, 1, 7)
+        assert doctor.schedule_template is DEFAULT_SCHEDULE
+        assert doctor.schedule_template.is_open(monday, time(9, 0))
+
+        result = use_case.execute(1, DoctorScheduleDTO(
+            weekly=[{"start": "15:00", "end": "19:00", "breaks": [["17:00", "17:30"]]}] * 5 + [None, None],
+            holidays=["2030-01-08"]
+        ))
+
+        assert result.weekly[0] == {"start": "15:00:00", "end": "19:00:00", "breaks": [["17:00:00", "17:30:00"]]}
+        assert not doctor.schedule_template.is_open(monday, time(9, 0))
+        assert doctor.schedule_template.is_open(monday, time(15, 0))
+        assert not doctor.schedule_template.is_open(monday, time(17, 0))
+        assert doctor.schedule_template.day_mask(date(2030, 1, 8)) == 0
+        assert not doctor.accepts(monday, time(10, 0))
+        doctor_repo.update.assert_called_once_with(doctor)
+
+    def test_should_reject_invalid_template(self, use_case, doctor_repo):
+        with pytest.raises(ValueError):
+            use_case.execute(1, DoctorScheduleDTO(weekly=[{"start": "12:00", "end": "10:00"}] * 7))
+        with pytest.raises(ValueError):
+            use_case.execute(1, DoctorScheduleDTO(weekly=[None] * 3))
+        doctor_repo.update.assert_not_called()
+
+    def test_should_raise_error_when_doctor_not_found(self, use_case, doctor_repo):
+        doctor_repo.find_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="Doctor not found"):
+            use_case.execute(1, DoctorScheduleDTO(weekly=[None] * 7))
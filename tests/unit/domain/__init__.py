@@ -0,0 +1 @@
+"""Pruebas unitarias para las entidades y objetos de valor del dominio."""
@@ -0,0 +1,51 @@
+import pickle
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+
+class TestEntities:
+
+    @pytest.fixture
+    def doctor(self):
+        return Doctor.restore(1, name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología")
+
+    @pytest.fixture
+    def patient(self):
+        return Patient(name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1))
+
+    def test_should_not_have_instance_dict(self, doctor, patient):
+        appointment = Appointment(
+            date=date.today() + timedelta(days=1), time=time(10, 0),
+            status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor
+        )
+
+        for entity in (doctor, patient, appointment):
+            assert not hasattr(entity, "__dict__")
+        with pytest.raises(AttributeError):
+            appointment.notes = "sin campo"
+
+    def test_should_restore_with_field_defaults(self, doctor, patient):
+        appointment = Appointment.restore(
+            7, date=date(2020, 1, 1), time=time(9, 0),
+            status=AppointmentStatus.COMPLETED, patient=patient, doctor=doctor
+        )
+
+        assert appointment.id == 7
+        assert appointment.duration_minutes == 30
+        assert doctor.schedule is None
+        assert patient.id is None
+
+    def test_should_survive_pickle(self, doctor, patient):
+        appointment = Appointment.restore(
+            3, date=date(2020, 1, 1), time=time(9, 0), duration_minutes=60,
+            status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor
+        )
+
+        copy = pickle.loads(pickle.dumps(appointment))
+
+        assert copy == appointment
+        assert (copy.duration_minutes, copy.doctor.name) == (60, "Dr. Carlos García")
@@ -0,0 +1 @@
+"""Pruebas unitarias para los adaptadores de persistencia."""
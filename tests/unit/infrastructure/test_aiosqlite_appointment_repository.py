@@ -0,0 +1,62 @@
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.time_slots import slot_bit
+from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+from medical_system.infrastructure.persistence.sqlite.sqlite_doctor_repository import SqliteDoctorRepository
+from medical_system.infrastructure.persistence.sqlite.sqlite_patient_repository import SqlitePatientRepository
+
+pytest.importorskip("aiosqlite")
+
+from medical_system.infrastructure.persistence.sqlite.aiosqlite_database import AiosqliteDatabase
+from medical_system.infrastructure.persistence.sqlite.aiosqlite_appointment_repository import AiosqliteAppointmentRepository
+
+class TestAiosqliteAppointmentRepository:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "citas.db")
+
+    @pytest.fixture
+    def people(self, path):
+        database = SqliteDatabase(path)
+        patient = SqlitePatientRepository(database).save(Patient(
+            name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1)
+        ))
+        doctor = SqliteDoctorRepository(database).save(Doctor(
+            name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"
+        ))
+        database.close()
+        return patient, doctor
+
+    def test_should_reject_in_memory_database(self):
+        with pytest.raises(ValueError):
+            AiosqliteDatabase(":memory:")
+
+    @pytest.mark.asyncio
+    async def test_should_reserve_and_read_back(self, path, people):
+        patient, doctor = people
+        tomorrow = date.today() + timedelta(days=1)
+        database = AiosqliteDatabase(path)
+        repo = AiosqliteAppointmentRepository(database)
+        try:
+            appointment = await repo.reserve_slot(Appointment(
+                date=tomorrow, time=time(10, 0), status=AppointmentStatus.SCHEDULED,
+                patient=patient, doctor=doctor
+            ))
+
+            assert (await repo.find_by_id(appointment.id)).doctor.name == "Dr. Carlos García"
+            assert await repo.find_by_patient_and_date(patient.id, tomorrow) == [appointment]
+            assert await repo.get_occupancy_mask(doctor.id, tomorrow) == slot_bit(time(10, 0))
+            assert [a.id async for a in repo.iter_all()] == [appointment.id]
+            with pytest.raises(ValueError, match="Solo puedes tener una cita por día"):
+                await repo.reserve_slot(Appointment(
+                    date=tomorrow, time=time(11, 0), status=AppointmentStatus.SCHEDULED,
+                    patient=patient, doctor=doctor
+                ))
+        finally:
+            await database.close()
@@ -0,0 +1,134 @@
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.infrastructure.persistence.in_memory.array_appointment_store import ArrayAppointmentStore
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+
+START = date(2024, 1, 1)
+STATUSES = (AppointmentStatus.SCHEDULED, AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED)
+
+class TestArrayAppointmentStore:
+
+    @pytest.fixture
+    def directory(self):
+        patients = InMemoryPatientRepository()
+        doctors = InMemoryDoctorRepository()
+        for index in range(1, 6):
+            patients.save(Patient.restore(
+                None, name=f"Paciente {index}", email=Email(f"p{index}@example.com"), birth_date=date(1990, 1, 1)
+            ))
+        for index in range(1, 4):
+            doctors.save(Doctor.restore(
+                None, name=f"Dr. {index}", email=Email(f"d{index}@example.com"), specialty="Cardiología"
+            ))
+        return patients, doctors
+
+    @pytest.fixture
+    def appointments(self, directory):
+        # Citas pasadas en desorden, con varias duraciones y estados.
+        patients, doctors = directory
+        appointments = []
+        for index in range(60, 0, -1):
+            appointments.append(Appointment.restore(
+                index,
+                date=START + timedelta(days=index % 7),
+                time=time(8 + index % 10, 30 * (index % 2)),
+                status=STATUSES[index % 3],
+                patient=patients.find_by_id(1 + index % 5),
+                doctor=doctors.find_by_id(1 + index % 3),
+                duration_minutes=30 * (1 + index % 2)
+            ))
+        return appointments
+
+    @pytest.fixture
+    def reference(self, appointments):
+        repo = InMemoryAppointmentRepository()
+        repo.bulk_load(appointments)
+        return repo
+
+    @pytest.fixture
+    def store(self, directory, appointments):
+        store = ArrayAppointmentStore(*directory)
+        assert store.bulk_load(appointments) == 60
+        return store
+
+    @staticmethod
+    def _keys(appointments):
+        return sorted((apt.date, apt.time, apt.id) for apt in appointments)
+
+    def test_should_materialize_equal_appointments(self, store, reference):
+        for appointment_id in (1, 30, 60):
+            assert store.find_by_id(appointment_id) == reference.find_by_id(appointment_id)
+        assert store.find_by_id(61) is None
+        assert list(store.iter_all()) == list(reference.iter_all())
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {'doctor_id': 2},
+        {'patient_id': 3, 'status': AppointmentStatus.SCHEDULED},
+        {'status': AppointmentStatus.CANCELLED},
+        {'status': 'Completada', 'start_date': START + timedelta(days=2), 'end_date': START + timedelta(days=4)},
+        {'date': START + timedelta(days=3)},
+        {'doctor_id': 1, 'patient_id': 4},
+        {'doctor_id': 99},
+    ])
+    def test_should_filter_like_the_in_memory_repository(self, store, reference, filters):
+        assert self._keys(store.find_all(**filters)) == self._keys(reference.find_all(**filters))
+        assert store.count(**filters) == len(reference.find_all(**filters))
+
+    def test_should_page_in_the_same_order(self, store, reference):
+        for filters in ({}, {'status': AppointmentStatus.SCHEDULED}, {'doctor_id': 3}):
+            key, expected_key = None, None
+            while True:
+                page = store.find_page(key, 7, **filters)
+                expected = reference.find_page(expected_key, 7, **filters)
+                assert [apt.id for apt in page.items] == [apt.id for apt in expected.items]
+                assert page.next_key == expected.next_key
+                if page.next_key is None:
+                    break
+                key = expected_key = page.next_key
+
+    def test_should_answer_point_lookups(self, store, reference):
+        day = START + timedelta(days=3)
+        for doctor_id in (1, 2, 3):
+            assert self._keys(store.find_by_doctor_and_date(doctor_id, day)) == \
+                self._keys(reference.find_by_doctor_and_date(doctor_id, day))
+        for patient_id in (1, 5):
+            assert self._keys(store.find_by_patient(patient_id)) == self._keys(reference.find_by_patient(patient_id))
+            assert self._keys(store.find_by_patient_and_date(patient_id, day)) == \
+                self._keys(reference.find_by_patient_and_date(patient_id, day))
+        sample = reference.find_by_id(17)
+        assert store.find_by_doctor_patient_datetime(
+            sample.doctor.id, sample.patient.id, sample.date, sample.time
+        ) == sample
+        assert store.find_patient_appointments_at_same_time(sample.patient.id, sample.date, sample.time) == [sample]
+
+    def test_should_compute_occupancy_without_cancelled_appointments(self, store, reference):
+        end = START + timedelta(days=6)
+        assert store.get_occupancy_grid([1, 2, 3], START, end) == reference.get_occupancy_grid([1, 2, 3], START, end)
+        assert store.get_occupancy_masks(2, START, end) == reference.get_occupancy_masks(2, START, end)
+        assert store.find_available_slots(1, START) == reference.find_available_slots(1, START)
+
+    def test_should_replace_rows_on_reload(self, store, directory):
+        patients, doctors = directory
+        store.bulk_load([Appointment.restore(
+            5, date=START, time=time(19, 30), status=AppointmentStatus.CANCELLED,
+            patient=patients.find_by_id(1), doctor=doctors.find_by_id(1)
+        )])
+        assert len(store) == 60
+        assert store.find_by_id(5).time == time(19, 30)
+        assert store.find_by_id(5).status == AppointmentStatus.CANCELLED
+
+    def test_should_be_read_only(self, store, reference):
+        with pytest.raises(NotImplementedError):
+            store.save(reference.find_by_id(1))
+        with pytest.raises(NotImplementedError):
+            store.delete(1)
+        with pytest.raises(ValueError, match="Filtro no soportado"):
+            store.find_all(specialty="Cardiología")
@@ -0,0 +1,360 @@
+import threading
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+
+class TestInMemoryAppointmentRepository:
+
+    @pytest.fixture
+    def repo(self):
+        return InMemoryAppointmentRepository()
+
+    @pytest.fixture
+    def patient(self):
+        patient = Patient(
+            name="Juan Pérez",
+            email=Email("juan@example.com"),
+            birth_date=date(1990, 1, 1)
+        )
+        patient.id = 1
+        return patient
+
+    @pytest.fixture
+    def doctor(self):
+        doctor = Doctor(
+            name="Dr. Carlos García",
+            email=Email("dr.garcia@example.com"),
+            specialty="Cardiología"
+        )
+        doctor.id = 1
+        return doctor
+
+    @pytest.fixture
+    def tomorrow(self):
+        return date.today() + timedelta(days=1)
+
+    @pytest.fixture
+    def make_appointment(self, patient, doctor, tomorrow):
+        def _make(at: time, status=AppointmentStatus.SCHEDULED, duration_minutes=30):
+            return Appointment(
+                date=tomorrow,
+                time=at,
+                status=status,
+                patient=patient,
+                doctor=doctor,
+                duration_minutes=duration_minutes
+            )
+        return _make
+
+    def test_should_mark_slot_as_occupied_on_save(self, repo, make_appointment, doctor, tomorrow):
+        repo.save(make_appointment(time(8, 0)))
+        repo.save(make_appointment(time(10, 30)))
+
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == (1 << 0) | (1 << 5)
+
+    def test_should_occupy_every_slot_covered_by_duration(self, repo, make_appointment, doctor, tomorrow):
+        appointment = repo.reserve_slot(make_appointment(time(10, 0), duration_minutes=90))
+
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0b111 << 4
+
+        other_patient = Patient(name="Ana López", email=Email("ana@example.com"), birth_date=date(1985, 5, 5))
+        other_patient.id = 2
+        with pytest.raises(ValueError, match="El doctor no está disponible"):
+            repo.reserve_slot(Appointment(
+                date=tomorrow, time=time(11, 0), status=AppointmentStatus.SCHEDULED,
+                patient=other_patient, doctor=doctor
+            ))
+
+        appointment.cancel()
+        repo.save(appointment)
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0
+
+    def test_should_reject_durations_off_the_slot_grid(self, make_appointment):
+        with pytest.raises(ValueError, match="múltiplo de 30 minutos"):
+            make_appointment(time(10, 0), duration_minutes=45)
+        with pytest.raises(ValueError, match="20:00"):
+            make_appointment(time(19, 30), duration_minutes=60)
+
+    def test_should_free_slot_when_appointment_is_cancelled(self, repo, make_appointment, doctor, tomorrow):
+        appointment = repo.save(make_appointment(time(9, 0)))
+
+        appointment.cancel()
+        repo.save(appointment)
+
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0
+        assert len(repo.find_available_slots(doctor.id, tomorrow)) == 24
+
+    def test_should_free_slot_on_delete(self, repo, make_appointment, doctor, tomorrow):
+        appointment = repo.save(make_appointment(time(9, 0)))
+
+        repo.delete(appointment.id)
+
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0
+
+    def test_should_return_occupancy_of_busy_days_in_range(self, repo, make_appointment, doctor, tomorrow):
+        repo.save(make_appointment(time(8, 0)))
+        cancelled = repo.save(make_appointment(time(9, 0)))
+        cancelled.cancel()
+        repo.save(cancelled)
+
+        masks = repo.get_occupancy_masks(doctor.id, tomorrow - timedelta(days=3), tomorrow + timedelta(days=3))
+
+        assert masks == {tomorrow: 1 << 0}
+        assert repo.get_occupancy_masks(doctor.id, tomorrow + timedelta(days=1), tomorrow + timedelta(days=7)) == {}
+
+    def test_should_exclude_occupied_slots_from_available_slots(self, repo, make_appointment, doctor, tomorrow):
+        repo.save(make_appointment(time(19, 30)))
+
+        slots = repo.find_available_slots(doctor.id, tomorrow)
+
+        assert len(slots) == 23
+        assert slots[-1].time() == time(19, 0)
+
+    def test_should_page_by_date_time_and_id(self, repo, make_appointment):
+        late = repo.save(make_appointment(time(15, 0)))
+        early = repo.save(make_appointment(time(9, 0)))
+        middle = repo.save(make_appointment(time(11, 30)))
+
+        first = repo.find_page(None, 2)
+        second = repo.find_page(first.next_key, 2)
+
+        assert first.items == [early, middle]
+        assert first.next_key == (middle.date, middle.time, middle.id)
+        assert second.items == [late]
+        assert second.next_key is None
+
+    def test_should_keep_page_order_when_appointment_moves(self, repo, make_appointment):
+        first = repo.save(make_appointment(time(9, 0)))
+        second = repo.save(make_appointment(time(10, 0)))
+
+        first.time = time(12, 0)
+        repo.save(first)
+
+        assert repo.find_page(None, 10).items == [second, first]
+
+    def test_should_filter_pages(self, repo, make_appointment):
+        repo.save(make_appointment(time(9, 0)))
+        cancelled = repo.save(make_appointment(time(10, 0), status=AppointmentStatus.CANCELLED))
+
+        page = repo.find_page(None, 10, status=AppointmentStatus.CANCELLED)
+
+        assert page.items == [cancelled]
+
+    def test_should_page_filtered_results_from_the_index(self, repo, patient, doctor, tomorrow):
+        other_patient = Patient(name="Ana López", email=Email("ana@example.com"), birth_date=date(1985, 5, 5))
+        other_patient.id = 2
+        for offset in range(6):
+            for owner in (patient, other_patient):
+                repo.save(Appointment(
+                    date=tomorrow + timedelta(days=5 - offset),
+                    time=time(9, 0) if owner is patient else time(10, 0),
+                    status=AppointmentStatus.SCHEDULED,
+                    patient=owner,
+                    doctor=doctor
+                ))
+        cancelled = repo.find_by_patient(patient.id)[2]
+        cancelled.cancel()
+        repo.save(cancelled)
+
+        for filters in ({'patient_id': patient.id}, {'doctor_id': doctor.id}, {'status': AppointmentStatus.SCHEDULED}):
+            seen, key = [], None
+            while True:
+                page = repo.find_page(key, 4, **filters)
+                seen.extend(page.items)
+                if page.next_key is None:
+                    break
+                key = page.next_key
+            assert seen == repo.find_all(**filters)
+            keys = [(apt.date, apt.time, apt.id) for apt in seen]
+            assert keys == sorted(keys)
+        assert repo.find_page(None, 10, status=AppointmentStatus.CANCELLED).items == [cancelled]
+
+    def test_should_plan_with_most_selective_index(self, repo, make_appointment, tomorrow):
+        for hour in range(8, 18):
+            repo.save(make_appointment(time(hour, 0)))
+        cancelled = repo.save(make_appointment(time(18, 0), status=AppointmentStatus.CANCELLED))
+
+        assert repo.plan(status=AppointmentStatus.CANCELLED) == ('status', 1)
+        assert repo.plan(status=AppointmentStatus.SCHEDULED, end_date=tomorrow - timedelta(days=1)) == ('date', 0)
+        assert repo.find_all(status=AppointmentStatus.CANCELLED, start_date=tomorrow) == [cancelled]
+
+    def test_should_filter_by_date_range_in_order(self, repo, patient, doctor, tomorrow):
+        saved = []
+        for offset in (3, 0, 9, 5):
+            saved.append(repo.save(Appointment(
+                date=tomorrow + timedelta(days=offset),
+                time=time(9, 0),
+                status=AppointmentStatus.SCHEDULED,
+                patient=patient,
+                doctor=doctor
+            )))
+
+        result = repo.find_all(start_date=tomorrow + timedelta(days=1), end_date=tomorrow + timedelta(days=7))
+
+        assert result == [saved[0], saved[3]]
+
+    def test_should_move_appointment_between_status_index_entries(self, repo, make_appointment):
+        appointment = repo.save(make_appointment(time(9, 0)))
+
+        appointment.cancel()
+        repo.save(appointment)
+
+        assert repo.find_all(status=AppointmentStatus.SCHEDULED) == []
+        assert repo.find_all(status=AppointmentStatus.CANCELLED) == [appointment]
+
+    def test_should_replace_a_distinct_copy_on_update(self, repo, make_appointment, patient, doctor, tomorrow):
+        # Los índices van por id: una copia con otro estado sustituye a la
+        # guardada en lugar de quedar duplicada junto a ella.
+        stored = repo.save(make_appointment(time(9, 0)))
+        copy = Appointment.restore(
+            stored.id, date=tomorrow, time=time(9, 0), status=AppointmentStatus.CANCELLED,
+            patient=patient, doctor=doctor
+        )
+
+        repo.update(copy)
+
+        assert repo.find_by_patient(patient.id) == [copy]
+        assert repo.find_by_doctor_and_date(doctor.id, tomorrow) == [copy]
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0
+
+    def test_should_leave_the_previous_day_when_moved(self, repo, make_appointment, doctor, tomorrow):
+        appointment = repo.save(make_appointment(time(9, 0)))
+        next_day = tomorrow + timedelta(days=1)
+
+        appointment.date = next_day
+        repo.save(appointment)
+
+        assert repo.find_by_doctor_and_date(doctor.id, tomorrow) == []
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0
+        assert repo.find_by_doctor_and_date(doctor.id, next_day) == [appointment]
+        assert repo.get_occupancy_mask(doctor.id, next_day) == 1 << 2
+
+    def test_should_move_in_place_without_counting_its_own_slots(self, repo, make_appointment, doctor, tomorrow):
+        appointment = repo.reserve_slot(make_appointment(time(10, 0), duration_minutes=60))
+
+        moved = repo.move(appointment.id, tomorrow, time(10, 30))
+
+        assert moved is appointment
+        assert moved.version == 2
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0b11 << 5
+        assert repo.find_page(None, 10).items == [appointment]
+
+    def test_should_reject_moves_onto_taken_slots_or_a_busy_day(self, repo, make_appointment, patient, doctor, tomorrow):
+        other_patient = Patient(name="Ana López", email=Email("ana@example.com"), birth_date=date(1985, 5, 5))
+        other_patient.id = 2
+        appointment = repo.reserve_slot(make_appointment(time(9, 0)))
+        repo.reserve_slot(Appointment(
+            date=tomorrow, time=time(11, 0), status=AppointmentStatus.SCHEDULED,
+            patient=other_patient, doctor=doctor
+        ))
+        next_day = tomorrow + timedelta(days=1)
+        repo.reserve_slot(Appointment(
+            date=next_day, time=time(9, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=doctor
+        ))
+
+        with pytest.raises(ValueError, match="El doctor no está disponible"):
+            repo.move(appointment.id, tomorrow, time(11, 0))
+        with pytest.raises(ValueError, match="Solo puedes tener una cita por día"):
+            repo.move(appointment.id, next_day, time(12, 0))
+        assert (appointment.date, appointment.time, appointment.version) == (tomorrow, time(9, 0), 1)
+
+    def test_should_reserve_each_slot_only_once_under_contention(self, repo, doctor, tomorrow):
+        patients = []
+        for index in range(16):
+            patient = Patient(
+                name=f"Paciente {index}",
+                email=Email(f"paciente{index}@example.com"),
+                birth_date=date(1990, 1, 1)
+            )
+            patient.id = index + 1
+            patients.append(patient)
+        barrier = threading.Barrier(len(patients))
+        outcomes = []
+
+        def book(patient):
+            barrier.wait()
+            try:
+                repo.reserve_slot(Appointment(
+                    date=tomorrow,
+                    time=time(9, 0),
+                    status=AppointmentStatus.SCHEDULED,
+                    patient=patient,
+                    doctor=doctor
+                ))
+                outcomes.append(True)
+            except ValueError:
+                outcomes.append(False)
+
+        threads = [threading.Thread(target=book, args=(patient,)) for patient in patients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert outcomes.count(True) == 1
+        assert len(repo.find_by_doctor_and_date(doctor.id, tomorrow)) == 1
+
+    def test_should_reserve_many_checking_each_against_the_previous(self, repo, make_appointment, doctor, tomorrow):
+        repo.reserve_slot(make_appointment(time(9, 0)))
+        other_patient = Patient(name="Ana López", email=Email("ana@example.com"), birth_date=date(1985, 5, 5))
+        other_patient.id = 2
+        third_patient = Patient(name="Luis Gómez", email=Email("luis@example.com"), birth_date=date(1970, 2, 2))
+        third_patient.id = 3
+
+        def book(patient, at):
+            return Appointment(
+                date=tomorrow, time=at, status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor
+            )
+
+        results = repo.reserve_many([
+            book(other_patient, time(9, 0)),
+            book(other_patient, time(10, 0)),
+            book(third_patient, time(10, 0)),
+            book(other_patient, time(11, 0)),
+        ])
+
+        assert "no está disponible" in results[0]
+        assert results[1].id is not None
+        assert "no está disponible" in results[2]
+        assert results[3] == "Solo puedes tener una cita por día"
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == (1 << 2) | (1 << 4)
+
+    def test_should_reject_second_reservation_for_patient_on_same_day(self, repo, make_appointment):
+        repo.reserve_slot(make_appointment(time(9, 0)))
+
+        with pytest.raises(ValueError, match="una cita por día"):
+            repo.reserve_slot(make_appointment(time(11, 0)))
+
+    def test_should_iterate_live_appointments_by_id_regardless_of_gaps(self, repo, patient, doctor, tomorrow):
+        appointments = [
+            Appointment.restore(
+                appointment_id, date=tomorrow + timedelta(days=index), time=time(10, 0),
+                status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor
+            )
+            for index, appointment_id in enumerate((10**6, 5, 70))
+        ]
+        repo.bulk_load(appointments)
+        repo.delete(70)
+
+        lookups = []
+        repo._appointments = _CountingDict(repo._appointments, lookups)
+
+        assert [apt.id for apt in repo.iter_all()] == [5, 10**6]
+        assert len(lookups) == 2
+
+
+class _CountingDict(dict):
+    # Cuenta las búsquedas por id de iter_all.
+    def __init__(self, data, lookups):
+        super().__init__(data)
+        self._lookups = lookups
+
+    def get(self, key, default=None):
+        self._lookups.append(key)
+        return super().get(key, default)
@@ -0,0 +1,132 @@
+import os
+import time as clock
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.entities.user import User
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
+from medical_system.infrastructure.persistence.journal import Journal
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+
+class TestJournal:
+
+    @pytest.fixture
+    def open_journal(self, tmp_path):
+        journals = []
+
+        def _open(**options):
+            journal = Journal(
+                str(tmp_path / "journal"),
+                InMemoryAppointmentRepository(),
+                InMemoryPatientRepository(),
+                InMemoryDoctorRepository(),
+                InMemoryUserRepository(),
+                **options
+            )
+            journal.open()
+            journals.append(journal)
+            return journal
+        yield _open
+        for journal in journals:
+            journal.close()
+
+    @pytest.fixture
+    def tomorrow(self):
+        return date.today() + timedelta(days=1)
+
+    def _populate(self, journal, tomorrow):
+        doctor = journal.doctor_repo.save(Doctor(
+            name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"
+        ))
+        patient = journal.patient_repo.save(Patient(
+            name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1)
+        ))
+        kept = journal.appointment_repo.save(Appointment(
+            date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=doctor
+        ))
+        removed = journal.appointment_repo.save(Appointment(
+            date=tomorrow + timedelta(days=1), time=time(10, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=doctor
+        ))
+        journal.user_repo.save(User(email="admin@clinica.com", first_name="Admin", metadata={"roles": ["admin"]}))
+        return doctor, patient, kept, removed
+
+    def test_should_recover_changes_after_restart(self, open_journal, tomorrow):
+        journal = open_journal()
+        doctor, patient, kept, removed = self._populate(journal, tomorrow)
+        kept.cancel()
+        journal.appointment_repo.save(kept)
+        journal.appointment_repo.delete(removed.id)
+        journal.close()
+
+        recovered = open_journal()
+
+        appointments = recovered.appointment_repo.find_all()
+        assert [(a.id, a.status) for a in appointments] == [(kept.id, AppointmentStatus.CANCELLED)]
+        assert appointments[0].doctor.name == doctor.name
+        assert recovered.appointment_repo.get_occupancy_mask(doctor.id, tomorrow) == 0
+        assert recovered.patient_repo.find_by_email("juan@example.com").id == patient.id
+        assert recovered.user_repo.find_by_email("admin@clinica.com").has_role("admin")
+
+    def test_should_recover_doctor_schedule(self, open_journal, tomorrow):
+        journal = open_journal()
+        doctor, _, _, _ = self._populate(journal, tomorrow)
+        doctor.schedule = ScheduleTemplate(
+            weekly=(DaySchedule(time(8, 0), time(12, 0)),) * 7, holidays=frozenset({tomorrow})
+        )
+        journal.doctor_repo.update(doctor)
+        journal.snapshot()
+        journal.close()
+
+        recovered = open_journal()
+
+        assert recovered.doctor_repo.find_by_id(doctor.id).schedule == doctor.schedule
+
+    def test_should_recover_from_snapshot_and_log_tail(self, open_journal, tomorrow):
+        journal = open_journal()
+        doctor, patient, kept, _ = self._populate(journal, tomorrow)
+        journal.snapshot()
+        journal.appointment_repo.save(Appointment(
+            date=tomorrow + timedelta(days=2), time=time(11, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=doctor
+        ))
+        journal.close()
+
+        files = sorted(os.listdir(journal.directory))
+        recovered = open_journal()
+
+        assert files == ["journal-00000002.log", "snapshot-00000002.json.gz"]
+        assert len(recovered.appointment_repo.find_all()) == 3
+        assert recovered.appointment_repo.find_by_id(kept.id).time == time(9, 0)
+
+    def test_should_discard_torn_tail(self, open_journal, tomorrow):
+        journal = open_journal()
+        self._populate(journal, tomorrow)
+        journal.close()
+        segment = os.path.join(journal.directory, "journal-00000001.log")
+        with open(segment, "ab") as handle:
+            handle.write(b"\x40\x00\x00\x00partial")
+
+        recovered = open_journal()
+
+        assert len(recovered.appointment_repo.find_all()) == 2
+        with open(segment, "rb") as handle:
+            assert not handle.read().endswith(b"partial")
+
+    def test_should_take_snapshot_after_threshold(self, open_journal, tomorrow):
+        journal = open_journal(fsync_interval=0.001, snapshot_every=3)
+        self._populate(journal, tomorrow)
+
+        deadline = clock.monotonic() + 5
+        while not any(name.startswith("snapshot-") for name in os.listdir(journal.directory)):
+            assert clock.monotonic() < deadline
+            clock.sleep(0.005)
+        journal.close()
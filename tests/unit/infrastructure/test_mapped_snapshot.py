@@ -0,0 +1,204 @@
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
+from medical_system.infrastructure.persistence.in_memory.array_appointment_store import ArrayAppointmentStore
+from medical_system.infrastructure.persistence.in_memory.bootstrap import build_in_memory_repositories
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.infrastructure.persistence.in_memory.mapped_appointment_repository import MappedAppointmentRepository
+from medical_system.infrastructure.persistence.mapped_snapshot import (
+    MappedSnapshot,
+    read_mapped_snapshot,
+    write_mapped_snapshot
+)
+
+START = date(2024, 3, 4)
+STATUSES = (AppointmentStatus.SCHEDULED, AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED)
+
+class TestMappedSnapshot:
+
+    @pytest.fixture
+    def doctors(self):
+        return [
+            Doctor.restore(1, name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"),
+            Doctor.restore(
+                2, name="Dra. Ana López", email=Email("ana@example.com"), specialty="Pediatría",
+                schedule=ScheduleTemplate(weekly=(DaySchedule(time(9, 0), time(12, 0)),) * 5 + (None, None))
+            ),
+        ]
+
+    @pytest.fixture
+    def patients(self):
+        return [
+            Patient.restore(index, name=f"Paciente Ñandú {index}", email=Email(f"p{index}@example.com"),
+                            birth_date=date(1980 + index, 1, 1))
+            for index in range(1, 5)
+        ]
+
+    @pytest.fixture
+    def appointments(self, doctors, patients):
+        return [
+            Appointment.restore(
+                index,
+                date=START + timedelta(days=index % 5),
+                time=time(9 + index % 8, 30 * (index % 2)),
+                status=STATUSES[index % 3],
+                patient=patients[index % 4],
+                doctor=doctors[index % 2],
+                duration_minutes=30 * (1 + index % 3)
+            )
+            for index in range(40, 0, -1)
+        ]
+
+    @pytest.fixture
+    def path(self, tmp_path, doctors, patients, appointments):
+        path = str(tmp_path / "seed.snap")
+        write_mapped_snapshot(path, doctors, patients, appointments)
+        return path
+
+    @pytest.fixture
+    def reference(self, appointments):
+        repo = InMemoryAppointmentRepository()
+        repo.bulk_load(appointments)
+        return repo
+
+    def test_should_round_trip_every_field(self, path, doctors, patients, appointments):
+        snapshot = read_mapped_snapshot(path)
+
+        assert [(d.id, d.name, d.email, d.specialty, d.schedule) for d in snapshot.doctors] == \
+            [(d.id, d.name, d.email, d.specialty, d.schedule) for d in doctors]
+        assert [(p.id, p.name, p.email, p.birth_date) for p in snapshot.patients] == \
+            [(p.id, p.name, p.email, p.birth_date) for p in patients]
+        assert sorted(snapshot.appointments, key=lambda apt: apt.id) == sorted(appointments, key=lambda apt: apt.id)
+
+    def test_should_serve_queries_from_the_mapped_file(self, path, reference):
+        snapshot = MappedSnapshot(path)
+        patient_repo, doctor_repo = InMemoryPatientRepository(), InMemoryDoctorRepository()
+        doctor_repo.bulk_load(snapshot.doctors())
+        patient_repo.bulk_load(snapshot.patients())
+        store = snapshot.appointment_store(patient_repo, doctor_repo)
+
+        assert isinstance(store.columns()['ids'], memoryview)
+        for filters in ({'status': AppointmentStatus.CANCELLED}, {'doctor_id': 2, 'status': 'Programada'}, {}):
+            page = store.find_page(None, 100, **filters)
+            assert [apt.id for apt in page.items] == [apt.id for apt in reference.find_page(None, 100, **filters).items]
+        end = START + timedelta(days=4)
+        assert store.get_occupancy_grid([1, 2], START, end) == reference.get_occupancy_grid([1, 2], START, end)
+
+    def test_should_reject_other_files(self, tmp_path):
+        path = tmp_path / "seed.snap"
+        path.write_bytes(b"{}" * 16)
+        with pytest.raises(ValueError, match="no es un snapshot binario"):
+            MappedSnapshot(str(path))
+
+    def test_bootstrap_should_map_the_seed_and_write_to_the_overlay(self, path, reference):
+        appointment_repo, patient_repo, doctor_repo, _ = build_in_memory_repositories(seed_snapshot=path)
+
+        assert isinstance(appointment_repo, MappedAppointmentRepository)
+        assert len(doctor_repo.find_all()) == 2
+        assert appointment_repo.find_by_id(7) == reference.find_by_id(7)
+        assert not appointment_repo.modified
+
+        scheduled = appointment_repo.find_all(status=AppointmentStatus.SCHEDULED)[0]
+        scheduled.status = AppointmentStatus.CANCELLED
+        appointment_repo.save(scheduled)
+
+        assert appointment_repo.modified
+        # Solo la cita cambiada pasa a memoria; el resto sigue en el fichero.
+        assert appointment_repo._overlay.find_all() == [scheduled]
+        assert len(appointment_repo.find_all()) == 40
+        assert appointment_repo.find_by_id(scheduled.id).status == AppointmentStatus.CANCELLED
+        assert appointment_repo.get_occupancy_mask(scheduled.doctor.id, scheduled.date) & scheduled.slot_mask == 0
+
+    @pytest.fixture
+    def mapped(self, path):
+        snapshot = MappedSnapshot(path)
+        patient_repo, doctor_repo = InMemoryPatientRepository(), InMemoryDoctorRepository()
+        doctor_repo.bulk_load(snapshot.doctors())
+        patient_repo.bulk_load(snapshot.patients())
+        return MappedAppointmentRepository(snapshot.appointment_store(patient_repo, doctor_repo))
+
+    def _apply(self, repo, doctors, patients):
+        # Mismo guion de escrituras sobre el repositorio mapeado y la referencia.
+        changed = repo.find_by_id(10)
+        changed.status = AppointmentStatus.CANCELLED
+        repo.save(changed)
+        repo.delete(11)
+        repo.move(12, START + timedelta(days=2), time(17, 30))
+        added = repo.reserve_slot(Appointment.restore(
+            None, date=START + timedelta(days=7), time=time(10, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patients[0], doctor=doctors[1]
+        ))
+        return added
+
+    def test_should_merge_overlay_writes_into_every_read(self, mapped, reference, doctors, patients):
+        added = self._apply(mapped, doctors, patients)
+        assert self._apply(reference, doctors, patients).id == added.id == 41
+
+        assert mapped.find_by_id(11) is None
+        assert mapped.find_by_id(12).time == time(17, 30)
+        key = lambda apt: apt.id
+        for filters in ({}, {'doctor_id': 1}, {'status': AppointmentStatus.CANCELLED}, {'patient_id': 1}):
+            assert sorted(mapped.find_all(**filters), key=key) == sorted(reference.find_all(**filters), key=key)
+            pages, after_key = [], None
+            while True:
+                page = mapped.find_page(after_key, 3, **filters)
+                pages.extend(apt.id for apt in page.items)
+                after_key = page.next_key
+                if after_key is None:
+                    break
+            assert pages == [apt.id for apt in reference.find_page(None, 100, **filters).items]
+        end = START + timedelta(days=7)
+        assert mapped.get_occupancy_grid([1, 2], START, end) == reference.get_occupancy_grid([1, 2], START, end)
+        assert [apt.id for apt in mapped.iter_all()] == [apt.id for apt in reference.iter_all()]
+
+    def test_should_check_conflicts_against_the_mapped_file(self, mapped, reference):
+        taken = reference.find_all(status=AppointmentStatus.SCHEDULED)[0]
+        clash = Appointment.restore(
+            None, date=taken.date, time=taken.time, status=AppointmentStatus.SCHEDULED,
+            patient=taken.patient, doctor=taken.doctor
+        )
+
+        with pytest.raises(ValueError, match="El doctor no está disponible"):
+            mapped.reserve_slot(clash)
+        assert mapped.reserve_many([clash]) == [
+            "El doctor no está disponible en el horario solicitado (debe haber al menos 30 minutos entre citas)"
+        ]
+        assert not mapped.modified
+
+    def test_should_not_walk_every_dirty_day_on_each_lookup(self, doctors, patients, monkeypatch):
+        patient_repo, doctor_repo = InMemoryPatientRepository(), InMemoryDoctorRepository()
+        patient_repo.bulk_load(patients)
+        doctor_repo.bulk_load(doctors)
+        store = ArrayAppointmentStore(patient_repo, doctor_repo)
+        store.bulk_load(
+            Appointment.restore(
+                index, date=START + timedelta(days=index // 2), time=time(10, 0),
+                status=AppointmentStatus.SCHEDULED, patient=patients[index % 4], doctor=doctors[index % 2]
+            )
+            for index in range(1, 4001)
+        )
+        repo = MappedAppointmentRepository(store)
+        for appointment_id in range(1, 4001):
+            repo.delete(appointment_id)
+
+        class Unwalkable(set):
+            def __iter__(self):
+                raise AssertionError("la consulta de un día no debe recorrer todos los días sucios")
+
+        repo._dirty_days = {doctor_id: Unwalkable(days) for doctor_id, days in repo._dirty_days.items()}
+        recomputed = []
+        store_occupancy = repo._store_occupancy
+        monkeypatch.setattr(repo, "_store_occupancy", lambda *args: recomputed.append(args) or store_occupancy(*args))
+        day = START + timedelta(days=1000)
+
+        assert repo.get_occupancy_mask(1, day) == 0
+        assert repo.get_occupancy_masks(2, day, day + timedelta(days=6)) == {}
+        assert repo.find_available_slots(1, day)
+        assert len(recomputed) == 1 + 7 + 1
@@ -0,0 +1,84 @@
+import multiprocessing
+import os
+import stat
+import time as clock
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.infrastructure.persistence.shared.store import connect_store, serve, store_authkey
+
+AUTHKEY = b"test-store"
+
+class TestSharedStore:
+
+    @pytest.fixture
+    def address(self, tmp_path):
+        address = str(tmp_path / "store.sock")
+        process = multiprocessing.Process(target=serve, args=(address, AUTHKEY), daemon=True)
+        process.start()
+        deadline = clock.monotonic() + 10
+        while not os.path.exists(address):
+            assert clock.monotonic() < deadline, "el almacén no arrancó"
+            clock.sleep(0.01)
+        yield address
+        process.terminate()
+        process.join()
+
+    @pytest.fixture
+    def tomorrow(self):
+        return date.today() + timedelta(days=1)
+
+    def test_should_share_data_between_clients(self, address, tomorrow):
+        worker_a = connect_store(address, AUTHKEY)
+        worker_b = connect_store(address, AUTHKEY)
+        appointments, patients, doctors, _ = worker_a
+
+        doctor = Doctor(name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología")
+        doctors.save(doctor)
+        patient = patients.save(Patient(name="Juan Pérez", email=Email("juan@example.com"), birth_date=date(1990, 1, 1)))
+        appointment = Appointment(
+            date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED,
+            patient=patient, doctor=doctor
+        )
+        appointments.reserve_slot(appointment)
+
+        assert doctor.id == 1 and appointment.id == 1
+        other_appointments, _, other_doctors, _ = worker_b
+        assert other_doctors.find_by_id(doctor.id).name == "Dr. Carlos García"
+        assert other_appointments.get_occupancy_mask(doctor.id, tomorrow) == 1 << 2
+        assert [a.id for a in other_appointments.iter_all()] == [appointment.id]
+
+    def test_should_reject_double_booking_from_another_client(self, address, tomorrow):
+        appointments, patients, doctors, _ = connect_store(address, AUTHKEY)
+        other_appointments = connect_store(address, AUTHKEY)[0]
+        doctor = doctors.save(Doctor(name="Dr. Carlos García", email=Email("dr.garcia@example.com"), specialty="Cardiología"))
+        first, second = (
+            patients.save(Patient(name=name, email=Email(f"{name.lower()}@example.com"), birth_date=date(1990, 1, 1)))
+            for name in ("Juan", "Ana")
+        )
+
+        appointments.reserve_slot(Appointment(
+            date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED, patient=first, doctor=doctor
+        ))
+
+        with pytest.raises(ValueError, match="no está disponible"):
+            other_appointments.reserve_slot(Appointment(
+                date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED, patient=second, doctor=doctor
+            ))
+
+    def test_should_generate_a_private_key_next_to_the_socket(self, tmp_path):
+        address = str(tmp_path / "store.sock")
+        with pytest.raises(RuntimeError, match="STORE_AUTHKEY"):
+            store_authkey(address)
+
+        created = store_authkey(address, create=True)
+
+        assert len(created) == 64
+        assert stat.S_IMODE(os.stat(address + ".key").st_mode) == 0o600
+        assert store_authkey(address) == created
+        assert store_authkey(address, create=True) != created
+        assert store_authkey(address, "definida") == b"definida"
@@ -0,0 +1,319 @@
+import sqlite3
+import pytest
+from datetime import date, time, timedelta
+from medical_system.domain.entities.appointment import Appointment
+from medical_system.domain.entities.doctor import Doctor
+from medical_system.domain.entities.patient import Patient
+from medical_system.domain.value_objects.email import Email
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.domain.value_objects.schedule_template import DaySchedule, ScheduleTemplate
+from medical_system.infrastructure.persistence.sqlite.database import SqliteDatabase
+from medical_system.infrastructure.persistence.sqlite.sqlite_appointment_repository import (
+    _MOVE_OCCUPANCY,
+    _OCCUPANCY,
+    _SELECT,
+    SqliteAppointmentRepository
+)
+from medical_system.infrastructure.persistence.sqlite.sqlite_doctor_repository import SqliteDoctorRepository
+from medical_system.infrastructure.persistence.sqlite.sqlite_patient_repository import SqlitePatientRepository
+
+class TestSqliteAppointmentRepository:
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        database = SqliteDatabase(str(tmp_path / "citas.db"))
+        yield database
+        database.close()
+
+    @pytest.fixture
+    def repo(self, database):
+        return SqliteAppointmentRepository(database)
+
+    @pytest.fixture
+    def patient(self, database):
+        patient = Patient(
+            name="Juan Pérez",
+            email=Email("juan@example.com"),
+            birth_date=date(1990, 1, 1)
+        )
+        return SqlitePatientRepository(database).save(patient)
+
+    @pytest.fixture
+    def doctor(self, database):
+        doctor = Doctor(
+            name="Dr. Carlos García",
+            email=Email("dr.garcia@example.com"),
+            specialty="Cardiología"
+        )
+        return SqliteDoctorRepository(database).save(doctor)
+
+    @pytest.fixture
+    def tomorrow(self):
+        return date.today() + timedelta(days=1)
+
+    @pytest.fixture
+    def appointment(self, repo, patient, doctor, tomorrow):
+        return repo.save(Appointment(
+            date=tomorrow,
+            time=time(10, 0),
+            status=AppointmentStatus.SCHEDULED,
+            patient=patient,
+            doctor=doctor
+        ))
+
+    def test_should_use_wal_journal_mode(self, database):
+        mode = database.query("PRAGMA journal_mode")[0][0]
+
+        assert mode == "wal"
+
+    def test_should_assign_id_and_find_by_id(self, repo, appointment):
+        found = repo.find_by_id(appointment.id)
+
+        assert appointment.id is not None
+        assert found == appointment
+        assert found.patient.name == "Juan Pérez"
+        assert found.doctor.specialty == "Cardiología"
+        assert found.status == AppointmentStatus.SCHEDULED
+
+    def test_should_find_by_doctor_patient_and_time(self, repo, appointment, patient, doctor, tomorrow):
+        assert repo.find_by_doctor_and_date(doctor.id, tomorrow) == [appointment]
+        assert repo.find_by_patient_and_date(patient.id, tomorrow) == [appointment]
+        assert repo.find_patient_appointments_at_same_time(patient.id, tomorrow, time(10, 0)) == [appointment]
+        assert repo.find_by_doctor_patient_datetime(doctor.id, patient.id, tomorrow, time(10, 0)) == appointment
+        assert repo.find_by_doctor_and_date(doctor.id, tomorrow + timedelta(days=1)) == []
+
+    def test_should_persist_status_change_on_save(self, repo, appointment):
+        appointment.cancel()
+        repo.save(appointment)
+
+        assert repo.find_by_id(appointment.id).status == AppointmentStatus.CANCELLED
+        assert repo.find_all(status=AppointmentStatus.CANCELLED) == [appointment]
+
+    def test_should_restore_past_appointments(self, repo, database, appointment):
+        database.query(
+            "UPDATE appointments SET date = ? WHERE id = ?",
+            ((date.today() - timedelta(days=30)).isoformat(), appointment.id)
+        )
+
+        assert repo.find_by_id(appointment.id).date < date.today()
+
+    def test_should_delete_appointment(self, repo, appointment):
+        repo.delete(appointment.id)
+
+        assert repo.find_by_id(appointment.id) is None
+
+    def test_should_return_occupancy_of_busy_days_in_range(self, repo, appointment, doctor, tomorrow):
+        masks = repo.get_occupancy_masks(doctor.id, tomorrow - timedelta(days=1), tomorrow + timedelta(days=6))
+
+        assert masks == {tomorrow: repo.get_occupancy_mask(doctor.id, tomorrow)}
+        assert repo.get_occupancy_masks(doctor.id, tomorrow + timedelta(days=1), tomorrow + timedelta(days=6)) == {}
+
+    def test_should_return_occupancy_grid_for_several_doctors(self, repo, database, appointment, doctor, tomorrow):
+        other = SqliteDoctorRepository(database).save(Doctor(
+            name="Dra. Ana López", email=Email("ana@example.com"), specialty="Pediatría"
+        ))
+
+        grid = repo.get_occupancy_grid([doctor.id, other.id], tomorrow, tomorrow + timedelta(days=6))
+
+        assert grid == {(doctor.id, tomorrow): 1 << 4}
+        assert repo.get_occupancy_grid([other.id], tomorrow, tomorrow) == {}
+
+    def test_should_add_schedule_column_and_persist_template(self, tmp_path):
+        path = str(tmp_path / "antigua.db")
+        legacy = sqlite3.connect(path)
+        legacy.execute(
+            "CREATE TABLE doctors (id INTEGER PRIMARY KEY, name TEXT NOT NULL, email TEXT NOT NULL, "
+            "email_key TEXT NOT NULL UNIQUE, specialty TEXT NOT NULL, specialty_key TEXT NOT NULL)"
+        )
+        legacy.close()
+        database = SqliteDatabase(path)
+        repo = SqliteDoctorRepository(database)
+        schedule = ScheduleTemplate(weekly=(DaySchedule(time(8, 0), time(12, 0)),) + (None,) * 6)
+
+        doctor = repo.save(Doctor(
+            name="Dra. Ana López", email=Email("ana@example.com"), specialty="Pediatría", schedule=schedule
+        ))
+        found = repo.find_by_id(doctor.id)
+        database.close()
+
+        assert found.schedule == schedule
+        assert found.schedule_template.day_mask(date(2030, 1, 7)) == schedule.day_mask(date(2030, 1, 7))
+
+    def test_should_load_the_doctor_schedule_with_each_appointment(self, repo, database, patient, tomorrow):
+        saturdays = ScheduleTemplate(weekly=(None,) * 5 + (DaySchedule(time(8, 0), time(12, 0)), None))
+        doctor = SqliteDoctorRepository(database).save(Doctor(
+            name="Dra. Ana López", email=Email("ana@example.com"), specialty="Pediatría", schedule=saturdays
+        ))
+        saturday = tomorrow + timedelta(days=(5 - tomorrow.weekday()) % 7)
+        appointment = repo.save(Appointment(
+            date=saturday, time=time(8, 30), status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor
+        ))
+
+        found = repo.find_by_id(appointment.id)
+
+        assert found.doctor.schedule == saturdays
+        assert found.doctor.accepts(saturday, time(8, 30), 30)
+        assert repo.find_by_patient(patient.id)[0].doctor.schedule == saturdays
+
+    @pytest.mark.parametrize("sql, params", [
+        (_OCCUPANCY, (1, "2030-01-01", "Cancelada")),
+        (_MOVE_OCCUPANCY, (1, "2030-01-01", "Cancelada", 1)),
+        (_SELECT + "WHERE a.doctor_id = ? AND a.date = ?", (1, "2030-01-01")),
+        (_SELECT + "WHERE a.patient_id = ? AND a.date = ?", (1, "2030-01-01")),
+        (_SELECT + "WHERE a.patient_id = ? AND a.date = ? AND a.time = ?", (1, "2030-01-01", "10:00:00")),
+    ])
+    def test_should_serve_finders_with_covering_index(self, database, sql, params):
+        plan = database.query("EXPLAIN QUERY PLAN " + sql, params)
+        # Solo importa el acceso a appointments; pacientes y doctores van por rowid.
+        appointments = [row["detail"] for row in plan if row["detail"].split()[1] in ("a", "appointments")]
+
+        assert len(appointments) == 1
+        assert "USING COVERING INDEX" in appointments[0]
+
+    @pytest.mark.parametrize("filters", [
+        {}, {'status': AppointmentStatus.SCHEDULED}, {'doctor_id': 1}, {'patient_id': 1}
+    ])
+    def test_should_page_in_index_order(self, database, filters):
+        sql, params = SqliteAppointmentRepository._page_query((date(2030, 1, 1), time(9, 0), 5), 20, filters)
+        plan = database.query("EXPLAIN QUERY PLAN " + sql, params)
+        details = " ".join(row["detail"] for row in plan)
+
+        assert "TEMP B-TREE" not in details
+
+    def test_should_drop_replaced_indexes(self, tmp_path):
+        path = str(tmp_path / "antigua.db")
+        SqliteDatabase(path).close()
+        legacy = sqlite3.connect(path)
+        legacy.execute("CREATE INDEX ix_appointments_date_time ON appointments (date, time, doctor_id, patient_id, status)")
+        legacy.execute("CREATE INDEX ix_appointments_doctor_date ON appointments (doctor_id, date, time, patient_id, status)")
+        legacy.execute("CREATE INDEX ix_appointments_patient_date ON appointments (patient_id, date, time, doctor_id, status)")
+        legacy.close()
+
+        database = SqliteDatabase(path)
+        names = {row["name"] for row in database.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        database.close()
+
+        assert {"ix_appointments_page", "ix_appointments_doctor_day", "ix_appointments_patient_day"} <= names
+        assert not names & {"ix_appointments_date_time", "ix_appointments_doctor_date", "ix_appointments_patient_date"}
+
+    def test_should_reserve_many_in_one_transaction(self, repo, database, patient, doctor, tomorrow):
+        other = SqlitePatientRepository(database).save(Patient(
+            name="Ana López", email=Email("ana@example.com"), birth_date=date(1985, 5, 5)
+        ))
+        statements = []
+        database.connection.set_trace_callback(statements.append)
+
+        results = repo.reserve_many([
+            Appointment(date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor),
+            Appointment(date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED, patient=other, doctor=doctor),
+            Appointment(date=tomorrow, time=time(12, 0), status=AppointmentStatus.SCHEDULED, patient=patient, doctor=doctor),
+            Appointment(date=tomorrow, time=time(10, 0), status=AppointmentStatus.SCHEDULED, patient=other, doctor=doctor),
+        ])
+        database.connection.set_trace_callback(None)
+
+        assert [isinstance(result, Appointment) for result in results] == [True, False, False, True]
+        assert results[2] == "Solo puedes tener una cita por día"
+        assert statements.count("COMMIT") == 1
+        assert [apt.id for apt in repo.find_by_doctor_and_date(doctor.id, tomorrow)] == [results[0].id, results[3].id]
+
+    def test_should_reject_unknown_filters(self, repo, appointment):
+        with pytest.raises(ValueError, match="Filtro no soportado: specialty"):
+            repo.find_all(specialty="Cardiología")
+        with pytest.raises(ValueError, match="Filtro no soportado"):
+            repo.find_page(None, 10, pacient_id=1)
+
+    def test_should_iterate_all_appointments_in_batches(self, repo, patient, doctor, tomorrow, monkeypatch):
+        monkeypatch.setattr(SqliteAppointmentRepository, "ITER_BATCH_SIZE", 2)
+        saved = [
+            repo.save(Appointment(
+                date=tomorrow,
+                time=time(hour, 0),
+                status=AppointmentStatus.SCHEDULED,
+                patient=patient,
+                doctor=doctor
+            ))
+            for hour in (9, 10, 11, 12, 13)
+        ]
+
+        assert [apt.id for apt in repo.iter_all()] == [apt.id for apt in saved]
+
+    def test_should_page_by_date_time_and_id(self, repo, patient, doctor, tomorrow):
+        saved = [
+            repo.save(Appointment(
+                date=tomorrow,
+                time=at,
+                status=AppointmentStatus.SCHEDULED,
+                patient=patient,
+                doctor=doctor
+            ))
+            for at in (time(15, 0), time(9, 0), time(11, 30))
+        ]
+
+        first = repo.find_page(None, 2, doctor_id=doctor.id)
+        second = repo.find_page(first.next_key, 2, doctor_id=doctor.id)
+
+        assert [a.time for a in first.items] == [time(9, 0), time(11, 30)]
+        assert first.next_key == (tomorrow, time(11, 30), saved[2].id)
+        assert [a.id for a in second.items] == [saved[0].id]
+        assert second.next_key is None
+
+    def test_should_reserve_free_slot_and_reject_taken_one(self, repo, database, appointment, doctor, tomorrow):
+        other = SqlitePatientRepository(database).save(Patient(
+            name="Ana López",
+            email=Email("ana@example.com"),
+            birth_date=date(1985, 5, 5)
+        ))
+
+        with pytest.raises(ValueError, match="no está disponible"):
+            repo.reserve_slot(Appointment(
+                date=tomorrow, time=time(10, 0), status=AppointmentStatus.SCHEDULED,
+                patient=other, doctor=doctor
+            ))
+        reserved = repo.reserve_slot(Appointment(
+            date=tomorrow, time=time(10, 30), status=AppointmentStatus.SCHEDULED,
+            patient=other, doctor=doctor
+        ))
+
+        assert reserved.id is not None
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == (1 << 4) | (1 << 5)
+
+    def test_should_persist_duration_and_block_every_covered_slot(self, repo, database, appointment, doctor, tomorrow):
+        other = SqlitePatientRepository(database).save(Patient(
+            name="Ana López",
+            email=Email("ana@example.com"),
+            birth_date=date(1985, 5, 5)
+        ))
+
+        with pytest.raises(ValueError, match="no está disponible"):
+            repo.reserve_slot(Appointment(
+                date=tomorrow, time=time(9, 0), status=AppointmentStatus.SCHEDULED,
+                patient=other, doctor=doctor, duration_minutes=90
+            ))
+        reserved = repo.reserve_slot(Appointment(
+            date=tomorrow, time=time(10, 30), status=AppointmentStatus.SCHEDULED,
+            patient=other, doctor=doctor, duration_minutes=60
+        ))
+
+        assert repo.find_by_id(reserved.id).duration_minutes == 60
+        assert repo.find_by_id(appointment.id).duration_minutes == 30
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == 0b111 << 4
+
+    def test_should_move_appointment_and_bump_version(self, repo, database, appointment, doctor, tomorrow):
+        other = SqlitePatientRepository(database).save(Patient(
+            name="Ana López",
+            email=Email("ana@example.com"),
+            birth_date=date(1985, 5, 5)
+        ))
+        repo.reserve_slot(Appointment(
+            date=tomorrow, time=time(12, 0), status=AppointmentStatus.SCHEDULED,
+            patient=other, doctor=doctor
+        ))
+
+        with pytest.raises(ValueError, match="no está disponible"):
+            repo.move(appointment.id, tomorrow, time(12, 0))
+        moved = repo.move(appointment.id, tomorrow, time(10, 30))
+
+        assert (moved.time, moved.version) == (time(10, 30), 2)
+        assert repo.get_occupancy_mask(doctor.id, tomorrow) == (1 << 5) | (1 << 8)
+        with pytest.raises(ValueError, match="Appointment not found"):
+            repo.move(999, tomorrow, time(9, 0))
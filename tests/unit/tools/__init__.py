@@ -0,0 +1 @@
+"""Pruebas unitarias para las herramientas de línea de comandos."""
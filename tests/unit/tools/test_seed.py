@@ -0,0 +1,63 @@
+import pytest
+from datetime import date
+from medical_system.domain.value_objects.reservation_status import AppointmentStatus
+from medical_system.infrastructure.persistence.in_memory.in_memory_appointment_repository import InMemoryAppointmentRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_doctor_repository import InMemoryDoctorRepository
+from medical_system.infrastructure.persistence.in_memory.in_memory_patient_repository import InMemoryPatientRepository
+from medical_system.infrastructure.persistence.snapshot import load_snapshot, write_snapshot
+from medical_system.tools.seed import generate
+
+class TestSeedGenerator:
+
+    @pytest.fixture
+    def snapshot(self):
+        return generate(doctors=5, specialties=3, patients=60, appointments=500, seed=7)
+
+    def test_should_be_reproducible_for_the_same_seed(self, snapshot):
+        again = generate(doctors=5, specialties=3, patients=60, appointments=500, seed=7)
+
+        assert [(a.date, a.time, a.doctor.id, a.patient.id) for a in again.appointments] == \
+            [(a.date, a.time, a.doctor.id, a.patient.id) for a in snapshot.appointments]
+
+    def test_should_follow_booking_rules(self, snapshot):
+        doctor_slots = {(a.doctor.id, a.date, a.time) for a in snapshot.appointments}
+        patient_days = {(a.patient.id, a.date) for a in snapshot.appointments}
+
+        assert len(snapshot.appointments) == 500
+        assert len(doctor_slots) == 500
+        assert len(patient_days) == 500
+        assert all(a.date > date.today() and a.date.weekday() < 5 for a in snapshot.appointments)
+        assert {d.specialty for d in snapshot.doctors} == {"Cardiología", "Dermatología", "Pediatría"}
+
+    def test_should_bulk_load_the_same_indexes_as_save(self, snapshot):
+        bulk = InMemoryAppointmentRepository()
+        bulk.bulk_load(snapshot.appointments)
+        saved = InMemoryAppointmentRepository()
+        for appointment in snapshot.appointments:
+            saved.save(appointment)
+
+        first = snapshot.appointments[0]
+        assert bulk.find_by_doctor_and_date(first.doctor.id, first.date) == \
+            saved.find_by_doctor_and_date(first.doctor.id, first.date)
+        assert bulk.get_occupancy_mask(first.doctor.id, first.date) == \
+            saved.get_occupancy_mask(first.doctor.id, first.date)
+        assert bulk.find_all(status=AppointmentStatus.CANCELLED) == saved.find_all(status=AppointmentStatus.CANCELLED)
+        assert bulk.find_page(None, 50).items == saved.find_page(None, 50).items
+
+    def test_should_round_trip_through_a_snapshot(self, snapshot, tmp_path):
+        path = str(tmp_path / "seed.json.gz")
+        write_snapshot(path, snapshot.doctors, snapshot.patients, snapshot.appointments)
+        appointments = InMemoryAppointmentRepository()
+        patients = InMemoryPatientRepository()
+        doctors = InMemoryDoctorRepository()
+
+        load_snapshot(path, appointments, patients, doctors)
+
+        original = snapshot.appointments[-1]
+        restored = appointments.find_by_id(original.id)
+        assert (restored.date, restored.time, restored.status) == (original.date, original.time, original.status)
+        assert restored.patient is patients.find_by_id(original.patient.id)
+        assert len(doctors.find_all()) == 5
+        assert patients.find_by_email(str(original.patient.email)) is not None
+        assert appointments.save(restored).id == original.id
+        assert appointments.find_page(None, 1000).next_key is None
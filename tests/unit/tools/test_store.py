@@ -0,0 +1,14 @@
+import pytest
+from medical_system.tools import store
+
+class TestStoreTool:
+
+    def test_should_not_remove_a_path_that_is_not_a_socket(self, tmp_path, monkeypatch):
+        path = tmp_path / "datos.db"
+        path.write_text("no borrar")
+        monkeypatch.setattr(store, "serve", lambda *args, **kwargs: pytest.fail("no debería arrancar"))
+
+        with pytest.raises(SystemExit):
+            store.main(["--socket", str(path)])
+
+        assert path.read_text() == "no borrar"